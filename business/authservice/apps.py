@@ -6,3 +6,6 @@ class CredentialSecurityConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'authservice'
     verbose_name = 'Authentication Service'
+
+    def ready(self):
+        import authservice.signals.user_cache
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+def discard_encrypted_otps(apps, schema_editor):
+    # Encrypted codes cannot be converted to digests; they expire within minutes anyway
+    apps.get_model('authservice', 'OTP').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authservice', '0004_rename__otp_otp_encrypted_otp'),
+    ]
+
+    operations = [
+        migrations.RunPython(discard_encrypted_otps, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='otp',
+            name='otp_user_id_246a31_idx',
+        ),
+        migrations.RemoveField(
+            model_name='otp',
+            name='encrypted_otp',
+        ),
+        migrations.AddField(
+            model_name='otp',
+            name='digest',
+            field=models.CharField(default='', max_length=64),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(fields=['user', 'digest', 'is_used', 'expires_at'], name='otp_user_digest_idx'),
+        ),
+    ]
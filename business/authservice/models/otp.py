@@ -6,31 +6,24 @@ from django.contrib.auth import get_user_model
 from django.db import models
 from django.utils import timezone
 
-# Project-Specific Libraries
-from common import EncryptedFieldsMixin
-
 User = get_user_model()
 
 
-class OTP(EncryptedFieldsMixin, models.Model):
+class OTP(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, unique=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='otps')
-    encrypted_otp = models.BinaryField(null=True, blank=True)
+    # Keyed HMAC of the code (see OTPManager.digest); the code itself is never stored
+    digest = models.CharField(max_length=64)
     is_used = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
 
-    # Encrypted fields
-    encrypted_fields = [
-        'otp',
-    ]
-
     class Meta:
         db_table = 'otp'
         verbose_name = 'One-Time Password'
         verbose_name_plural = 'One-Time Passwords'
         indexes = [
-            models.Index(fields=['user', 'expires_at', 'is_used']),
+            models.Index(fields=['user', 'digest', 'is_used', 'expires_at'], name='otp_user_digest_idx'),
         ]
         ordering = ['-expires_at']
 
@@ -38,4 +31,4 @@ class OTP(EncryptedFieldsMixin, models.Model):
         return timezone.now() > self.expires_at
 
     def __str__(self):
-        return f"OTP({self.otp}) for {self.user} expires at {self.expires_at}"
+        return f"OTP for {self.user} expires at {self.expires_at}"
@@ -1,5 +1,6 @@
 from .tasks import (
     cleanup_expired_otps,
+    cleanup_expired_tokens,
     dispatch_sms_verification_otp_task,
     dispatch_email_verification_otp_task,
     dispatch_password_reset_email_task,
@@ -10,6 +11,7 @@ from .tasks import (
 
 __all__ = [
     "cleanup_expired_otps",
+    "cleanup_expired_tokens",
     "dispatch_sms_verification_otp_task",
     "dispatch_email_verification_otp_task",
     "dispatch_password_reset_email_task",
@@ -2,9 +2,9 @@
 from django.conf import settings
 from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
-from twilio.rest import Client
 
 # Project-specific imports
+from common import sms_gateway
 from userservice.models import User
 from authservice.utils import OTP_EXPIRATION_MINUTES
 
@@ -13,13 +13,10 @@ class OTPNotification:
     @staticmethod
     def send_sms(self, otp, phone_number):
         """Send OTP via SMS."""
-        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
-        message = client.messages.create(
-            from_=settings.TWILIO_SMS_FROM,
-            body=f"Your OTP is {otp}. It will expire in {OTP_EXPIRATION_MINUTES} minutes.",
-            to=f"{phone_number}"
+        return sms_gateway.send(
+            phone_number,
+            f"Your OTP is {otp}. It will expire in {OTP_EXPIRATION_MINUTES} minutes.",
         )
-        return message.sid
 
 
     @staticmethod
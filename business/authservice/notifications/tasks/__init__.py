@@ -1,4 +1,5 @@
 from .otp_cleanup import cleanup_expired_otps
+from .token_cleanup import cleanup_expired_tokens
 from .otp_tasks import (
     dispatch_sms_verification_otp_task,
     dispatch_email_verification_otp_task,
@@ -16,6 +17,7 @@ from .wallet_tasks import (
 
 __all__ = [
     "cleanup_expired_otps",
+    "cleanup_expired_tokens",
     "dispatch_sms_verification_otp_task",
     "dispatch_email_verification_otp_task",
     "dispatch_password_reset_email_task",
@@ -1,12 +1,14 @@
 # authservice/tasks.py
 
 from celery import shared_task
+from django.db.models import Q
 from django.utils import timezone
 from authservice.models import OTP
+from common import purge_queryset
 
 @shared_task
 def cleanup_expired_otps():
-    """Delete all expired OTPs."""
+    """Delete used and expired OTPs in bounded chunks."""
     now = timezone.now()
-    deleted_count, _ = OTP.objects.filter(expires_at__lt=now).delete()
+    deleted_count = purge_queryset(OTP.objects.filter(Q(expires_at__lt=now) | Q(is_used=True)))
     return f"Deleted {deleted_count} expired OTP(s)."
@@ -0,0 +1,13 @@
+from celery import shared_task
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from common import purge_queryset
+
+@shared_task
+def cleanup_expired_tokens():
+    """
+    Delete expired refresh tokens in bounded chunks. Their blacklist entries cascade with them;
+    an expired token is rejected on expiry alone, so the blacklist row is no longer needed.
+    """
+    deleted_count = purge_queryset(OutstandingToken.objects.filter(expires_at__lt=timezone.now()))
+    return f"Deleted {deleted_count} expired token(s)."
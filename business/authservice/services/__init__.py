@@ -1,7 +1,16 @@
+from .authentication import CachedUserJWTAuthentication, invalidate_cached_user, load_cached_user
 from .otp_manager import OTPManager, token_generator
+from .revocation import BloomFilter, FilteredRefreshToken, RevokedTokenFilter, revoked_tokens
 
 
 __all__ = [
+    "BloomFilter",
+    "CachedUserJWTAuthentication",
+    "FilteredRefreshToken",
     "OTPManager",
+    "RevokedTokenFilter",
+    "invalidate_cached_user",
+    "load_cached_user",
+    "revoked_tokens",
     "token_generator",
 ]
@@ -0,0 +1,87 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from authservice.utils import (
+    USER_CACHE_FIELDS,
+    USER_CACHE_GENERATION_PREFIX,
+    USER_CACHE_KEY_PREFIX,
+    USER_CACHE_TIMEOUT,
+)
+
+User = get_user_model()
+
+
+def _keys(user_id):
+    return f"{USER_CACHE_KEY_PREFIX}{user_id}", f"{USER_CACHE_GENERATION_PREFIX}{user_id}"
+
+
+def invalidate_cached_user(user_id):
+    """Move a user to a new generation so every process reloads them on the next request."""
+    _, generation_key = _keys(user_id)
+    cache.set(generation_key, time.time_ns(), None)
+
+
+def load_cached_user(user_id):
+    """
+    Return a User built from the cached USER_CACHE_FIELDS, or None if the user does not exist.
+
+    The entry and the user's generation are fetched in one round trip; an entry stamped with
+    an older generation is ignored. Fields outside USER_CACHE_FIELDS (password, last_login, ...)
+    are deferred and load from the database only if a view touches them.
+    """
+    data_key, generation_key = _keys(user_id)
+    cached = cache.get_many([data_key, generation_key])
+    generation = cached.get(generation_key)
+    entry = cached.get(data_key)
+
+    if entry is None or generation is None or entry[0] != generation:
+        if generation is None:
+            generation = time.time_ns()
+            cache.add(generation_key, generation, None)
+        row = User.objects.filter(
+            **{api_settings.USER_ID_FIELD: user_id}
+        ).values_list(*USER_CACHE_FIELDS).first()
+        if row is None:
+            return None
+        entry = (generation, row)
+        cache.set(data_key, entry, USER_CACHE_TIMEOUT)
+
+    values = dict(zip(USER_CACHE_FIELDS, entry[1]))
+    attnames = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+    return User.from_db(User.objects.db, attnames, [values[name] for name in attnames])
+
+
+class CachedUserJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the user from a short-lived, generation-versioned cache
+    instead of a query per request. Saving or deleting a user bumps their generation
+    (see authservice.signals), and entries expire after USER_CACHE_TIMEOUT seconds to bound
+    staleness for changes made with QuerySet.update().
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = load_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if getattr(api_settings, 'CHECK_REVOKE_TOKEN', False):
+            # The revoke claim hashes the password, which is deliberately never cached
+            from rest_framework_simplejwt.utils import get_md5_hash_password
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
@@ -1,9 +1,11 @@
-import random
+import hashlib
+import hmac
+import secrets
 
+from django.conf import settings
 from django.utils.timezone import now, timedelta
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 
-from userservice import models as user_models
 from authservice import models
 from authservice.utils import OTP_EXPIRATION_MINUTES
 
@@ -12,27 +14,35 @@ token_generator = PasswordResetTokenGenerator()
 
 
 class OTPManager:
+    @staticmethod
+    def digest(user_id, otp):
+        """
+        Keyed HMAC-SHA256 of a code, bound to the user so equal codes never share a digest.
+        OTP_HMAC_KEY falls back to SECRET_KEY.
+        """
+        key = getattr(settings, 'OTP_HMAC_KEY', None) or settings.SECRET_KEY
+        message = f"{user_id}:{otp}".encode()
+        return hmac.new(key.encode(), message, hashlib.sha256).hexdigest()
+
     @staticmethod
     def generate_otp(user_id):
-        user = user_models.User.objects.get(id=user_id)
-        otp = f"{random.randint(100000, 999999)}"
+        otp = f"{secrets.randbelow(900000) + 100000}"
         expires_at = now() + timedelta(minutes=OTP_EXPIRATION_MINUTES)
-        models.OTP.objects.create(user=user, otp=otp, expires_at=expires_at)
+        models.OTP.objects.create(user_id=user_id, digest=OTPManager.digest(user_id, otp), expires_at=expires_at)
         return otp
 
     @staticmethod
     def validate_otp(user_id, otp):
-        otp_qs = models.OTP.objects.filter(
-            user=user_id,
+        """
+        Consume a code with one conditional UPDATE over the (user, digest, is_used, expires_at) index.
+        Only the request whose UPDATE flips is_used sees a row count, so concurrent attempts cannot both succeed.
+        """
+        if not otp:
+            return False
+
+        return models.OTP.objects.filter(
+            user_id=user_id,
+            digest=OTPManager.digest(user_id, str(otp)),
             is_used=False,
             expires_at__gt=now(),
-        )
-
-        for otp_instance in otp_qs:
-            if otp_instance.otp == otp:
-                otp_instance.is_used = True
-                otp_instance.save()
-                return True
-
-        return False
-
+        ).update(is_used=True) > 0
@@ -0,0 +1,128 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authservice.utils import (
+    REVOKED_TOKEN_FILTER_ERROR_RATE,
+    REVOKED_TOKEN_FILTER_REFRESH,
+    REVOKED_TOKEN_MARKER_PREFIX,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings. No false negatives; false positives at about error_rate."""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(int(capacity), 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevokedTokenFilter:
+    """
+    In-process Bloom filter of blacklisted refresh token JTIs, so the blacklist table is only
+    queried for tokens that may actually be revoked.
+
+    The filter is rebuilt from unexpired BlacklistedToken rows every REVOKED_TOKEN_FILTER_REFRESH
+    seconds on a background thread. Tokens blacklisted since the last rebuild are covered by
+    a shared-cache marker that lives for two rebuild intervals, so a revocation made in another
+    process is honoured immediately. A filter that has gone stale for longer than that is
+    not trusted, and checks fall back to the database.
+    """
+
+    def __init__(self):
+        self._filter = None
+        self._built_at = 0.0
+        self._rebuilding = False
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti):
+        if cache.get(f"{REVOKED_TOKEN_MARKER_PREFIX}{jti}"):
+            return True
+
+        now = time.monotonic()
+        self._maybe_rebuild(now)
+
+        current = self._filter
+        if current is not None and now - self._built_at < REVOKED_TOKEN_FILTER_REFRESH * 2 and jti not in current:
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def add(self, jti):
+        cache.set(f"{REVOKED_TOKEN_MARKER_PREFIX}{jti}", True, REVOKED_TOKEN_FILTER_REFRESH * 2)
+        current = self._filter
+        if current is not None:
+            current.add(jti)
+
+    def rebuild(self):
+        """
+        Build a filter from the unexpired blacklist and swap it in.
+        Runs on its own short-lived thread, so it closes the connection that thread opened.
+        """
+        try:
+            started = time.monotonic()
+            blacklisted = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+            jtis = blacklisted.values_list('token__jti', flat=True)
+
+            bloom = BloomFilter(max(blacklisted.count(), 1000) * 2, REVOKED_TOKEN_FILTER_ERROR_RATE)
+            for jti in jtis.iterator(chunk_size=5000):
+                bloom.add(jti)
+
+            self._filter, self._built_at = bloom, started
+        except Exception as e:
+            logger.error(f"Failed to rebuild revoked token filter: {str(e)}", exc_info=True)
+        finally:
+            connection.close()
+            self._rebuilding = False
+
+    def _maybe_rebuild(self, now):
+        if self._filter is not None and now - self._built_at < REVOKED_TOKEN_FILTER_REFRESH:
+            return
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        threading.Thread(target=self.rebuild, daemon=True).start()
+
+
+revoked_tokens = RevokedTokenFilter()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist check goes through revoked_tokens."""
+
+    def check_blacklist(self):
+        if revoked_tokens.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        revoked_tokens.add(self.payload[api_settings.JTI_CLAIM])
+        return result
@@ -0,0 +1,20 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authservice.services.authentication import invalidate_cached_user
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, update_fields=None, **kwargs):
+    """Cached authentication data must follow every user change, deactivation included"""
+    # Token issue updates last_login only, which is not cached
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    # After commit, so a concurrent request cannot re-cache the pre-change row
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_cached_user(user_id))
@@ -1,5 +1,21 @@
-from .settings import OTP_EXPIRATION_MINUTES
+from .settings import (
+    OTP_EXPIRATION_MINUTES,
+    REVOKED_TOKEN_FILTER_ERROR_RATE,
+    REVOKED_TOKEN_FILTER_REFRESH,
+    REVOKED_TOKEN_MARKER_PREFIX,
+    USER_CACHE_FIELDS,
+    USER_CACHE_GENERATION_PREFIX,
+    USER_CACHE_KEY_PREFIX,
+    USER_CACHE_TIMEOUT,
+)
 
 __all__ = [
     "OTP_EXPIRATION_MINUTES",
-]
\ No newline at end of file
+    "REVOKED_TOKEN_FILTER_ERROR_RATE",
+    "REVOKED_TOKEN_FILTER_REFRESH",
+    "REVOKED_TOKEN_MARKER_PREFIX",
+    "USER_CACHE_FIELDS",
+    "USER_CACHE_GENERATION_PREFIX",
+    "USER_CACHE_KEY_PREFIX",
+    "USER_CACHE_TIMEOUT",
+]
@@ -1,3 +1,19 @@
 # settings.py
 
 OTP_EXPIRATION_MINUTES = 25 # in minutes
+
+# Cached-user JWT authentication (authservice.services.authentication)
+USER_CACHE_TIMEOUT = 60 # in seconds
+USER_CACHE_KEY_PREFIX = 'auth_user_'
+USER_CACHE_GENERATION_PREFIX = 'auth_user_gen_'
+USER_CACHE_FIELDS = (
+    'id', 'account_number', 'first_name', 'last_name', 'email', 'phone_number', 'country_code',
+    'biometric_auth_enabled', 'is_loan_qualified', 'verified_email', 'verified_phone_number',
+    'is_active', 'is_verified', 'is_deleted', 'is_staff', 'is_superuser', 'use_sms',
+    'use_digest',
+)
+
+# Revoked refresh token filter (authservice.services.revocation)
+REVOKED_TOKEN_FILTER_ERROR_RATE = 0.001
+REVOKED_TOKEN_FILTER_REFRESH = 300 # in seconds
+REVOKED_TOKEN_MARKER_PREFIX = 'revoked_jti_'
@@ -9,6 +9,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 # Project imports
+from common import AnonSlidingWindowThrottle, OTPRateThrottle
 from userservice.models import User
 from authservice.serializers import (
     RegisterVerificationSerializer,
@@ -51,6 +52,7 @@ def build_verification_status(user: User) -> dict:
 @extend_schema(tags=["Authentication - TOTP Verification"])
 class ActivateAccountWithOTPView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [AnonSlidingWindowThrottle, OTPRateThrottle]
     serializer_class = RegisterVerificationSerializer
 
     @extend_schema(
@@ -122,6 +124,7 @@ class ActivateAccountWithOTPView(APIView):
 @extend_schema(tags=["Authentication - TOTP Verification"])
 class ResendOTPVerificationView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [AnonSlidingWindowThrottle, OTPRateThrottle]
     serializer_class = ResendOTPSerializer
 
     @extend_schema(
@@ -12,6 +12,7 @@ from rest_framework.views import APIView
 from walletservice.models import DigitalWallet, Currency
 from userservice.models import User, Customer
 from rbac.models import UserRole, Role
+from rbac.services import RoleAssignmentService
 from authservice.serializers import RegisterSerializer
 from authservice.services import OTPManager
 from authservice.notifications import (
@@ -65,6 +66,8 @@ class RegisterUserView(APIView):
                 otp = OTPManager.generate_otp(user.id)
                 logger.info("Generated OTP for user %s", user.id)
 
+                RoleAssignmentService.assign_default_role(user)
+
                 # Assign default role
                 customer_role, _ = Role.objects.get_or_create(name="customer")
                 UserRole.objects.create(user=user, role=customer_role)
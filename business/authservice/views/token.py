@@ -1,17 +1,18 @@
 import logging
 
 # Django & DRF imports
+from django.conf import settings
 from django.db.models import Q
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 
 # Project imports
+from common import AnonSlidingWindowThrottle, LoginRateThrottle
 from userservice.models import User
 from userservice.services import CustomerProfileFormatter
 from authservice.serializers import (
@@ -19,7 +20,7 @@ from authservice.serializers import (
     RefreshTokenSerializer,
     RevokeTokenSerializer,
 )
-from authservice.services import OTPManager
+from authservice.services import FilteredRefreshToken, OTPManager
 from authservice.notifications import (
     dispatch_sms_verification_otp_task,
     dispatch_email_verification_otp_task,
@@ -33,6 +34,7 @@ logger = logging.getLogger(__name__)
 @extend_schema(tags=["Authentication - JWT Token"])
 class CreateAuthTokenView(TokenObtainPairView):
     serializer_class = CreateJWTSerializer
+    throttle_classes = [AnonSlidingWindowThrottle, LoginRateThrottle]
 
     @extend_schema(
         request=CreateJWTSerializer,
@@ -105,7 +107,7 @@ class CreateAuthTokenView(TokenObtainPairView):
             else:
                 dispatch_sms_verification_otp_task.delay(otp, user.phone_number)
 
-        refresh = RefreshToken.for_user(user)
+        refresh = FilteredRefreshToken.for_user(user)
         tokens = {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
@@ -139,18 +141,22 @@ class RefreshAuthTokenView(APIView):
         refresh_token = serializer.validated_data["refresh"]
 
         try:
-            refresh = RefreshToken(refresh_token)
+            refresh = FilteredRefreshToken(refresh_token)
             user = User.objects.get(id=refresh.payload.get("user_id"))
 
             new_tokens = {
-                "refresh": str(RefreshToken.for_user(user)),
+                "refresh": str(FilteredRefreshToken.for_user(user)),
                 "access": str(refresh.access_token),
             }
 
+            # The old refresh token is rotated out, so it cannot be replayed
+            if settings.SIMPLE_JWT.get("BLACKLIST_AFTER_ROTATION"):
+                refresh.blacklist()
+
             logger.info("Token refreshed for user %s", user.id)
             return Response(new_tokens, status=status.HTTP_200_OK)
 
-        except InvalidToken:
+        except (InvalidToken, TokenError):
             logger.error("Invalid refresh token.")
             return Response({"error": "Invalid refresh token."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -184,7 +190,7 @@ class LogoutAPIView(APIView):
 
         try:
             refresh_token = serializer.validated_data["refresh"]
-            RefreshToken(refresh_token).blacklist()
+            FilteredRefreshToken(refresh_token).blacklist()
 
             logger.info("User logged out.")
             return Response({"message": "Successfully logged out."}, status=status.HTTP_205_RESET_CONTENT)
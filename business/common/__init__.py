@@ -1,3 +1,15 @@
+from .cache import NamespacedCache, SQLiteCache, TieredCache, cache_metrics, cache_namespace
 from .encrypted_defaults import DefaultConfig
 from .encryption import EncryptedFieldsMixin
+from .mail import PooledEmailBackend, email_pool, send_email_map, send_emails
+from .purge import PurgeSettings, purge_queryset
 from .reference_generator import ReferenceGenerator
+from .sms import FakeSMSProvider, SMSGateway, sms_gateway
+from .throttling import (
+    AnonSlidingWindowThrottle,
+    LoginRateThrottle,
+    OTPRateThrottle,
+    PaymentRateThrottle,
+    SlidingWindowRateThrottle,
+    UserSlidingWindowThrottle,
+)
@@ -0,0 +1,390 @@
+import os
+import pickle
+import random
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+_MISSING = object()
+
+
+class SQLiteCache(BaseCache):
+    """
+    Cache backend shared by every process on one host through a SQLite file, a stand-in
+    for Redis in single-host deployments and test runs.
+
+    Unlike LocMem, gunicorn and Celery workers see each other's entries, and add() and
+    incr() are atomic across processes (integers are stored natively and incremented in
+    SQL), so throttles, generation counters and reference sequences behave as they do on
+    Redis. Expired rows are removed lazily; the table is culled to MAX_ENTRIES.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self.path = location
+        self._local = threading.local()
+
+    @property
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        # A forked worker must not share its parent's connection
+        if connection is None or self._local.pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache_entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)'
+            )
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    @contextmanager
+    def _transaction(self):
+        connection = self._connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    @staticmethod
+    def _encode(value):
+        # Integers stay native so incr() can run in SQL
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _decode(value):
+        return value if isinstance(value, int) else pickle.loads(value)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cursor = self._connection.execute(
+            'INSERT INTO cache_entries (key, value, expires) VALUES (?, ?, ?) '
+            'ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires = excluded.expires '
+            'WHERE cache_entries.expires IS NOT NULL AND cache_entries.expires <= ?',
+            (key, self._encode(value), self.get_backend_timeout(timeout), time.time()),
+        )
+        self._maybe_cull()
+        return cursor.rowcount == 1
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._connection.execute(
+            'SELECT value FROM cache_entries WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (key, time.time()),
+        ).fetchone()
+        return default if row is None else self._decode(row[0])
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._connection.execute(
+            'INSERT OR REPLACE INTO cache_entries (key, value, expires) VALUES (?, ?, ?)',
+            (key, self._encode(value), self.get_backend_timeout(timeout)),
+        )
+        self._maybe_cull()
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cursor = self._connection.execute(
+            'UPDATE cache_entries SET expires = ? WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (self.get_backend_timeout(timeout), key, time.time()),
+        )
+        return cursor.rowcount == 1
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._connection.execute('DELETE FROM cache_entries WHERE key = ?', (key,)).rowcount > 0
+
+    def has_key(self, key, version=None):
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._transaction() as connection:
+            row = connection.execute(
+                'UPDATE cache_entries SET value = value + ? '
+                'WHERE key = ? AND (expires IS NULL OR expires > ?) AND typeof(value) = \'integer\' '
+                'RETURNING value',
+                (delta, key, time.time()),
+            ).fetchone()
+        if row is None:
+            raise ValueError(f"Key '{key}' not found.")
+        return row[0]
+
+    def get_many(self, keys, version=None):
+        keys_by_backend = {self.make_and_validate_key(key, version=version): key for key in keys}
+        if not keys_by_backend:
+            return {}
+        placeholders = ','.join('?' * len(keys_by_backend))
+        rows = self._connection.execute(
+            f'SELECT key, value FROM cache_entries WHERE key IN ({placeholders}) AND (expires IS NULL OR expires > ?)',
+            (*keys_by_backend, time.time()),
+        ).fetchall()
+        return {keys_by_backend[key]: self._decode(value) for key, value in rows}
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        expires = self.get_backend_timeout(timeout)
+        rows = [
+            (self.make_and_validate_key(key, version=version), self._encode(value), expires)
+            for key, value in data.items()
+        ]
+        with self._transaction() as connection:
+            connection.executemany('INSERT OR REPLACE INTO cache_entries (key, value, expires) VALUES (?, ?, ?)', rows)
+        self._maybe_cull()
+        return []
+
+    def delete_many(self, keys, version=None):
+        rows = [(self.make_and_validate_key(key, version=version),) for key in keys]
+        with self._transaction() as connection:
+            connection.executemany('DELETE FROM cache_entries WHERE key = ?', rows)
+
+    def clear(self):
+        self._connection.execute('DELETE FROM cache_entries')
+
+    def _maybe_cull(self):
+        # Culling scans the table, so only about one write in a hundred pays for it
+        if random.random() > 0.01:
+            return
+        with self._transaction() as connection:
+            connection.execute('DELETE FROM cache_entries WHERE expires IS NOT NULL AND expires <= ?', (time.time(),))
+            count = connection.execute('SELECT COUNT(*) FROM cache_entries').fetchone()[0]
+            if count > self._max_entries:
+                connection.execute(
+                    'DELETE FROM cache_entries WHERE rowid IN (SELECT rowid FROM cache_entries ORDER BY rowid LIMIT ?)',
+                    (count // self._cull_frequency,),
+                )
+
+
+class TieredCache(BaseCache):
+    """
+    Small in-process LRU (L1) in front of a shared cache alias.
+
+    Reads are served from L1 for up to L1_TIMEOUT seconds, then from the shared tier.
+    Writes go to both tiers, and add(), incr() and decr() always go to the shared tier,
+    so counters and locks stay correct. Only hits are kept in L1, so a key set by another
+    process is visible on the next read. A change made elsewhere to a key already in L1
+    can take up to L1_TIMEOUT to show. Use this alias for read-mostly data and the shared
+    alias for anything that must be coherent across workers.
+
+    OPTIONS: SHARED (alias, default 'default'), L1_SIZE (entries), L1_TIMEOUT (seconds).
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self.shared_alias = options.get('SHARED', 'default')
+        self.l1_size = options.get('L1_SIZE', 5000)
+        self.l1_timeout = options.get('L1_TIMEOUT', 30)
+        self.metrics = Counter()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def _l1_get(self, key, version):
+        l1_key = (key, version)
+        with self._lock:
+            entry = self._entries.get(l1_key)
+            if entry is None:
+                return _MISSING
+            if entry[1] <= time.monotonic():
+                del self._entries[l1_key]
+                return _MISSING
+            self._entries.move_to_end(l1_key)
+            return entry[0]
+
+    def _l1_set(self, key, value, version, timeout=DEFAULT_TIMEOUT):
+        ttl = self.l1_timeout
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            ttl = min(ttl, timeout)
+        if ttl <= 0:
+            self._l1_drop(key, version)
+            return
+        with self._lock:
+            self._entries[(key, version)] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end((key, version))
+            while len(self._entries) > self.l1_size:
+                self._entries.popitem(last=False)
+
+    def _l1_drop(self, key, version):
+        with self._lock:
+            self._entries.pop((key, version), None)
+
+    def get(self, key, default=None, version=None):
+        value = self._l1_get(key, version)
+        if value is not _MISSING:
+            self.metrics['l1_hits'] += 1
+            return value
+
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self.metrics['misses'] += 1
+            return default
+        self.metrics['shared_hits'] += 1
+        self._l1_set(key, value, version)
+        return value
+
+    def get_many(self, keys, version=None):
+        found, missing = {}, []
+        for key in keys:
+            value = self._l1_get(key, version)
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+        self.metrics['l1_hits'] += len(found)
+
+        if missing:
+            shared = self.shared.get_many(missing, version=version)
+            self.metrics['shared_hits'] += len(shared)
+            self.metrics['misses'] += len(missing) - len(shared)
+            for key, value in shared.items():
+                self._l1_set(key, value, version)
+            found.update(shared)
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version=version)
+        self._l1_set(key, value, version, timeout)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            if key not in failed:
+                self._l1_set(key, value, version, timeout)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version=version)
+        if added:
+            self._l1_set(key, value, version, timeout)
+        else:
+            self._l1_drop(key, version)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._l1_drop(key, version)
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self._l1_drop(key, version)
+        self.shared.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        return self._l1_get(key, version) is not _MISSING or self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._l1_drop(key, version)
+        return self.shared.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        self._l1_drop(key, version)
+        return self.shared.decr(key, delta, version=version)
+
+    def clear(self):
+        """Empty this process's L1 only; the shared tier is left to its own alias."""
+        with self._lock:
+            self._entries.clear()
+
+
+class NamespacedCache:
+    """
+    Cache handle whose keys are prefixed with a namespace, with per-namespace hit and miss
+    counts. Get one with cache_namespace().
+    """
+
+    def __init__(self, namespace, alias='default'):
+        self.namespace = namespace
+        self.alias = alias
+        self.metrics = Counter()
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def key(self, key):
+        return f"{self.namespace}:{key}"
+
+    def get(self, key, default=None):
+        value = self.cache.get(self.key(key), _MISSING)
+        if value is _MISSING:
+            self.metrics['misses'] += 1
+            return default
+        self.metrics['hits'] += 1
+        return value
+
+    def get_many(self, keys):
+        keys = {self.key(key): key for key in keys}
+        found = self.cache.get_many(keys)
+        self.metrics['hits'] += len(found)
+        self.metrics['misses'] += len(keys) - len(found)
+        return {keys[key]: value for key, value in found.items()}
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT):
+        """Return the cached value, or compute default() (or use default), store and return it."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = default() if callable(default) else default
+            self.set(key, value, timeout)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.cache.set(self.key(key), value, timeout)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT):
+        return self.cache.set_many({self.key(key): value for key, value in data.items()}, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT):
+        return self.cache.add(self.key(key), value, timeout)
+
+    def incr(self, key, delta=1):
+        return self.cache.incr(self.key(key), delta)
+
+    def delete(self, key):
+        return self.cache.delete(self.key(key))
+
+
+_namespaces = {}
+_namespaces_lock = threading.Lock()
+
+
+def cache_namespace(namespace, alias='default'):
+    """Return the process-wide NamespacedCache for namespace on alias."""
+    with _namespaces_lock:
+        handle = _namespaces.get((namespace, alias))
+        if handle is None:
+            handle = _namespaces[(namespace, alias)] = NamespacedCache(namespace, alias)
+        return handle
+
+
+def cache_metrics():
+    """Hit and miss counts of every namespace, and L1/shared counts of every tiered alias, in this process."""
+    with _namespaces_lock:
+        handles = list(_namespaces.values())
+    metrics = {
+        f"{handle.alias}:{handle.namespace}": dict(handle.metrics)
+        for handle in handles
+    }
+    for alias in caches:
+        backend = caches[alias]
+        if isinstance(backend, TieredCache):
+            metrics[alias] = dict(backend.metrics)
+    return metrics
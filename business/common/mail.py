@@ -0,0 +1,163 @@
+import logging
+import smtplib
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.mail.backends.smtp import EmailBackend as SMTPBackend
+
+logger = logging.getLogger(__name__)
+
+EmailFailure = namedtuple('EmailFailure', ['message', 'error'])
+
+
+class MailSettings:
+    """
+    SMTP pooling configuration, read from the EMAIL_POOL settings dict.
+    """
+    _CONFIG = getattr(settings, 'EMAIL_POOL', {})
+
+    SIZE = _CONFIG.get('SIZE', 4)                                      # Open connections kept per process
+    MAX_IDLE = _CONFIG.get('MAX_IDLE', 60)                             # Seconds before an idle connection is re-checked
+    RETRIES = _CONFIG.get('RETRIES', 3)                                # Reconnects per message
+    BACKOFF = _CONFIG.get('BACKOFF', 0.5)                              # Seconds, doubled on each reconnect
+
+
+class SMTPConnectionPool:
+    """
+    Per-process pool of authenticated SMTP connections.
+
+    Connections are opened once (TCP, TLS and AUTH) and reused by every message the
+    process sends. A connection idle for longer than MAX_IDLE is probed with NOOP before
+    reuse. Works against any SMTP server from the EMAIL_HOST/EMAIL_PORT settings, e.g. a
+    local stand-in started with `python -m aiosmtpd -n -l localhost:1025` and
+    EMAIL_USE_TLS=False.
+    """
+
+    def __init__(self, size=None):
+        self.size = size or MailSettings.SIZE
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            while self._idle:
+                backend, released_at = self._idle.pop()
+                if time.monotonic() - released_at < MailSettings.MAX_IDLE or self._alive(backend):
+                    return backend
+                backend.close()
+
+        # Opened lazily by the first send, which handles reconnects
+        return SMTPBackend(fail_silently=False)
+
+    def release(self, backend, healthy=True):
+        if not healthy or backend.connection is None:
+            backend.close()
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append((backend, time.monotonic()))
+                return
+        backend.close()
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for backend, _ in idle:
+            backend.close()
+
+    def send(self, messages):
+        """
+        Send messages over one pooled connection. Returns (sent, failures), where failures
+        is a list of EmailFailure for messages the server rejected or that still failed
+        after RETRIES reconnects with exponential backoff.
+        """
+        messages = list(messages)
+        if not messages:
+            return 0, []
+
+        sent, failures = 0, []
+        backend = self.acquire()
+        try:
+            for message in messages:
+                error = self._send_one(backend, message)
+                if error is None:
+                    sent += 1
+                else:
+                    failures.append(EmailFailure(message, error))
+        finally:
+            self.release(backend, healthy=backend.connection is not None)
+
+        if failures:
+            logger.warning(f"Failed to send {len(failures)} of {len(messages)} email(s)")
+        return sent, failures
+
+    def _send_one(self, backend, message):
+        for attempt in range(MailSettings.RETRIES + 1):
+            try:
+                if backend.connection is None:
+                    backend.open()
+                if not backend._send(message):
+                    return "No recipients"
+                return None
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError) as e:
+                error = e
+            except smtplib.SMTPException as e:
+                # Rejected by the server (recipient, sender, data or auth); reconnecting would not help
+                return str(e)
+            except OSError as e:
+                error = e
+
+            backend.close()
+            if attempt == MailSettings.RETRIES:
+                return str(error)
+            delay = MailSettings.BACKOFF * (2 ** attempt)
+            logger.info(f"SMTP connection lost ({str(error)}); reconnecting in {delay:.1f}s")
+            time.sleep(delay)
+        return None
+
+    @staticmethod
+    def _alive(backend):
+        try:
+            return backend.connection is not None and backend.connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+
+email_pool = SMTPConnectionPool()
+
+
+class PooledEmailBackend(BaseEmailBackend):
+    """
+    EMAIL_BACKEND that sends through the process-wide SMTP pool, so EmailMessage.send()
+    reuses an open connection instead of paying a TCP and TLS handshake per message.
+    Per-message failures of the last send_messages() call are kept in self.failures.
+    """
+
+    def __init__(self, fail_silently=False, **kwargs):
+        super().__init__(fail_silently=fail_silently)
+        self.failures = []
+
+    def send_messages(self, email_messages):
+        sent, self.failures = email_pool.send(email_messages)
+        if self.failures and not self.fail_silently:
+            first = self.failures[0]
+            raise smtplib.SMTPException(f"{len(self.failures)} email(s) failed, first: {first.error}")
+        return sent
+
+
+def send_emails(messages):
+    """Send a batch of messages with one send_messages pass. Returns (sent, failures) and never raises."""
+    return email_pool.send(messages)
+
+
+def send_email_map(messages):
+    """
+    Send {key: message} in one batch and return the keys whose message failed,
+    so a task can retry only those recipients.
+    """
+    _, failures = email_pool.send(messages.values())
+    failed = {id(failure.message) for failure in failures}
+    return [key for key, message in messages.items() if id(message) in failed]
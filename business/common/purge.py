@@ -0,0 +1,58 @@
+import logging
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PurgeSettings:
+    """
+    Retention and batching for expired-data cleanup, read from the DATA_RETENTION settings dict.
+    """
+    _CONFIG = getattr(settings, 'DATA_RETENTION', {})
+
+    CHUNK_SIZE = _CONFIG.get('CHUNK_SIZE', 1000)                       # Rows per DELETE
+    CHUNK_PAUSE = _CONFIG.get('CHUNK_PAUSE', 0.1)                      # Seconds between chunks
+    RATE_SNAPSHOT_DAYS = _CONFIG.get('RATE_SNAPSHOT_DAYS', 30)
+    CELERY_RESULT_DAYS = _CONFIG.get('CELERY_RESULT_DAYS', 7)
+
+
+def purge_queryset(queryset, chunk_size=None, pause=None, progress=None):
+    """
+    Delete every row matched by queryset in bounded primary-key ranges.
+
+    Each pass reads the next chunk_size primary keys in order (a keyset scan, so no
+    OFFSET) and deletes the matching rows between the first and last of them, then
+    sleeps for pause seconds so each transaction and its locks stay short and other
+    writers get a turn. progress(model_label, deleted_so_far) is called after each
+    chunk. Returns the number of rows of queryset.model deleted (cascades excluded).
+    """
+    chunk_size = chunk_size or PurgeSettings.CHUNK_SIZE
+    pause = PurgeSettings.CHUNK_PAUSE if pause is None else pause
+    label = queryset.model._meta.label
+    queryset = queryset.order_by()
+    keys = queryset.order_by('pk').values_list('pk', flat=True)
+
+    total = 0
+    last = None
+    while True:
+        window = keys if last is None else keys.filter(pk__gt=last)
+        chunk = list(window[:chunk_size])
+        if not chunk:
+            break
+
+        _, per_model = queryset.filter(pk__gte=chunk[0], pk__lte=chunk[-1]).delete()
+        total += per_model.get(label, 0)
+        last = chunk[-1]
+
+        logger.info(f"Purged {total} {label} row(s) so far")
+        if progress:
+            progress(label, total)
+
+        if len(chunk) < chunk_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return total
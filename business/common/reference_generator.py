@@ -105,10 +105,9 @@ class ReferenceGenerator:
     def _get_sequence_number(cls, prefix: str) -> int:
         key = f"ref_seq_{prefix}_{datetime.now().strftime('%Y%m%d')}"
         try:
-            sequence = cache.incr(key)
-            if sequence == 1:
-                cache.expire(key, 86400)
-            return sequence
+            # add() sets the TTL only when the day's counter is created; incr() keeps it
+            cache.add(key, 0, 86400)
+            return cache.incr(key)
         except Exception:
             return random.randint(1, 9999)
 
@@ -0,0 +1,160 @@
+import logging
+import threading
+import time
+import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SMSFailure = namedtuple('SMSFailure', ['to', 'body', 'error'])
+SentSMS = namedtuple('SentSMS', ['sid', 'to', 'body'])
+
+
+class SMSSettings:
+    """
+    SMS gateway configuration, read from the SMS_GATEWAY settings dict.
+    """
+    _CONFIG = getattr(settings, 'SMS_GATEWAY', {})
+
+    PROVIDER = _CONFIG.get('PROVIDER', 'twilio')                        # 'twilio' or 'fake'
+    MAX_WORKERS = _CONFIG.get('MAX_WORKERS', 8)                        # Concurrent sends per bulk call
+    TIMEOUT = _CONFIG.get('TIMEOUT', 10)                               # Seconds per provider request
+    MAX_RETRIES = _CONFIG.get('MAX_RETRIES', 2)                        # Connection-level retries
+    FAKE_LATENCY = _CONFIG.get('FAKE_LATENCY', 0.0)                    # Seconds the fake provider sleeps per message
+
+
+class TwilioSMSProvider:
+    """
+    Twilio client built once per process over a pooled HTTP session, so each message reuses
+    an open keep-alive connection instead of a new session and TLS handshake.
+    """
+
+    def __init__(self, pool_size=None):
+        from requests.adapters import HTTPAdapter
+        from twilio.http.http_client import TwilioHttpClient
+        from twilio.rest import Client
+
+        http_client = TwilioHttpClient(pool_connections=True, timeout=SMSSettings.TIMEOUT)
+        # Enough pooled connections for every bulk worker to keep its own open
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size or SMSSettings.MAX_WORKERS,
+            max_retries=SMSSettings.MAX_RETRIES,
+        )
+        http_client.session.mount('https://', adapter)
+
+        self.client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN, http_client=http_client)
+        self.from_ = settings.TWILIO_SMS_FROM
+
+    def send(self, to, body):
+        return self.client.messages.create(from_=self.from_, body=body, to=to).sid
+
+
+class FakeSMSProvider:
+    """
+    In-memory provider for local, test and load runs: records every message in self.sent
+    instead of sending it, optionally sleeping latency seconds to stand in for the network.
+    """
+
+    def __init__(self, latency=None):
+        self.latency = SMSSettings.FAKE_LATENCY if latency is None else latency
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def send(self, to, body):
+        if self.latency:
+            time.sleep(self.latency)
+        sid = f"SMfake{uuid.uuid4().hex}"
+        with self._lock:
+            self.sent.append(SentSMS(sid, to, body))
+        return sid
+
+    def clear(self):
+        with self._lock:
+            self.sent = []
+
+
+PROVIDERS = {
+    'twilio': TwilioSMSProvider,
+    'fake': FakeSMSProvider,
+}
+
+
+class SMSGateway:
+    """
+    Process-wide entry point for outgoing SMS.
+
+    The provider is created on first use and shared by every caller. send_bulk() coalesces
+    its messages per number, so a recipient with several pending texts gets one SMS, and
+    sends the results over at most MAX_WORKERS concurrent requests.
+    """
+
+    def __init__(self, provider=None):
+        self._provider = provider
+        self._lock = threading.Lock()
+
+    @property
+    def provider(self):
+        if self._provider is None:
+            with self._lock:
+                if self._provider is None:
+                    self._provider = PROVIDERS[SMSSettings.PROVIDER]()
+        return self._provider
+
+    def use(self, provider):
+        """Swap the provider, e.g. FakeSMSProvider() for a load run. Returns it."""
+        with self._lock:
+            self._provider = provider
+        return provider
+
+    def send(self, to, body):
+        """Send one SMS and return its provider id. Provider errors are raised."""
+        return self.provider.send(str(to), body)
+
+    def send_bulk(self, messages, max_workers=None):
+        """
+        Send an iterable of (to, body) pairs. Bodies for the same number are merged into one
+        SMS, one line each, with exact repeats dropped. Returns (sent, failures), where sent
+        maps each number to its provider id and failures is a list of SMSFailure.
+        """
+        batches = self.coalesce(messages)
+        if not batches:
+            return {}, []
+
+        provider = self.provider
+        workers = min(max_workers or SMSSettings.MAX_WORKERS, len(batches))
+
+        def deliver(item):
+            to, body = item
+            try:
+                return to, body, provider.send(to, body), None
+            except Exception as e:
+                return to, body, None, e
+
+        sent, failures = {}, []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sms') as executor:
+            for to, body, sid, error in executor.map(deliver, batches.items()):
+                if error is None:
+                    sent[to] = sid
+                else:
+                    failures.append(SMSFailure(to, body, str(error)))
+
+        if failures:
+            logger.warning(f"Failed to send {len(failures)} of {len(batches)} SMS")
+        return sent, failures
+
+    @staticmethod
+    def coalesce(messages):
+        """Group (to, body) pairs into {to: merged body}, keeping first-seen order."""
+        grouped = {}
+        for to, body in messages:
+            bodies = grouped.setdefault(str(to).strip(), [])
+            if body not in bodies:
+                bodies.append(body)
+        return {to: "\n".join(bodies) for to, bodies in grouped.items()}
+
+
+sms_gateway = SMSGateway()
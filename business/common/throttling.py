@@ -0,0 +1,122 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Sliding-window counter throttle built on atomic cache counters.
+
+    Each key keeps one counter per fixed window. A request increments the current
+    window's counter and is allowed while
+
+        previous_count * (1 - elapsed_fraction) + current_count <= num_requests
+
+    which approximates a true sliding window in O(1) work and two cache keys,
+    instead of DRF's per-key timestamp list that is rewritten on every hit.
+    The increment is atomic, so concurrent workers can never both take the last slot.
+    Rejected requests are counted too, so sustained hammering stays blocked.
+    """
+    cache_alias = getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')
+    cache_format = 'throttle_%(scope)s_%(ident)s'
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        current_key = f'{self.key}:{window}'
+
+        # Two windows of TTL: the counter is read as the previous window once this one closes
+        self.cache.add(current_key, 0, self.duration * 2)
+        try:
+            current = self.cache.incr(current_key)
+        except ValueError:
+            # Evicted between add() and incr(); start the window over
+            self.cache.set(current_key, 1, self.duration * 2)
+            current = 1
+        previous = self.cache.get(f'{self.key}:{window - 1}', 0)
+
+        self.elapsed = (self.now % self.duration) / self.duration
+        self.estimate = previous * (1 - self.elapsed) + current
+        self.previous = previous
+
+        if self.estimate > self.num_requests:
+            return self.throttle_failure()
+        return self.throttle_success()
+
+    def throttle_success(self):
+        return True
+
+    def wait(self):
+        """Seconds until the weighted previous window has decayed enough to admit a request."""
+        current = self.estimate - self.previous * (1 - self.elapsed)
+        if current >= self.num_requests or not self.previous:
+            return self.duration * (1 - self.elapsed)
+        # previous * (1 - t) + current <= num_requests  =>  t >= 1 - (num_requests - current) / previous
+        needed = 1 - (self.num_requests - current) / self.previous
+        return max(0.0, (needed - self.elapsed) * self.duration)
+
+
+class AnonSlidingWindowThrottle(SlidingWindowRateThrottle):
+    """Limits anonymous requests per client IP."""
+    scope = 'anon'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class UserSlidingWindowThrottle(SlidingWindowRateThrottle):
+    """Limits requests per authenticated user, or per client IP for anonymous requests."""
+    scope = 'user'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+
+class IdentifierRateThrottle(SlidingWindowRateThrottle):
+    """
+    Limits requests per submitted account identifier (email or phone number), falling back
+    to the client IP, so guessing against one account is capped however many IPs are used.
+    """
+
+    def get_cache_key(self, request, view):
+        identifier = request.data.get('identifier') if hasattr(request.data, 'get') else None
+        if identifier:
+            # Hashed so arbitrary user input is always a valid cache key
+            ident = 'id_' + hashlib.sha256(str(identifier).strip().lower().encode()).hexdigest()[:32]
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+
+class OTPRateThrottle(IdentifierRateThrottle):
+    """OTP generation and verification attempts per account."""
+    scope = 'otp'
+
+
+class LoginRateThrottle(IdentifierRateThrottle):
+    """Login attempts per account."""
+    scope = 'login'
+
+
+class PaymentRateThrottle(UserSlidingWindowThrottle):
+    """Money-movement requests per user."""
+    scope = 'payment'
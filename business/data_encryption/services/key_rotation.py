@@ -49,13 +49,11 @@ class KeyRotationService:
     def _load_model_configurations(self) -> List[Tuple[Type[models.Model], List[str]]]:
         """Returns list of (model, fields) tuples that need encryption."""
         try:
-            from authservice import models as credential_models
             from walletservice import models as wallets_models
             from userservice import models as user_models
             from paymentservice import models as payment_models
 
             return [
-                (credential_models.OTP, ["_otp"]),
                 (wallets_models.DigitalWallet, ["_balance"]),
                 (user_models.Customer, [
                     "_id_type", "_id_number", "_country", "_region_state",
@@ -1,6 +1,7 @@
-from .tasks import dispatch_wallet_created_task, dispatch_exchange_success_task
+from .tasks import dispatch_wallet_created_task, dispatch_exchange_success_task, purge_rate_snapshots
 
 __all__ = [
   'dispatch_wallet_created_task',
   'dispatch_exchange_success_task',
+  'purge_rate_snapshots',
 ]
\ No newline at end of file
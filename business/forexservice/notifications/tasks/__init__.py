@@ -1,7 +1,9 @@
 from .exchange import dispatch_exchange_success_task
+from .snapshot_cleanup import purge_rate_snapshots
 from .wallet import dispatch_wallet_created_task
 
 __all__ = [
     'dispatch_exchange_success_task',
     'dispatch_wallet_created_task',
+    'purge_rate_snapshots',
 ]
\ No newline at end of file
@@ -0,0 +1,16 @@
+from celery import shared_task
+from django.utils import timezone
+from datetime import timedelta
+
+from common import PurgeSettings, purge_queryset
+from forexservice.models import RateSnapshot
+
+
+@shared_task
+def purge_rate_snapshots():
+    """Delete rate snapshots past the retention window, always keeping the latest one as the fallback rate source."""
+    cutoff = timezone.now() - timedelta(days=PurgeSettings.RATE_SNAPSHOT_DAYS)
+    latest_id = RateSnapshot.objects.order_by('-created_at').values_list('id', flat=True).first()
+
+    deleted_count = purge_queryset(RateSnapshot.objects.filter(created_at__lt=cutoff).exclude(id=latest_id))
+    return f"Deleted {deleted_count} rate snapshot(s)."
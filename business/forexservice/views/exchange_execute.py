@@ -8,7 +8,8 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
-from common import ReferenceGenerator
+from common import ReferenceGenerator, UserSlidingWindowThrottle, PaymentRateThrottle
+from outbox.services import enqueue
 from rbac.permissions import MethodPermission, register_permissions
 from walletservice import models as wallet_models
 from forexservice.serializers import (
@@ -28,6 +29,7 @@ from forexservice.notifications import (
 @extend_schema(tags=["Forex Services - Execute Exchange"])
 class ExchangeExecuteView(APIView):
     permission_classes = [IsAuthenticated, MethodPermission]
+    throttle_classes = [UserSlidingWindowThrottle, PaymentRateThrottle]
     serializer_class = ExchangeRequestSerializer
     response_serializer_class = ExchangeExecutionResponseSerializer
 
@@ -69,7 +71,7 @@ class ExchangeExecuteView(APIView):
             }
         )
         if created:
-            db_transaction.on_commit(lambda: dispatch_wallet_created_task.delay(wallet.id, user.id))
+            enqueue(dispatch_wallet_created_task, wallet.id, user.id)
         return wallet
 
     @extend_schema(
@@ -149,10 +151,8 @@ class ExchangeExecuteView(APIView):
                     payment_provider=f'{settings.APP_NAME}',
                 )
 
-                # Notify after commit
-                db_transaction.on_commit(lambda: dispatch_exchange_success_task.delay(
-                    exchange_record.id, request.user.id
-                ))
+                # Published by the outbox relay once the transaction commits
+                enqueue(dispatch_exchange_success_task, exchange_record.id, request.user.id)
 
         except DatabaseError:
             return Response({"error": "Database operation failed. Please retry."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
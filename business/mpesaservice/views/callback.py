@@ -13,6 +13,7 @@ from drf_spectacular.utils import extend_schema
 # Project-specific imports
 from mpesaservice.services import JWTUtils
 from mpesaservice.notifications import dispatch_wallet_top_up_confirmation
+from outbox.services import enqueue
 from paymentservice.models import TransactionRecord
 from walletservice.models import DigitalWallet
 
@@ -67,12 +68,13 @@ class STKCallbackView(APIView):
                 transaction.metadata = callback_data
 
                 transaction.status = 'SUCCESS'
-                transaction.receiver_wallet.balance += transaction.amount
-                transaction.receiver_wallet.save()
-                transaction.save()
+                with db_transaction.atomic():
+                    transaction.receiver_wallet.balance += transaction.amount
+                    transaction.receiver_wallet.save()
+                    transaction.save()
 
-                # Notify only after transaction is committed
-                db_transaction.on_commit(lambda: dispatch_wallet_top_up_confirmation.delay(reference_id))
+                    # Published by the outbox relay once the transaction commits
+                    enqueue(dispatch_wallet_top_up_confirmation, reference_id)
 
                 return Response({"message": "Transaction successful"}, status=status.HTTP_200_OK)
 
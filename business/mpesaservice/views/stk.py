@@ -13,7 +13,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from common import ReferenceGenerator
+from common import ReferenceGenerator, UserSlidingWindowThrottle, PaymentRateThrottle
+from outbox.services import enqueue
 from walletservice import models as wallet_models
 from paymentservice import models as payments_models
 from mpesaservice.serializers import TopUpRequestSerializer, TopUpResponseSerializer
@@ -25,6 +26,7 @@ logger = logging.getLogger(__name__)
 @extend_schema(tags=["Integration - Mpesa STK"])
 class STKPushView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [UserSlidingWindowThrottle, PaymentRateThrottle]
     serializer_class = TopUpRequestSerializer
 
             
@@ -148,7 +150,7 @@ class STKPushView(APIView):
                 with db_transaction.atomic():
                     transaction_record.status = 'MPESA_PENDING'
                     transaction_record.save()
-                    db_transaction.on_commit(lambda: dispatch_wallet_top_up_initiated.delay(reference_id, phone_number))
+                    enqueue(dispatch_wallet_top_up_initiated, reference_id, phone_number)
 
                 return Response(
                     {"message": "Payment initiated successfully.", "reference_id": reference_id},
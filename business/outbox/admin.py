@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import OutboxEvent
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ('id', 'task_name', 'created_at', 'published_at', 'attempts')
+    list_filter = ('task_name',)
+    search_fields = ('task_name',)
+    readonly_fields = ('task_name', 'args', 'kwargs', 'created_at', 'published_at', 'attempts', 'last_error')
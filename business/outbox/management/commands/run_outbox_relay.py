@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from outbox.services import OutboxRelay
+from outbox.utils import OutboxSettings
+
+
+class Command(BaseCommand):
+    help = 'Publish pending outbox events, once or continuously with --loop'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=OutboxSettings.BATCH_SIZE)
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new events')
+        parser.add_argument('--interval', type=float, default=OutboxSettings.POLL_INTERVAL)
+
+    def handle(self, *args, **options):
+        relay = OutboxRelay(batch_size=options['batch_size'])
+
+        while True:
+            result = relay.run()
+            if result['published'] or result['failed']:
+                self.stdout.write(f"Published {result['published']} event(s), {result['failed']} failed.")
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS("Outbox relay finished."))
@@ -0,0 +1,3 @@
+from .event import OutboxEvent
+
+__all__ = ['OutboxEvent']
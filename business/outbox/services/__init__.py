@@ -0,0 +1,4 @@
+from .publisher import enqueue
+from .relay import OutboxRelay
+
+__all__ = ['OutboxRelay', 'enqueue']
@@ -0,0 +1,12 @@
+from outbox.models import OutboxEvent
+
+
+def enqueue(task, *args, **kwargs):
+    """
+    Record a Celery task call in the current database transaction instead of calling
+    task.delay(). The event is committed or rolled back with the surrounding writes, and
+    the relay publishes it afterwards, so the request never waits on the broker.
+    task is a Celery task or a registered task name; arguments must be JSON-serializable.
+    """
+    task_name = task if isinstance(task, str) else task.name
+    return OutboxEvent.objects.create(task_name=task_name, args=list(args), kwargs=kwargs)
@@ -0,0 +1,3 @@
+from .relay import purge_published_events, relay_outbox_events
+
+__all__ = ['purge_published_events', 'relay_outbox_events']
@@ -0,0 +1,22 @@
+import logging
+from celery import shared_task
+
+from outbox.services import OutboxRelay
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def relay_outbox_events():
+    """Periodic task that publishes pending outbox events to the broker."""
+    try:
+        return OutboxRelay().run()
+    except Exception as exc:
+        logger.error("Outbox relay failed: %s", str(exc), exc_info=True)
+
+
+@shared_task
+def purge_published_events():
+    """Delete published outbox events past the retention window."""
+    deleted_count = OutboxRelay().purge_published()
+    return f"Deleted {deleted_count} published outbox event(s)."
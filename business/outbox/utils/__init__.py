@@ -0,0 +1,3 @@
+from .settings import OutboxSettings
+
+__all__ = ['OutboxSettings']
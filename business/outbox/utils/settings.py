@@ -0,0 +1,14 @@
+from django.conf import settings
+
+
+class OutboxSettings:
+    """
+    Outbox relay configuration, read from the OUTBOX settings dict.
+    """
+    _CONFIG = getattr(settings, 'OUTBOX', {})
+
+    BATCH_SIZE = _CONFIG.get('BATCH_SIZE', 500)                        # Events per relay pass
+    MAX_BATCHES = _CONFIG.get('MAX_BATCHES', 20)                       # Passes per relay run
+    MAX_ATTEMPTS = _CONFIG.get('MAX_ATTEMPTS', 10)                     # Publish attempts before an event is parked
+    POLL_INTERVAL = _CONFIG.get('POLL_INTERVAL', 1)                    # Seconds between passes of run_outbox_relay
+    RETENTION_DAYS = _CONFIG.get('RETENTION_DAYS', 7)                  # Days published events are kept
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paymentservice', '0003_rename__amount_requestedtransaction_encrypted_amount_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='requestedtransaction',
+            name='last_reminded_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='requestedtransaction',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['created_at', 'id', 'last_reminded_at'], name='request_pending_reminder_idx'),
+        ),
+        migrations.CreateModel(
+            name='ReminderCursor',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('last_created_at', models.DateTimeField(blank=True, null=True)),
+                ('last_id', models.UUIDField(blank=True, null=True)),
+                ('pass_started_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Reminder Cursor',
+                'verbose_name_plural': 'Reminder Cursors',
+                'db_table': 'payment_reminder_cursors',
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paymentservice', '0004_reminder_cursor'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TransactionDigestEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('recipient_type', models.CharField(choices=[('payer', 'Payer'), ('payee', 'Payee')], max_length=5)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True)),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transaction_digest_entries', to=settings.AUTH_USER_MODEL)),
+                ('transaction', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='digest_entries', to='paymentservice.transactionrecord')),
+            ],
+            options={
+                'verbose_name': 'Transaction Digest Entry',
+                'verbose_name_plural': 'Transaction Digest Entries',
+                'db_table': 'transaction_digest_entries',
+                'indexes': [models.Index(fields=['recipient', 'created_at'], name='digest_recipient_idx')],
+                'constraints': [models.UniqueConstraint(fields=('transaction', 'recipient_type'), name='digest_entry_unique')],
+            },
+        ),
+    ]
@@ -1,9 +1,13 @@
 from .base import BaseModel
+from .reminders import ReminderCursor
 from .requests import RequestedTransaction
 from .transaction import TransactionRecord
+from .digest import TransactionDigestEntry
 
 __all__ = [
     'BaseModel',
+    'ReminderCursor',
     'RequestedTransaction',
+    'TransactionDigestEntry',
     'TransactionRecord',
 ]
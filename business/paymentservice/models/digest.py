@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import models
+
+from .transaction import TransactionRecord
+
+
+class TransactionDigestEntry(models.Model):
+    """
+    A completed transaction waiting to be summarised in its recipient's next digest.
+    Deleted once the digest carrying it has been sent.
+    """
+    RECIPIENT_TYPES = [
+        ('payer', 'Payer'),
+        ('payee', 'Payee'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    recipient = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='transaction_digest_entries')
+    transaction = models.ForeignKey(TransactionRecord, on_delete=models.CASCADE, related_name='digest_entries')
+    recipient_type = models.CharField(max_length=5, choices=RECIPIENT_TYPES)
+    created_at = models.DateTimeField(auto_now_add=True)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'transaction_digest_entries'
+        verbose_name = 'Transaction Digest Entry'
+        verbose_name_plural = 'Transaction Digest Entries'
+        constraints = [
+            # A retried notification task never queues the same transaction twice
+            models.UniqueConstraint(fields=['transaction', 'recipient_type'], name='digest_entry_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['recipient', 'created_at'], name='digest_recipient_idx'),
+        ]
+
+    def __str__(self):
+        return f"Digest entry {self.transaction_id} for {self.recipient_id} ({self.recipient_type})"
@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class ReminderCursor(models.Model):
+    """
+    Position of a reminder pass over pending requests, as the (created_at, id) of the last
+    request dispatched. Empty when no pass is in progress.
+    """
+    name = models.CharField(max_length=50, primary_key=True)
+    last_created_at = models.DateTimeField(null=True, blank=True)
+    last_id = models.UUIDField(null=True, blank=True)
+    pass_started_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'payment_reminder_cursors'
+        verbose_name = 'Reminder Cursor'
+        verbose_name_plural = 'Reminder Cursors'
+
+    def __str__(self):
+        return f"{self.name} at {self.last_created_at or 'start'}"
@@ -31,6 +31,9 @@ class RequestedTransaction(BaseModel,EncryptedFieldsMixin):
     payment_provider = models.CharField(max_length=50, null=True, blank=True)
     reason = models.TextField(null=True, blank=True)
 
+    # Reminders
+    last_reminded_at = models.DateTimeField(null=True, blank=True)
+
     # Encrypted fields
     encrypted_fields = [
         'amount',
@@ -44,6 +47,12 @@ class RequestedTransaction(BaseModel,EncryptedFieldsMixin):
         verbose_name_plural = 'Fund Transfer Requests'
         indexes = [
             models.Index(fields=['requesting_user', 'requested_user', 'status']),
+            # Keyset scan of pending requests for reminders, in (created_at, id) order
+            models.Index(
+                fields=['created_at', 'id', 'last_reminded_at'],
+                condition=models.Q(status=RequestStatus.PENDING),
+                name='request_pending_reminder_idx',
+            ),
         ]
         ordering = ['-created_at']
 
@@ -1,5 +1,7 @@
 from .tasks import (
     send_queued_transaction_reminders,
+    send_reminder_batch,
+    send_payment_digests,
     notify_transaction_completion,
     notify_transaction_request,
     notify_transaction_approval,
@@ -9,6 +11,8 @@ from .tasks import (
 
 __all__ = [
     "send_queued_transaction_reminders",
+    "send_reminder_batch",
+    "send_payment_digests",
     "notify_transaction_completion",
     "notify_transaction_request",
     "notify_transaction_approval",
@@ -1,8 +1,10 @@
+from .digest_message import PaymentDigestService
 from .reminder_message import PaymentReminderService
 from .transaction_message import PaymentTransactionMessage
 from .request_messages import PaymentRequestMessage
 
 __all__ = [
+    "PaymentDigestService",
     "PaymentReminderService",
     "PaymentTransactionMessage",
     "PaymentRequestMessage",
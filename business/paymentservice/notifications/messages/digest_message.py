@@ -0,0 +1,221 @@
+import logging
+from collections import defaultdict
+from decimal import Decimal
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
+from django.db.models import Min, Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+from common import send_emails, sms_gateway
+from paymentservice.models import TransactionDigestEntry, TransactionRecord
+from paymentservice.utils import DigestSettings
+
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentDigestService:
+    """
+    Service for coalescing payment notifications into per-user digests.
+
+    Completed transactions for recipients with use_digest are queued as digest entries
+    instead of being sent one by one. A periodic sweep sends each recipient a single
+    summary once their oldest queued entry is DigestSettings.WINDOW old, by SMS for
+    users with use_sms and by email otherwise.
+    """
+
+    @classmethod
+    def defer(cls, transaction_id, recipient_types):
+        """
+        Queue the transaction for every recipient who opted into digests.
+        Returns:
+            list: recipient types still to be notified immediately
+        """
+        record = (
+            TransactionRecord.objects
+            .select_related('sender_wallet__wallet_owner', 'receiver_wallet__wallet_owner')
+            .get(id=transaction_id)
+        )
+
+        entries, immediate = [], []
+        for recipient_type in recipient_types:
+            wallet = record.sender_wallet if recipient_type == 'payer' else record.receiver_wallet
+            recipient = wallet.wallet_owner if wallet else None
+            if recipient is not None and recipient.use_digest:
+                entries.append(TransactionDigestEntry(recipient=recipient, transaction=record, recipient_type=recipient_type))
+            else:
+                immediate.append(recipient_type)
+
+        if entries:
+            TransactionDigestEntry.objects.bulk_create(entries, ignore_conflicts=True)
+        return immediate
+
+    @classmethod
+    def send_due(cls, now=None):
+        """
+        Send a digest to every recipient whose oldest queued entry is older than the window.
+        Entries are claimed before sending and deleted once their digest is sent. Entries whose
+        digest fails to send are released for the next sweep; entries whose digest fails to
+        prepare stay claimed until CLAIM_TIMEOUT.
+        Returns:
+            tuple: (digests_sent, digests_failed)
+        """
+        now = now or timezone.now()
+        pending = TransactionDigestEntry.objects.filter(
+            Q(dispatched_at__isnull=True) | Q(dispatched_at__lt=now - DigestSettings.CLAIM_TIMEOUT)
+        )
+        recipient_ids = list(
+            pending
+            .values('recipient_id')
+            .annotate(first_queued=Min('created_at'))
+            .filter(first_queued__lte=now - DigestSettings.WINDOW)
+            .order_by('first_queued')
+            .values_list('recipient_id', flat=True)[:DigestSettings.RECIPIENTS_PER_RUN]
+        )
+        if not recipient_ids:
+            return (0, 0)
+
+        with transaction.atomic():
+            claimed = list(
+                pending.filter(recipient_id__in=recipient_ids)
+                .select_for_update(skip_locked=True)
+                .values_list('id', flat=True)
+            )
+            TransactionDigestEntry.objects.filter(id__in=claimed).update(dispatched_at=now)
+
+        entries = (
+            TransactionDigestEntry.objects
+            .filter(id__in=claimed)
+            .select_related(
+                'recipient',
+                'transaction__sender_wallet__wallet_owner',
+                'transaction__receiver_wallet__wallet_owner',
+            )
+            .order_by('created_at')
+        )
+        by_recipient = defaultdict(list)
+        for entry in entries:
+            by_recipient[entry.recipient].append(entry)
+
+        emails, texts = {}, {}
+        for recipient, recipient_entries in by_recipient.items():
+            try:
+                summary = cls._summarise(recipient, recipient_entries)
+                if recipient.use_sms:
+                    texts[recipient.phone_number] = (recipient.id, cls._sms_body(summary))
+                else:
+                    emails[recipient.id] = summary
+            except Exception as e:
+                logger.error(f"Failed to prepare digest for user {recipient.id}: {str(e)}")
+
+        sent = cls._send_emails(emails) | cls._send_texts(texts)
+
+        TransactionDigestEntry.objects.filter(id__in=claimed, recipient_id__in=sent).delete()
+        # Only delivery failures are released; a digest that could not be prepared would fail
+        # the same way on the next sweep, so its entries keep their claim until CLAIM_TIMEOUT
+        undelivered = ({recipient_id for recipient_id, _ in texts.values()} | emails.keys()) - sent
+        if undelivered:
+            TransactionDigestEntry.objects.filter(
+                id__in=claimed, dispatched_at=now, recipient_id__in=undelivered
+            ).update(dispatched_at=None)
+
+        failed = len(by_recipient) - len(sent)
+        if failed:
+            logger.warning(f"Failed to send {failed} payment digests, {len(undelivered)} released for the next sweep")
+        return (len(sent), failed)
+
+    @classmethod
+    def _summarise(cls, recipient, entries):
+        """Build the digest context: per-direction totals by currency and the latest transactions"""
+        totals = defaultdict(Decimal)
+        items = []
+        received_count = sent_count = 0
+
+        for entry in entries:
+            record = entry.transaction
+            is_payer = entry.recipient_type == 'payer'
+            counterparty_wallet = record.receiver_wallet if is_payer else record.sender_wallet
+            # amount is decrypted to a str on every access; read and convert it once
+            amount = Decimal(record.amount or '0')
+
+            totals[('Sent' if is_payer else 'Received', record.currency)] += amount
+            if is_payer:
+                sent_count += 1
+            else:
+                received_count += 1
+
+            items.append({
+                'is_payer': is_payer,
+                'counterparty_name': counterparty_wallet.wallet_owner.get_full_name() if counterparty_wallet else '',
+                'amount': f"{record.currency} {amount:,.2f}",
+                'reference_id': record.reference_id,
+                'payment_date': timezone.localtime(record.created_at).strftime("%B %d, %Y at %H:%M"),
+            })
+
+        return {
+            'recipient_name': recipient.get_full_name(),
+            'recipient_email': recipient.email,
+            'period_start': timezone.localtime(entries[0].created_at).strftime("%B %d, %Y at %H:%M"),
+            'received_count': received_count,
+            'sent_count': sent_count,
+            'totals': [
+                {'label': direction, 'amount': f"{currency} {total:,.2f}"}
+                for (direction, currency), total in sorted(totals.items(), key=lambda item: (item[0][0] != 'Received', item[0][1]))
+            ],
+            'items': items[-DigestSettings.MAX_ITEMS:][::-1],
+            'more_count': max(0, len(items) - DigestSettings.MAX_ITEMS),
+        }
+
+    @classmethod
+    def _sms_body(cls, summary):
+        totals = ", ".join(f"{total['label'].lower()} {total['amount']}" for total in summary['totals'])
+        return (
+            f"{settings.APP_NAME}: {summary['received_count']} payment(s) received and "
+            f"{summary['sent_count']} sent since {summary['period_start']}: {totals}."
+        )
+
+    @classmethod
+    def _send_emails(cls, summaries):
+        """Render and send digest emails in one pass. Returns the ids of recipients that were sent to."""
+        if not summaries:
+            return set()
+
+        branding = {
+            'frontend_url': settings.FRONTEND_LOCAL_URL,
+            'app_name': settings.APP_NAME,
+            'email_support': settings.EMAIL_SUPPORT,
+            'copyright_year': settings.COPYRIGHT_YEAR,
+            'privacy_policy_url': settings.PRIVACY_POLICY_URL,
+            'terms_url': settings.TERMS_URL,
+        }
+
+        messages = {}
+        for recipient_id, summary in summaries.items():
+            email_body = render_to_string("payment-digest.html", {**summary, **branding})
+            message = EmailMultiAlternatives(
+                subject=f"Your Payment Summary - {summary['received_count'] + summary['sent_count']} transactions",
+                body=email_body,  # Text fallback
+                from_email=settings.EMAIL_FROM_ALERTS,
+                to=[summary['recipient_email']],
+                reply_to=[settings.EMAIL_REPLY_TO],
+            )
+            message.attach_alternative(email_body, "text/html")
+            messages[recipient_id] = message
+
+        _, failures = send_emails(messages.values())
+        failed = {id(failure.message) for failure in failures}
+        for failure in failures:
+            logger.error(f"Digest to {', '.join(failure.message.to)} failed: {failure.error}")
+        return {recipient_id for recipient_id, message in messages.items() if id(message) not in failed}
+
+    @classmethod
+    def _send_texts(cls, texts):
+        """Send digest SMS concurrently. Returns the ids of recipients that were sent to."""
+        if not texts:
+            return set()
+
+        sent, failures = sms_gateway.send_bulk((number, body) for number, (_, body) in texts.items())
+        for failure in failures:
+            logger.error(f"Digest SMS to {failure.to} failed: {failure.error}")
+        return {texts[number][0] for number in sent}
@@ -1,24 +1,91 @@
 import logging
-from datetime import timedelta
+from decimal import Decimal
 from django.conf import settings
-from django.core.mail import get_connection, EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
+from django.db.models import Q
 from django.template.loader import render_to_string
 from django.utils import timezone
-from paymentservice.models import RequestedTransaction
+from common import send_emails
+from paymentservice.models import ReminderCursor, RequestedTransaction
+from paymentservice.utils import ReminderSettings, RequestStatus
 
 
 logger = logging.getLogger(__name__)
-PAYMENT_REMINDER_DAYS = 2  # Days after which to send reminders
+
 
 class PaymentReminderService:
-    """Service for handling bulk payment reminder emails"""
+    """
+    Service for handling bulk payment reminder emails.
+
+    Reminders run as passes over due pending requests in (created_at, id) order. A persisted
+    cursor records how far the current pass has got, so each run picks up the next window
+    instead of the same oldest requests, and last_reminded_at on each request keeps it from
+    being reminded more than once per ReminderSettings.CADENCE.
+    """
+    CURSOR_NAME = 'payment-reminders'
+
+    @classmethod
+    def due_requests(cls, now=None):
+        """Pending requests old enough for a reminder and not reminded within the cadence"""
+        now = now or timezone.now()
+        return (
+            RequestedTransaction.objects
+            .filter(
+                status=RequestStatus.PENDING,
+                created_at__lt=now - ReminderSettings.DELAY,
+                requested_user__is_active=True,
+            )
+            .filter(Q(last_reminded_at__isnull=True) | Q(last_reminded_at__lt=now - ReminderSettings.CADENCE))
+        )
 
     @classmethod
-    def send_reminders(cls, batch_size=100):
+    def next_window(cls, batch_size=None, batches=None):
         """
-        Send payment reminder emails in bulk
+        Take the next window of due requests after the cursor and advance it.
         Args:
-            batch_size (int): Maximum number of reminders to send in this batch
+            batch_size (int): Requests per worker batch
+            batches (int): Worker batches in the window
+        Returns:
+            tuple: (list of request id batches, whether the pass reached the end)
+        """
+        batch_size = batch_size or ReminderSettings.BATCH_SIZE
+        limit = batch_size * (batches or ReminderSettings.BATCHES_PER_RUN)
+        now = timezone.now()
+
+        with transaction.atomic():
+            # Row lock so overlapping coordinator runs hand out disjoint windows
+            cursor, _ = ReminderCursor.objects.select_for_update().get_or_create(name=cls.CURSOR_NAME)
+
+            pending = cls.due_requests(now)
+            if cursor.last_created_at is None:
+                cursor.pass_started_at = now
+            else:
+                pending = pending.filter(
+                    Q(created_at__gt=cursor.last_created_at)
+                    | Q(created_at=cursor.last_created_at, id__gt=cursor.last_id)
+                )
+
+            keys = list(pending.order_by('created_at', 'id').values_list('id', 'created_at')[:limit])
+            finished = len(keys) < limit
+            if finished:
+                if cursor.pass_started_at:
+                    logger.info(f"Reminder pass started {cursor.pass_started_at} finished")
+                cursor.last_created_at = cursor.last_id = cursor.pass_started_at = None
+            else:
+                cursor.last_id, cursor.last_created_at = keys[-1]
+            cursor.save()
+
+        ids = [str(pk) for pk, _ in keys]
+        return [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)], finished
+
+    @classmethod
+    def send_batch(cls, request_ids):
+        """
+        Claim and remind one batch of requests.
+        Requests are claimed by stamping last_reminded_at before sending, so a request in two
+        overlapping batches is only reminded once. Requests whose email fails to send are
+        released for the next pass; requests that fail to prepare wait for the next cadence.
         Returns:
             tuple: (success_count, failure_count)
         """
@@ -26,47 +93,57 @@ class PaymentReminderService:
             logger.error("Email settings not configured")
             return (0, 0)
 
-        reminder_cutoff = timezone.now() - timedelta(days=PAYMENT_REMINDER_DAYS or 5)
-        
-        try:
-            pending_requests = (
-                RequestedTransaction.objects
-                .filter(
-                    status='pending',
-                    created_at__lt=reminder_cutoff,
-                    requested_user__is_active=True
-                )
+        now = timezone.now()
+        with transaction.atomic():
+            claimed = list(
+                cls.due_requests(now)
+                .filter(id__in=request_ids)
                 .select_related('requesting_user', 'requested_user')
-                .order_by('created_at')[:batch_size]
+                .select_for_update(skip_locked=True, of=('self',))
             )
-            
-            if not pending_requests:
-                logger.debug("No pending payment requests found")
-                return (0, 0)
+            previous = {request.id: request.last_reminded_at for request in claimed}
+            RequestedTransaction.objects.filter(id__in=previous).update(last_reminded_at=now)
+
+        if not claimed:
+            logger.debug("No due payment requests in batch")
+            return (0, 0)
+
+        prepared = cls._prepare_messages(claimed)
+        _, failures = send_emails([message for _, message in prepared])
 
-            messages = cls._prepare_messages(pending_requests)
-            return cls._send_bulk_emails(messages)
+        failed_messages = {id(failure.message) for failure in failures}
+        for failure in failures:
+            logger.error(f"Reminder to {', '.join(failure.message.to)} failed: {failure.error}")
 
-        except Exception as e:
-            logger.exception("Failed to process payment reminders")
-            return (0, len(pending_requests) if 'pending_requests' in locals() else 0)
+        sent_ids = {request.id for request, message in prepared if id(message) not in failed_messages}
+        # Only delivery failures are released; a request that could not be prepared would fail
+        # the same way on the next pass, so it keeps its claim until the next cadence
+        released = [request.id for request, message in prepared if id(message) in failed_messages]
+        for request_id in released:
+            RequestedTransaction.objects.filter(id=request_id, last_reminded_at=now).update(
+                last_reminded_at=previous[request_id]
+            )
+
+        failed = len(previous) - len(sent_ids)
+        if failed:
+            logger.warning(f"Failed to send {failed} reminders, {len(released)} released for the next pass")
+        return (len(sent_ids), failed)
 
     @classmethod
     def _prepare_messages(cls, requests):
-        """Prepare email messages for bulk sending"""
-        messages = []
+        """Prepare (request, message) pairs for bulk sending"""
         template_name = "payment-reminder.html"
-        
+        messages = []
+
         for request in requests:
             try:
+                # amount is decrypted to a str on every access; read and convert it once
+                amount = f"{request.currency} {Decimal(request.amount):,.2f}"
                 html_content = {
                     'requester_name': request.requesting_user.get_full_name(),
                     'requestee_name': request.requested_user.get_full_name(),
-                    'amount': f"{request.currency} {request.amount:,.2f}",
-                    'reminder_message': (
-                        f"Your payment request of {request.currency} {request.amount:,.2f} "
-                        "is still pending."
-                    ),
+                    'amount': amount,
+                    'reminder_message': f"Your payment request of {amount} is still pending.",
                     'payment_date': timezone.localtime(request.created_at).strftime("%B %d, %Y at %H:%M:%S"),
                     'frontend_url': settings.FRONTEND_LOCAL_URL,
                     'app_name': settings.APP_NAME,
@@ -79,41 +156,17 @@ class PaymentReminderService:
                 email_body = render_to_string(template_name, html_content)
 
                 message = EmailMultiAlternatives(
-                    subject=f"Payment Request Reminder - {request.currency} {request.amount:,.2f}",
+                    subject=f"Payment Request Reminder - {amount}",
                     body=email_body,  # Text fallback
                     from_email=settings.EMAIL_FROM_ALERTS,
                     to=[request.requested_user.email],
                     reply_to=[settings.EMAIL_REPLY_TO],
                 )
                 message.attach_alternative(email_body, "text/html")
-                messages.append(message)
-                
+                messages.append((request, message))
+
             except Exception as e:
                 logger.error(f"Failed to prepare reminder for request {request.id}: {str(e)}")
                 continue
-                
-        return messages
 
-    @classmethod
-    def _send_bulk_emails(cls, messages):
-        """Send prepared messages in bulk"""
-        if not messages:
-            return (0, 0)
-
-        success_count = 0
-        try:
-            with get_connection(
-                fail_silently=False,
-                timeout=settings.EMAIL_TIMEOUT or 10
-            ) as connection:
-                results = connection.send_messages(messages)
-                success_count = len([r for r in results if r == 1])
-                
-        except Exception as e:
-            logger.error(f"Bulk email send failed: {str(e)}")
-            
-        failure_count = len(messages) - success_count
-        if failure_count > 0:
-            logger.warning(f"Failed to send {failure_count} reminders")
-            
-        return (success_count, failure_count)
+        return messages
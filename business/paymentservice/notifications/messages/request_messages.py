@@ -11,10 +11,11 @@ class PaymentRequestMessage:
     """Service for sending payment request notifications"""
     
     @classmethod
-    def request(cls, transaction_id, recipient_type):
+    def request(cls, transaction_id, recipient_type, deliver=True):
         """
         Notify either requester or requestee of a payment request.
         recipient_type: 'requester' or 'requestee'
+        Returns the message; with deliver=False it is built but not sent.
         """
         payment_request = RequestedTransaction.objects.get(id=transaction_id)
         template_name = "payment-request.html"
@@ -57,13 +58,16 @@ class PaymentRequestMessage:
         )
         email.content_subtype = "html"
         email.reply_to = [settings.EMAIL_REPLY_TO]
-        email.send()
+        if deliver:
+            email.send()
+        return email
 
     @classmethod
-    def approval(cls, transaction_id, recipient_type):
+    def approval(cls, transaction_id, recipient_type, deliver=True):
         """
         Notify either requester or requestee of payment request approval.
         recipient_type: 'requester' or 'requestee'
+        Returns the message; with deliver=False it is built but not sent.
         """
         transaction = TransactionRecord.objects.get(id=transaction_id)
         template_name = "payment-approval.html"
@@ -113,13 +117,16 @@ class PaymentRequestMessage:
         )
         email.content_subtype = "html"
         email.reply_to = [settings.EMAIL_REPLY_TO]
-        email.send()
+        if deliver:
+            email.send()
+        return email
 
     @classmethod
-    def cancellation(cls, transaction_id, recipient_type):
+    def cancellation(cls, transaction_id, recipient_type, deliver=True):
         """
         Notify either requester or requestee of payment request cancellation.
         recipient_type: 'requester' or 'requestee'
+        Returns the message; with deliver=False it is built but not sent.
         """
         transfer_request = RequestedTransaction.objects.get(id=transaction_id)
         template_name = "payment-cancelled.html"
@@ -165,4 +172,6 @@ class PaymentRequestMessage:
         )
         email.content_subtype = "html"
         email.reply_to = [settings.EMAIL_REPLY_TO]
-        email.send()
+        if deliver:
+            email.send()
+        return email
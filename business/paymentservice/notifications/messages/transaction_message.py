@@ -10,10 +10,11 @@ class PaymentTransactionMessage:
     """Service for sending payment transaction notifications"""
 
     @classmethod
-    def send(cls, transaction_id, recipient_type):
+    def send(cls, transaction_id, recipient_type, deliver=True):
         """
         Notify either payer or payee of a transaction.
         recipient_type: 'payer' or 'payee'
+        Returns the message; with deliver=False it is built but not sent.
         """
         transaction_record = TransactionRecord.objects.get(id=transaction_id)
         template_name = "payment-transaction.html"
@@ -57,4 +58,6 @@ class PaymentTransactionMessage:
         )
         email.content_subtype = "html"
         email.reply_to = [settings.EMAIL_REPLY_TO]
-        email.send()
+        if deliver:
+            email.send()
+        return email
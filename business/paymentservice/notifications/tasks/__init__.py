@@ -1,10 +1,13 @@
-from .automated_reminders import send_queued_transaction_reminders
+from .automated_reminders import send_queued_transaction_reminders, send_reminder_batch
+from .digest_task import send_payment_digests
 from .transaction_task import notify_transaction_completion
 from .request_task import notify_transaction_request, notify_transaction_approval, notify_transaction_cancellation
 
 
 __all__ = [
     "send_queued_transaction_reminders",
+    "send_reminder_batch",
+    "send_payment_digests",
     "notify_transaction_completion",
     "notify_transaction_request",
     "notify_transaction_approval",
@@ -1,7 +1,7 @@
-from celery import shared_task
+from celery import group, shared_task
 from celery.utils.log import get_task_logger
-from django.conf import settings
 from ..messages import PaymentReminderService
+from paymentservice.utils import ReminderSettings
 
 logger = get_task_logger(__name__)
 
@@ -14,39 +14,70 @@ logger = get_task_logger(__name__)
 )
 def send_queued_transaction_reminders(self, batch_size=None):
     """
-    Celery task for dispatching payment reminders in batches
+    Celery task coordinating a payment reminder pass
+    Takes the next window of due requests from the reminder cursor and fans it out to
+    send_reminder_batch workers in parallel, then continues the pass until the cursor
+    reaches the end. The next pass starts on the following beat.
     Args:
-        batch_size (int): Number of reminders per batch (default from settings)
+        batch_size (int): Number of reminders per worker batch (default from settings)
     """
-    batch_size = batch_size or getattr(settings, 'EMAIL_BATCH_SIZE', 100)
-    
+    batch_size = batch_size or ReminderSettings.BATCH_SIZE
+
     try:
-        success, failures = PaymentReminderService.send_reminders(batch_size)
-        
-        logger.info(
-            f"Reminder batch completed - Success: {success}, Failures: {failures}",
-            extra={
-                'success_count': success,
-                'failure_count': failures
-            }
-        )
-        
-        # If we processed a full batch, queue next one
-        if success >= batch_size:
-            self.apply_async(
-                kwargs={'batch_size': batch_size},
-                countdown=settings.EMAIL_BATCH_DELAY or 30
-            )
-            
-        return {
-            'success': success,
-            'failures': failures,
-            'batch_size': batch_size
-        }
-        
+        batches, finished = PaymentReminderService.next_window(batch_size)
     except Exception as exc:
         logger.exception("Payment reminder task failed")
-        self.retry(
+        raise self.retry(
             exc=exc,
             countdown=min(300, self.default_retry_delay * (self.request.retries + 1))
         )
+
+    if batches:
+        group(send_reminder_batch.s(request_ids) for request_ids in batches).apply_async()
+
+    # The cursor has moved past this window, so continuing never revisits it
+    if not finished:
+        self.apply_async(
+            kwargs={'batch_size': batch_size},
+            countdown=ReminderSettings.RUN_DELAY
+        )
+
+    queued = sum(len(request_ids) for request_ids in batches)
+    logger.info(f"Reminder window dispatched - Batches: {len(batches)}, Requests: {queued}, Pass finished: {finished}")
+    return {
+        'batches': len(batches),
+        'requests': queued,
+        'pass_finished': finished,
+    }
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    soft_time_limit=300,
+    time_limit=330
+)
+def send_reminder_batch(self, request_ids):
+    """
+    Celery task sending reminders for one batch of payment requests
+    Args:
+        request_ids (list): Ids of the requests in the batch
+    """
+    try:
+        success, failures = PaymentReminderService.send_batch(request_ids)
+    except Exception as exc:
+        logger.exception("Payment reminder batch failed")
+        raise self.retry(exc=exc)
+
+    logger.info(
+        f"Reminder batch completed - Success: {success}, Failures: {failures}",
+        extra={
+            'success_count': success,
+            'failure_count': failures
+        }
+    )
+    return {
+        'success': success,
+        'failures': failures,
+    }
@@ -0,0 +1,22 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from ..messages import PaymentDigestService
+
+logger = get_task_logger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, soft_time_limit=300, time_limit=330)
+def send_payment_digests(self):
+    """Send every payment digest whose window has closed."""
+    try:
+        sent, failed = PaymentDigestService.send_due()
+    except Exception as exc:
+        logger.exception("Payment digest sweep failed")
+        raise self.retry(exc=exc)
+
+    if sent or failed:
+        logger.info(f"Payment digests sent - Success: {sent}, Failures: {failed}")
+    return {
+        'sent': sent,
+        'failed': failed,
+    }
@@ -1,38 +1,41 @@
 from celery import shared_task
+from common import send_email_map
 from ..messages import PaymentRequestMessage
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def notify_transaction_request(self, transaction_id):
-    """Notify both requester and requestee of a payment request."""
-    try:
-        PaymentRequestMessage.request(transaction_id, 'requester')
-        PaymentRequestMessage.request(transaction_id, 'requestee')
-        return
+REQUEST_PARTIES = ('requester', 'requestee')
+
 
+def _notify(task, build, transaction_id, recipient_types):
+    """Send both parties' emails in one SMTP batch; only failed recipients are retried."""
+    try:
+        failed = send_email_map({
+            recipient_type: build(transaction_id, recipient_type, deliver=False)
+            for recipient_type in recipient_types
+        })
     except Exception as exc:
-        raise self.retry(exc=exc)
+        raise task.retry(exc=exc)
+
+    if failed:
+        raise task.retry(
+            args=(transaction_id, failed),
+            kwargs={},
+            exc=RuntimeError(f"Email delivery failed for {', '.join(failed)}"),
+        )
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def notify_transaction_approval(self, transaction_id):
-    """Notify both requester and requestee of payment approval."""
-    try:
-        PaymentRequestMessage.approval(transaction_id, 'requester')
-        PaymentRequestMessage.approval(transaction_id, 'requestee')
-        return
+def notify_transaction_request(self, transaction_id, recipient_types=REQUEST_PARTIES):
+    """Notify both requester and requestee of a payment request."""
+    _notify(self, PaymentRequestMessage.request, transaction_id, recipient_types)
 
-    except Exception as exc:
-        raise self.retry(exc=exc)
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def notify_transaction_approval(self, transaction_id, recipient_types=REQUEST_PARTIES):
+    """Notify both requester and requestee of payment approval."""
+    _notify(self, PaymentRequestMessage.approval, transaction_id, recipient_types)
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def notify_transaction_cancellation(self, transaction_id):
+def notify_transaction_cancellation(self, transaction_id, recipient_types=REQUEST_PARTIES):
     """Notify both requester and requestee of payment cancellation."""
-    try:
-        PaymentRequestMessage.cancellation(transaction_id, 'requester')
-        PaymentRequestMessage.cancellation(transaction_id, 'requestee')
-        return
-
-    except Exception as exc:
-        raise self.retry(exc=exc)
+    _notify(self, PaymentRequestMessage.cancellation, transaction_id, recipient_types)
@@ -1,14 +1,26 @@
 from celery import shared_task
-from ..messages import PaymentTransactionMessage
+from common import send_email_map
+from ..messages import PaymentDigestService, PaymentTransactionMessage
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def notify_transaction_completion(self, transaction_id):
-    """Notify sender and receiver of transaction."""
+def notify_transaction_completion(self, transaction_id, recipient_types=('payer', 'payee')):
+    """
+    Notify sender and receiver of transaction in one SMTP batch; only failed recipients are retried.
+    Recipients with use_digest get the transaction in their next digest instead.
+    """
     try:
-        PaymentTransactionMessage.send(transaction_id, 'payer')
-        PaymentTransactionMessage.send(transaction_id, 'payee')
-        return
-
+        immediate = PaymentDigestService.defer(transaction_id, recipient_types)
+        failed = send_email_map({
+            recipient_type: PaymentTransactionMessage.send(transaction_id, recipient_type, deliver=False)
+            for recipient_type in immediate
+        })
     except Exception as exc:
         raise self.retry(exc=exc)
+
+    if failed:
+        raise self.retry(
+            args=(transaction_id, failed),
+            kwargs={},
+            exc=RuntimeError(f"Email delivery failed for {', '.join(failed)}"),
+        )
@@ -10,6 +10,8 @@ from .choices import (
 
 # Exported Config and Settings
 from .settings import (
+    DigestSettings,
+    ReminderSettings,
     TransactionFeeConfig,
     TransferLimits,
 )
@@ -22,6 +24,8 @@ __all__ = [
     'TransactionType',
 
     # Config
+    'DigestSettings',
+    'ReminderSettings',
     'TransactionFeeConfig',
     'TransferLimits',
 ]
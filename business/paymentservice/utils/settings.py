@@ -1,5 +1,8 @@
+from datetime import timedelta
 from decimal import Decimal
 
+from django.conf import settings
+
 class TransactionFeeConfig:
     """
     Configuration for transaction fees.
@@ -14,3 +17,28 @@ class TransferLimits:
     Configuration for transfer limits.
     """
     UNVERIFIED_WALLET_MAX_TRANSFER = Decimal('150.00')       # Max allowed for unverified wallets
+
+
+class ReminderSettings:
+    """
+    Payment reminder cadence and batching, read from the PAYMENT_REMINDERS settings dict.
+    """
+    _CONFIG = getattr(settings, 'PAYMENT_REMINDERS', {})
+
+    DELAY = timedelta(days=_CONFIG.get('DELAY_DAYS', 2))              # Age of a request before its first reminder
+    CADENCE = timedelta(hours=_CONFIG.get('CADENCE_HOURS', 48))       # Minimum gap between reminders for one request
+    BATCH_SIZE = _CONFIG.get('BATCH_SIZE', 100)                       # Requests per worker batch
+    BATCHES_PER_RUN = _CONFIG.get('BATCHES_PER_RUN', 10)              # Worker batches dispatched per coordinator run
+    RUN_DELAY = _CONFIG.get('RUN_DELAY', 30)                          # Seconds before the coordinator continues a pass
+
+
+class DigestSettings:
+    """
+    Payment notification digests for users with use_digest, read from the NOTIFICATION_DIGEST settings dict.
+    """
+    _CONFIG = getattr(settings, 'NOTIFICATION_DIGEST', {})
+
+    WINDOW = timedelta(minutes=_CONFIG.get('WINDOW_MINUTES', 15))     # Age of a recipient's oldest entry before their digest goes out
+    MAX_ITEMS = _CONFIG.get('MAX_ITEMS', 20)                          # Transactions listed individually in one digest
+    RECIPIENTS_PER_RUN = _CONFIG.get('RECIPIENTS_PER_RUN', 500)       # Digests sent per sweep
+    CLAIM_TIMEOUT = timedelta(minutes=_CONFIG.get('CLAIM_TIMEOUT_MINUTES', 10))  # Before entries claimed by a crashed sweep are retried
@@ -5,14 +5,17 @@ import time
 from django.conf import settings
 from django.db import OperationalError, transaction as db_transaction
 from drf_spectacular.utils import extend_schema
+from ipware import get_client_ip
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 # Project-specific imports
-from common import ReferenceGenerator
+from common import ReferenceGenerator, UserSlidingWindowThrottle, PaymentRateThrottle
+from outbox.services import enqueue
 from rbac.permissions import MethodPermission, register_permissions
+from tracking.services import RiskEngine, risk_engine
 from walletservice import models as wallet_models
 from paymentservice.models import RequestedTransaction, TransactionRecord
 from paymentservice.serializers import (
@@ -44,6 +47,7 @@ class ProcessPaymentRequestView(APIView):
     Handles approval or cancellation of a payment request by the requestee.
     """
     permission_classes = [IsAuthenticated, MethodPermission]
+    throttle_classes = [UserSlidingWindowThrottle, PaymentRateThrottle]
     serializer_class = TransferRequestActionSerializer
     serializer_response_class = TransactionRecordSerializer
 
@@ -143,6 +147,15 @@ class ProcessPaymentRequestView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        client_ip, _ = get_client_ip(self.request)
+        device_fingerprint = RiskEngine.device_key(self.request.META.get('HTTP_USER_AGENT'))
+        verdict = risk_engine.record_transfer(
+            sender=payment_request.requested_user_id,
+            recipient=payment_request.requesting_user_id,
+            ip=client_ip,
+            device=device_fingerprint,
+        )
+
         reference_id = ReferenceGenerator.payment_request_reference()
 
         requestee_wallet.balance -= (payment_request.amount + transaction_charge)
@@ -159,7 +172,10 @@ class ProcessPaymentRequestView(APIView):
             currency=payment_request.currency,
             reference_id=reference_id,
             transaction_charge=transaction_charge,
-            status=TransactionStatus.SUCCESS,
+            status=TransactionStatus.FLAGGED if verdict.flagged else TransactionStatus.SUCCESS,
+            fraud_checked=True,
+            ip_address=client_ip,
+            device_fingerprint=device_fingerprint,
             payment_provider=settings.APP_NAME,
         )
 
@@ -167,7 +183,7 @@ class ProcessPaymentRequestView(APIView):
         payment_request.action = RequestAction.APPROVE
         payment_request.save()
 
-        db_transaction.on_commit(lambda: notify_transaction_approval.delay(transaction_record.id))
+        enqueue(notify_transaction_approval, transaction_record.id)
 
         return Response(self.serializer_response_class(transaction_record).data, status=status.HTTP_201_CREATED)
 
@@ -184,6 +200,6 @@ class ProcessPaymentRequestView(APIView):
 
         payment_request.save()
 
-        db_transaction.on_commit(lambda: notify_transaction_cancellation.delay(payment_request.id))
+        enqueue(notify_transaction_cancellation, payment_request.id)
 
         return Response(self.serializer_class(payment_request).data, status=status.HTTP_201_CREATED)
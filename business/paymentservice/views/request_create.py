@@ -12,6 +12,7 @@ from rest_framework.views import APIView
 
 # Project-specific imports
 from common import ReferenceGenerator
+from outbox.services import enqueue
 from rbac.permissions import MethodPermission, register_permissions
 from walletservice import models as wallet_models
 from userservice.models import User
@@ -99,7 +100,7 @@ class RequestCreateView(APIView):
                         payment_provider=settings.APP_NAME,
                     )
 
-                db_transaction.on_commit(lambda: notify_transaction_request.delay(payment_request.id))
+                    enqueue(notify_transaction_request, payment_request.id)
 
                 return Response(self.serializer_response_class(payment_request).data, status=status.HTTP_201_CREATED)
 
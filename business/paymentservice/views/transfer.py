@@ -6,14 +6,17 @@ from decimal import Decimal
 from django.conf import settings
 from django.db import OperationalError, transaction as db_transaction
 from drf_spectacular.utils import extend_schema
+from ipware import get_client_ip
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 # Project-specific imports
-from common import ReferenceGenerator
+from common import ReferenceGenerator, UserSlidingWindowThrottle, PaymentRateThrottle
+from outbox.services import enqueue
 from rbac.permissions import MethodPermission, register_permissions
+from tracking.services import RiskEngine, risk_engine
 from walletservice import models as wallet_models
 from paymentservice.models import TransactionRecord
 from paymentservice.serializers import (
@@ -35,6 +38,7 @@ class TransferCreateView(APIView):
     Handles peer-to-peer (P2P) wallet transfers between users.
     """
     permission_classes = [IsAuthenticated, MethodPermission]
+    throttle_classes = [UserSlidingWindowThrottle, PaymentRateThrottle]
     serializer_class = InitiateP2PTransferSerializer
     serializer_response_class = TransactionRecordSerializer
 
@@ -94,6 +98,15 @@ class TransferCreateView(APIView):
             defaults={'is_default': False, 'balance': Decimal(0.00)},
         )
 
+        client_ip, _ = get_client_ip(request)
+        device_fingerprint = RiskEngine.device_key(request.META.get('HTTP_USER_AGENT'))
+        verdict = risk_engine.record_transfer(
+            sender=sender_user_id,
+            recipient=recipient_user_id,
+            ip=client_ip,
+            device=device_fingerprint,
+        )
+
         for attempt in range(MAX_RETRIES):
             try:
                 with db_transaction.atomic():
@@ -112,12 +125,15 @@ class TransferCreateView(APIView):
                         currency=sender_wallet.currency.code,
                         reference_id=reference_id,
                         transaction_charge=transaction_charge,
-                        status=TransactionStatus.SUCCESS,
+                        status=TransactionStatus.FLAGGED if verdict.flagged else TransactionStatus.SUCCESS,
+                        fraud_checked=True,
+                        ip_address=client_ip,
+                        device_fingerprint=device_fingerprint,
                         payment_provider=settings.APP_NAME,
                         reason=reason,
                     )
 
-                db_transaction.on_commit(lambda: notify_transaction_completion.delay(transaction_record.id))
+                    enqueue(notify_transaction_completion, transaction_record.id)
 
                 return Response(self.serializer_response_class(transaction_record).data, status=status.HTTP_201_CREATED)
 
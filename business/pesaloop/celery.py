@@ -6,6 +6,8 @@ from datetime import timedelta
 from celery import Celery
 from django.conf import settings
 
+from pesaloop.queues import QueueTiers
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pesaloop.settings')
 
 app = Celery('pesaloop')
@@ -14,6 +16,11 @@ app.conf.update(timezone='Africa/Nairobi')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks(lambda: settings.INSTALLED_APPS)
 
+queue_tiers = QueueTiers(settings.TASK_QUEUE_TIERS, settings.CELERY_TASK_DEFAULT_QUEUE)
+app.conf.task_queues = queue_tiers.queues()
+app.conf.task_routes = queue_tiers.routes()
+app.conf.task_annotations = (queue_tiers,)
+
 app.conf.beat_schedule = {
     # Data Encryption
     'data-encryption.rotate-key-monthly': {
@@ -23,9 +30,35 @@ app.conf.beat_schedule = {
 
     # AuthService
     'authservice.cleanup-expired-otps': {
-        'task': 'authservice.notifications.tasks.cleanup_expired_otps',
+        'task': 'authservice.notifications.tasks.otp_cleanup.cleanup_expired_otps',
         'schedule': timedelta(minutes=30),
     },
+    'authservice.cleanup-expired-tokens': {
+        'task': 'authservice.notifications.tasks.token_cleanup.cleanup_expired_tokens',
+        'schedule': timedelta(days=1),
+    },
+
+    # Outbox
+    'outbox.relay-events': {
+        'task': 'outbox.tasks.relay.relay_outbox_events',
+        'schedule': timedelta(seconds=5),
+    },
+    'outbox.purge-published-events-daily': {
+        'task': 'outbox.tasks.relay.purge_published_events',
+        'schedule': timedelta(days=1),
+    },
+
+    # RBAC
+    'rbac.expire-role-assignments': {
+        'task': 'rbac.tasks.expiry.expire_role_assignments',
+        'schedule': timedelta(minutes=5),
+    },
+
+    # Tracking
+    'tracking.enrich-pending-activities': {
+        'task': 'tracking.tasks.enrichment.enrich_pending_activities',
+        'schedule': timedelta(minutes=5),
+    },
 
     # CreditService
     'creditservice.disburse-loans-hourly': {
@@ -46,6 +79,22 @@ app.conf.beat_schedule = {
         'task': 'paymentservice.notifications.tasks.automated_reminders.send_queued_transaction_reminders',
         'schedule': timedelta(hours=17),
     },
+    'paymentservice.send-payment-digests-1m': {
+        'task': 'paymentservice.notifications.tasks.digest_task.send_payment_digests',
+        'schedule': timedelta(minutes=1),
+    },
+
+    # ForexService
+    'forexservice.purge-rate-snapshots-daily': {
+        'task': 'forexservice.notifications.tasks.snapshot_cleanup.purge_rate_snapshots',
+        'schedule': timedelta(days=1),
+    },
+
+    # Celery
+    'celery.purge-task-results-daily': {
+        'task': 'pesaloop.celery.purge_task_results',
+        'schedule': timedelta(days=1),
+    },
 
     # # FraudService
     # 'fraudservice.batch-fraud-analysis': {
@@ -61,3 +110,15 @@ app.conf.beat_schedule = {
 @app.task(bind=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
+
+
+@app.task
+def purge_task_results():
+    """Delete stored task results past the retention window, in bounded chunks."""
+    from django.utils import timezone
+    from django_celery_results.models import TaskResult
+    from common import PurgeSettings, purge_queryset
+
+    cutoff = timezone.now() - timedelta(days=PurgeSettings.CELERY_RESULT_DAYS)
+    deleted_count = purge_queryset(TaskResult.objects.filter(date_done__lt=cutoff))
+    return f"Deleted {deleted_count} task result(s)."
@@ -0,0 +1,47 @@
+from fnmatch import fnmatchcase
+
+from kombu import Queue
+
+
+class QueueTiers:
+    """
+    Declarative task routing into latency tiers, built from the TASK_QUEUE_TIERS setting.
+
+    Each tier is a queue with the task-name patterns routed to it and whether its tasks
+    keep results; the worker commands in the README set each tier's concurrency. Patterns
+    are globs matched in the order the tiers are declared; unmatched tasks go to the
+    default queue. The instance doubles as a Celery task annotation, so a tier's
+    ignore_result applies to every task routed there without touching the task itself.
+    """
+
+    def __init__(self, tiers, default_queue):
+        self.tiers = tiers
+        self.default_queue = default_queue
+
+    def routes(self):
+        """task_routes mapping every pattern to its tier's queue."""
+        return {
+            pattern: {'queue': name}
+            for name, tier in self.tiers.items()
+            for pattern in tier['tasks']
+        }
+
+    def queues(self):
+        """task_queues with one queue per tier, plus the default if it is not a tier."""
+        names = list(self.tiers)
+        if self.default_queue not in self.tiers:
+            names.append(self.default_queue)
+        return tuple(Queue(name, routing_key=name) for name in names)
+
+    def tier_for(self, task_name):
+        for name, tier in self.tiers.items():
+            if any(fnmatchcase(task_name, pattern) for pattern in tier['tasks']):
+                return name
+        return self.default_queue
+
+    def annotate(self, task):
+        """Celery annotation hook: fire-and-forget tiers store no result and no STARTED state."""
+        tier = self.tiers.get(self.tier_for(task.name))
+        if tier and tier.get('ignore_result'):
+            return {'ignore_result': True, 'track_started': False}
+        return None
@@ -131,6 +131,7 @@ INSTALLED_APPS = [
     'forexservice',
     'mediaservice',
     'mpesaservice',
+    'outbox',
     'paymentservice',
     'rbac',
     'reportingservice',
@@ -152,6 +153,7 @@ if DEBUG:
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'tracking.middleware.RequestTrackingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -190,6 +192,42 @@ else:
     }
 
 
+# ====================
+# CACHES
+# ====================
+
+# 'default' is shared by every gunicorn and Celery worker: Redis when CACHE_URL is set,
+# otherwise a SQLite file shared by the processes on this host. 'local' puts a small
+# in-process L1 in front of it for read-mostly data (common.cache.TieredCache).
+CACHE_URL = env('CACHE_URL', default='')
+
+if CACHE_URL:
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': CACHE_URL,
+    }
+else:
+    SHARED_CACHE = {
+        'BACKEND': 'common.cache.SQLiteCache',
+        'LOCATION': str(BASE_DIR / 'artifacts/cache.sqlite3'),
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    }
+
+CACHES = {
+    'default': {
+        **SHARED_CACHE,
+        'KEY_PREFIX': env('CACHE_KEY_PREFIX', default=APP_NAME.lower()),
+    },
+    'local': {
+        'BACKEND': 'common.cache.TieredCache',
+        'OPTIONS': {
+            'SHARED': 'default',
+            'L1_SIZE': env.int('CACHE_L1_SIZE', default=5000),
+            'L1_TIMEOUT': env.int('CACHE_L1_TIMEOUT', default=30),
+        },
+    },
+}
+
 # ====================
 # PASSWORD VALIDATION
 # ====================
@@ -208,7 +246,7 @@ AUTH_PASSWORD_VALIDATORS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authservice.services.CachedUserJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -217,8 +255,8 @@ REST_FRAMEWORK = {
         'rbac.permissions.BusinessHoursAccessPermission',
     ),
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'common.throttling.AnonSlidingWindowThrottle',
+        'common.throttling.UserSlidingWindowThrottle'
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/day',
@@ -226,6 +264,8 @@ REST_FRAMEWORK = {
         'sustained': '1000/hour',
         'user': '1000/day',
         'payment': '30/minute',
+        'login': '10/minute',
+        'otp': '5/minute',
     },
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
     'PAGE_SIZE': 100,
@@ -291,6 +331,55 @@ ACTIVITY_TRACKING = {
     'GEOLOCATION_TIMEOUT': 2,
     'SENSITIVE_FIELDS': ['password', 'token', 'secret', 'credit_card', 'cvv'],
     'DEFAULT_ACTIVITY_TYPE': 'OTHER',
+
+    # Sliding-window risk scoring (tracking.services.risk); limits are per window
+    'RISK': {
+        'LOGIN_WINDOW': 900,  # seconds
+        'TRANSFER_WINDOW': 3600,  # seconds
+        'FAILED_LOGINS_PER_USER': 5,
+        'FAILED_LOGINS_PER_IP': 20,
+        'FAILED_LOGINS_PER_DEVICE': 10,
+        'ACCOUNTS_PER_IP': 10,
+        'TRANSFERS_PER_USER': 10,
+        'TRANSFERS_PER_DEVICE': 20,
+        'RECIPIENTS_PER_USER': 5,
+        'SNAPSHOT_INTERVAL': 30,  # seconds
+    },
+
+    # Deferred enrichment (tracking.tasks.enrichment)
+    'ENRICHMENT_BATCH_SIZE': 500,  # distinct IPs per pass
+    'ENRICHMENT_MAX_IPS': 5000,  # distinct IPs per run
+
+    # Request-tracking middleware
+    'BUFFER_SIZE': 200,
+    'BUFFER_FLUSH_INTERVAL': 5,  # seconds
+    'DEFAULT_SAMPLE_RATE': 0.1,
+    'SAMPLE_RATES': {
+        '/api/tracking/': 0.0,
+        '/api/docs/': 0.0,
+        '/admin/': 0.0,
+        '/__debug__/': 0.0,
+    },
+    'ALWAYS_CAPTURE': [
+        '/api/auth/',
+        '/api/payments/',
+        '/api/wallets/',
+        '/api/forex/',
+        '/api/credits/',
+        '/api/mpesaservice/',
+    ],
+    'CAPTURE_SERVER_ERRORS': True,
+    'ROUTE_ACTIVITY_TYPES': {
+        '/api/auth/': 'AUTH',
+        '/api/auth/token/create/': 'LOGIN',
+        '/api/auth/token/logout/': 'LOGOUT',
+        '/api/payments/': 'PAY',
+        '/api/wallets/': 'PAY',
+        '/api/forex/': 'PAY',
+        '/api/credits/': 'PAY',
+        '/api/mpesaservice/': 'PAY',
+        '/api/rbac/': 'ADMIN',
+    },
 }
 
 
@@ -299,7 +388,7 @@ ACTIVITY_TRACKING = {
 # ====================
 
 # --- Core SMTP Settings ---
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+EMAIL_BACKEND = 'common.mail.PooledEmailBackend'
 EMAIL_HOST = env('EMAIL_HOST')
 EMAIL_PORT = env.int('EMAIL_PORT')
 EMAIL_USE_TLS = env.bool('EMAIL_USE_TLS', default=True)
@@ -308,10 +397,34 @@ EMAIL_TIMEOUT = env.int('EMAIL_TIMEOUT', default=300)
 EMAIL_HOST_USER = env('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD')
 
+# --- SMTP Connection Pool ---
+EMAIL_POOL = {
+    'SIZE': env.int('EMAIL_POOL_SIZE', default=4),
+    'MAX_IDLE': env.int('EMAIL_POOL_MAX_IDLE', default=60),
+    'RETRIES': env.int('EMAIL_POOL_RETRIES', default=3),
+    'BACKOFF': env.float('EMAIL_POOL_BACKOFF', default=0.5),
+}
+
 # --- Bulk Email Settings ---
 EMAIL_BATCH_SIZE = env.int('EMAIL_BATCH_SIZE', default=100)
 EMAIL_BATCH_DELAY = env.int('EMAIL_BATCH_DELAY', default=30)
 
+# --- Payment Reminders ---
+PAYMENT_REMINDERS = {
+    'DELAY_DAYS': env.int('PAYMENT_REMINDER_DELAY_DAYS', default=2),
+    'CADENCE_HOURS': env.int('PAYMENT_REMINDER_CADENCE_HOURS', default=48),
+    'BATCH_SIZE': EMAIL_BATCH_SIZE,
+    'BATCHES_PER_RUN': env.int('PAYMENT_REMINDER_BATCHES_PER_RUN', default=10),
+    'RUN_DELAY': EMAIL_BATCH_DELAY,
+}
+
+# --- Payment Notification Digests (users with use_digest) ---
+NOTIFICATION_DIGEST = {
+    'WINDOW_MINUTES': env.int('NOTIFICATION_DIGEST_WINDOW_MINUTES', default=15),
+    'MAX_ITEMS': env.int('NOTIFICATION_DIGEST_MAX_ITEMS', default=20),
+    'RECIPIENTS_PER_RUN': env.int('NOTIFICATION_DIGEST_RECIPIENTS_PER_RUN', default=500),
+}
+
 # --- Email Address Roles ---
 EMAIL_FROM_ALERTS = f"{APP_NAME} <{env('EMAIL_ALERTS')}>"
 EMAIL_SUPPORT = env('EMAIL_SUPPORT')
@@ -334,6 +447,81 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_BROKER_CONNECTION_MAX_RETRIES = 10
+CELERY_TASK_DEFAULT_QUEUE = 'transactional'
+CELERY_TASK_STORE_ERRORS_EVEN_IF_IGNORED = True
+
+# Latency tiers (pesaloop.queues.QueueTiers). Run one worker per tier, e.g.
+# `celery -A pesaloop worker -Q critical`; the tier's concurrency and prefetch apply
+# unless overridden on the command line. ignore_result tiers store no task results.
+TASK_QUEUE_TIERS = {
+    'critical': {
+        'tasks': [
+            'authservice.notifications.tasks.otp_tasks.*',
+            'authservice.notifications.tasks.password_tasks.*',
+        ],
+        'ignore_result': True,
+    },
+    'transactional': {
+        'tasks': [
+            'outbox.tasks.relay.relay_outbox_events',
+            'paymentservice.notifications.tasks.transaction_task.*',
+            'paymentservice.notifications.tasks.request_task.*',
+            'mpesaservice.notifications.tasks.*',
+            'forexservice.notifications.tasks.exchange.*',
+            'forexservice.notifications.tasks.wallet.*',
+            'authservice.notifications.tasks.wallet_tasks.*',
+            'userservice.notifications.tasks.*',
+        ],
+        'ignore_result': True,
+    },
+    'bulk': {
+        'tasks': [
+            'paymentservice.notifications.tasks.automated_reminders.*',
+            'paymentservice.notifications.tasks.digest_task.*',
+            'reportingservice.*',
+            'creditservice.*',
+            'data_encryption.*',
+            'rbac.tasks.*',
+            'outbox.tasks.relay.purge_published_events',
+            'authservice.notifications.tasks.otp_cleanup.*',
+            'authservice.notifications.tasks.token_cleanup.*',
+            'forexservice.notifications.tasks.snapshot_cleanup.*',
+            'pesaloop.celery.purge_task_results',
+        ],
+        'ignore_result': False,
+    },
+    'analytics': {
+        'tasks': [
+            'tracking.*',
+        ],
+        'ignore_result': True,
+    },
+}
+
+
+# ====================
+# OUTBOX
+# ====================
+
+OUTBOX = {
+    'BATCH_SIZE': 500,             # Events per relay pass
+    'MAX_BATCHES': 20,             # Passes per relay run
+    'MAX_ATTEMPTS': 10,            # Publish attempts before an event is parked
+    'POLL_INTERVAL': 1,            # Seconds between passes of run_outbox_relay --loop
+    'RETENTION_DAYS': 7,           # Days published events are kept
+}
+
+
+# ====================
+# DATA RETENTION
+# ====================
+
+DATA_RETENTION = {
+    'CHUNK_SIZE': 1000,            # Rows per DELETE (common.purge_queryset)
+    'CHUNK_PAUSE': 0.1,            # Seconds between chunks
+    'RATE_SNAPSHOT_DAYS': 30,
+    'CELERY_RESULT_DAYS': 7,
+}
 
 
 # ====================
@@ -358,6 +546,15 @@ TWILIO_ACCOUNT_SID = env('TWILIO_ACCOUNT_SID')
 TWILIO_AUTH_TOKEN = env('TWILIO_AUTH_TOKEN')
 TWILIO_SMS_FROM = env('TWILIO_SMS_FROM')
 
+# SMS gateway ('fake' records messages in memory instead of sending them)
+SMS_GATEWAY = {
+    'PROVIDER': env('SMS_PROVIDER', default='twilio'),
+    'MAX_WORKERS': env.int('SMS_MAX_WORKERS', default=8),
+    'TIMEOUT': env.int('SMS_TIMEOUT', default=10),
+    'MAX_RETRIES': env.int('SMS_MAX_RETRIES', default=2),
+    'FAKE_LATENCY': env.float('SMS_FAKE_LATENCY', default=0.0),
+}
+
 # Exchange Rates API
 EXCHANGE_API_URL = env('EXCHANGE_API_URL')
 EXCHANGE_API_KEY = env('EXCHANGE_API_KEY')
@@ -443,7 +640,7 @@ SPECTACULAR_SETTINGS = {
     'COMPONENT_SPLIT_REQUEST': True,
     'SORT_OPERATIONS': False,
     'AUTHENTICATION_WHITELIST': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authservice.services.CachedUserJWTAuthentication',
     ],
     'ENUM_NAME_OVERRIDES': {},
     'POSTPROCESSING_HOOKS': [
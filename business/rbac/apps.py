@@ -7,5 +7,4 @@ class RBACConfig(AppConfig):
     def ready(self):
         # Import signal handlers only
         import rbac.signals.handlers
-        import rbac.signals.auto_assign_default_role
         import rbac.signals.create_default_role
@@ -23,6 +23,12 @@ class UserRole(BaseModel):
         indexes = [
             models.Index(fields=['user', 'is_active']),
             models.Index(fields=['expires_at']),
+            # Only assignments the expiry sweep still has to visit
+            models.Index(
+                fields=['expires_at'],
+                condition=models.Q(is_active=True, expires_at__isnull=False),
+                name='user_role_active_expiry_idx'
+            ),
         ]
 
     def __str__(self):
@@ -1,8 +1,9 @@
 from rest_framework import permissions
-from django.core.cache import caches
 from django.utils import timezone
 import logging
 
+from rbac.services.caching import permission_cache
+from rbac.services.engine import get_user_mask, has_permission
 from rbac.utils import CacheSettings
 
 logger = logging.getLogger('security')
@@ -12,38 +13,22 @@ class BaseAccessPermission(permissions.BasePermission):
     CACHE_KEY_PREFIX = CacheSettings.CACHE_KEY_PREFIX
 
     def get_required_permission(self, request, view):
-        print(f"Determining required permission for view: {view.__class__.__name__}")
-        method = request.method.upper()
-        if hasattr(view, f"{method}_permission"):
-            print(f"Using {method}_permission attribute for view: {view.__class__.__name__}")
-            return getattr(view, f"{method}_permission", None)
-        if hasattr(view, 'required_permission'):
-            print(f"Using required_permission attribute for view: {view.__class__.__name__}")
-            return getattr(view, 'required_permission', None)
-        return getattr(view, f"{method}_permission", None) or getattr(view, 'required_permission', None)
+        method = request.method.lower()
+        return (
+            getattr(view, f"{method}_permission", None)
+            or getattr(view, f"{method.upper()}_permission", None)
+            or getattr(view, 'required_permission', None)
+        )
 
     def get_user_permissions(self, user):
-        cache = caches['default']
-        cache_key = f"{self.CACHE_KEY_PREFIX}{user.id}"
+        """The user's effective permissions as a bitmask (see PermissionMetadataRegistry)."""
+        return get_user_mask(user)
 
-        if cached_perms := cache.get(cache_key):
-            return cached_perms
+    def has_required_permission(self, user, codename, method):
+        return has_permission(user, codename, method)
 
-        perms = set(
-            user.roles.filter(is_active=True)
-            .prefetch_related('role__permissions__permission')
-            .values_list('role__permissions__permission__codename', 
-                       'role__permissions__permission__method')
-        )
-        
-        formatted_perms = {f"{codename}.{method}" for codename, method in perms if codename}
-        cache.set(cache_key, formatted_perms, self.PERMISSION_CACHE_TIMEOUT)
-        return formatted_perms
-    
     def clear_permission_cache(self, user):
-        cache = caches['default']
-        cache_key = f"{self.CACHE_KEY_PREFIX}{user.id}"
-        cache.delete(cache_key)
+        permission_cache.bump_user(user.id)
 
     def log_access_attempt(self, request, permission, granted):
         logger.info(
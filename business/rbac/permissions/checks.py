@@ -1,4 +1,5 @@
 from django.utils import timezone
+from rbac.services.metadata import permission_metadata
 from .base import BaseAccessPermission
 
 
@@ -7,22 +8,11 @@ class MethodPermission(BaseAccessPermission):
         if request.user.is_superuser:
             return True
 
-        view_permission = f"{request.method.lower()}_permission"
-        required_permission = getattr(view, view_permission, None)
-        if not required_permission:
-            required_permission = getattr(view, 'required_permission', None)
-
+        required_permission = self.get_required_permission(request, view)
         if not required_permission:
             return False
 
-        user_perms = self.get_user_permissions(request.user)
-
-        has_access = (
-            f"{required_permission}.{request.method.upper()}" in user_perms or
-            f"{required_permission}.ALL" in user_perms
-        )
-
-        return has_access
+        return self.has_required_permission(request.user, required_permission, request.method.upper())
 
 
 class SensitiveOperationPermission(BaseAccessPermission):
@@ -31,12 +21,7 @@ class SensitiveOperationPermission(BaseAccessPermission):
         if not required_permission:
             return False
 
-        from rbac.models import Permission
-        is_sensitive = Permission.objects.filter(
-            codename=required_permission,
-            method__in=[request.method.upper(), 'ALL'],
-            is_sensitive=True
-        ).exists()
+        is_sensitive = permission_metadata.is_sensitive(required_permission, request.method.upper())
 
         if is_sensitive and not request.user.biometric_auth_enabled:
             self.log_access_attempt(request, required_permission, False)
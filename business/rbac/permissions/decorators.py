@@ -1,4 +1,3 @@
-import sys
 from functools import wraps
 from django.core.exceptions import PermissionDenied
 from rbac.services import register_view_permissions
@@ -31,8 +30,5 @@ def register_permissions(cls):
             get_permission = 'view_thing'
             ...
     """
-    if 'makemigrations' in sys.argv or 'migrate' in sys.argv:
-        return cls  # Skip registration during DB setup
-
-    register_view_permissions(cls)
+    register_view_permissions(cls)  # Manifest only; rows are synced by post_migrate / register_permissions
     return cls
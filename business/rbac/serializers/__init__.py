@@ -2,12 +2,16 @@ from .rbac import (
     PermissionSerializer,
     RoleSerializer,
     UserRoleSerializer,
-    RolePermissionSerializer
+    RolePermissionSerializer,
+    BulkRoleUsersSerializer,
+    BulkRolePermissionsSerializer
 )
 
 __all__ = [
     'PermissionSerializer',
     'RoleSerializer',
     'UserRoleSerializer',
-    'RolePermissionSerializer'
+    'RolePermissionSerializer',
+    'BulkRoleUsersSerializer',
+    'BulkRolePermissionsSerializer'
 ]
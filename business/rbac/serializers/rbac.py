@@ -84,3 +84,12 @@ class UserRoleSerializer(serializers.ModelSerializer):
 
     def get_role_count(self, obj):
         return UserRole.objects.filter(user=obj.user).count()
+
+
+class BulkRoleUsersSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=100000)
+    expires_at = serializers.DateTimeField(required=False, allow_null=True)
+
+
+class BulkRolePermissionsSerializer(serializers.Serializer):
+    permission_ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
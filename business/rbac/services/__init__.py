@@ -1,13 +1,24 @@
 # rbac/services/__init__.py
-from .caching import clear_permission_cache
-from .permission_registry import register_permissions, register_view_permissions
+from .caching import PermissionCache, clear_permission_cache, permission_cache
+from .metadata import PermissionMetadataRegistry, PermissionMeta, permission_metadata
+from .engine import get_user_mask, has_permission, load_user_mask
+from .permission_registry import register_permissions, register_view_permissions, sync_permissions
 from .validation import validate_role_assignment
 from .assignment import RoleAssignmentService
 
 __all__ = [
+    'PermissionMeta',
+    'PermissionCache',
+    'PermissionMetadataRegistry',
     'RoleAssignmentService',
     'clear_permission_cache',
+    'get_user_mask',
+    'has_permission',
+    'load_user_mask',
+    'permission_cache',
+    'permission_metadata',
     'register_permissions',
     'register_view_permissions',
+    'sync_permissions',
     'validate_role_assignment'
 ]
\ No newline at end of file
@@ -1,8 +1,29 @@
+import time
+from functools import partial
+from itertools import islice
+
 from django.core.exceptions import PermissionDenied
-from rbac.models import Role, UserRole
+from django.db import transaction
+from django.utils import timezone
+from rbac.models import Permission, Role, RolePermission, UserRole
 from rbac.services import clear_permission_cache
+from rbac.services.caching import permission_cache
+from rbac.services.metadata import permission_metadata
+from rbac.utils import CacheSettings
+from userservice.models import User
+
+BULK_BATCH_SIZE = 1000
+
+
+def _batches(items, size=BULK_BATCH_SIZE):
+    items = iter(items)
+    while batch := list(islice(items, size)):
+        yield batch
 
 class RoleAssignmentService:
+    # (default role id, monotonic time it was read); see get_default_role_id
+    _default_role = None
+
     @classmethod
     def assign_role(cls, user, role, assigned_by=None, expires_at=None):
         if assigned_by and not cls.can_assign_role(assigned_by, role):
@@ -20,6 +41,180 @@ class RoleAssignmentService:
         clear_permission_cache(user)
         return True
 
+    @classmethod
+    def get_default_role_id(cls):
+        """
+        Id of the role flagged is_default, or None. Read from the database at most every
+        DEFAULT_ROLE_CHECK_INTERVAL seconds per process; Role changes here reset it immediately.
+        """
+        cached = cls._default_role
+        if cached is None or time.monotonic() - cached[1] >= CacheSettings.DEFAULT_ROLE_CHECK_INTERVAL:
+            role_id = Role.objects.filter(is_default=True).values_list('id', flat=True).first()
+            cached = cls._default_role = (role_id, time.monotonic())
+        return cached[0]
+
+    @classmethod
+    def reset_default_role(cls):
+        cls._default_role = None
+
+    @classmethod
+    def assign_default_role(cls, user):
+        """
+        Give a newly created user the default role with a single insert.
+        Called by the registration flows; existing users are backfilled by the assign_default_roles command.
+        """
+        role_id = cls.get_default_role_id()
+        if role_id is None:
+            return False
+
+        UserRole.objects.create(user=user, role_id=role_id)
+        return True
+
+    @classmethod
+    def backfill_default_role(cls, batch_size=BULK_BATCH_SIZE):
+        """
+        Assign the default role to every user without an active role, in bulk.
+        Users who already have a row for the default role, e.g. expired or revoked,
+        are left as they are.
+        """
+        role_id = cls.get_default_role_id()
+        if role_id is None:
+            return None
+
+        user_ids = (
+            User.objects
+            .exclude(id__in=UserRole.objects.filter(is_active=True).values('user_id'))
+            .exclude(id__in=UserRole.objects.filter(role_id=role_id).values('user_id'))
+            .values_list('id', flat=True)
+        )
+
+        assigned = 0
+        for batch in _batches(user_ids.iterator(chunk_size=batch_size), batch_size):
+            UserRole.objects.bulk_create(
+                [UserRole(user_id=user_id, role_id=role_id) for user_id in batch],
+                ignore_conflicts=True,
+            )
+            assigned += len(batch)
+            # bulk_create skips signals
+            transaction.on_commit(partial(permission_cache.bump_users, batch))
+        return {'assigned': assigned}
+
+    @classmethod
+    def bulk_assign_role(cls, role, user_ids, assigned_by=None, expires_at=None):
+        """
+        Assign a role to many users: one existence query, one insert and one
+        reactivation UPDATE per batch, then a single cache round trip.
+        Unknown user ids are skipped.
+        """
+        if assigned_by and not cls.can_assign_role(assigned_by, role):
+            raise PermissionDenied("You cannot assign this role")
+
+        assigned = reactivated = 0
+        affected = []
+
+        with transaction.atomic():
+            for batch in _batches(set(user_ids)):
+                valid_ids = set(User.objects.filter(id__in=batch).values_list('id', flat=True))
+                existing = dict(
+                    UserRole.objects.filter(role=role, user_id__in=valid_ids).values_list('user_id', 'is_active')
+                )
+
+                new_ids = valid_ids - existing.keys()
+                UserRole.objects.bulk_create(
+                    [
+                        UserRole(user_id=user_id, role=role, assigned_by=assigned_by, expires_at=expires_at)
+                        for user_id in new_ids
+                    ],
+                    ignore_conflicts=True,
+                )
+                inactive_ids = [user_id for user_id, is_active in existing.items() if not is_active]
+                reactivated += UserRole.objects.filter(role=role, user_id__in=inactive_ids).update(
+                    is_active=True, assigned_by=assigned_by, expires_at=expires_at
+                )
+
+                assigned += len(new_ids)
+                affected.extend(new_ids)
+                affected.extend(inactive_ids)
+
+        # bulk_create and update() skip signals
+        transaction.on_commit(lambda: permission_cache.bump_users(affected))
+        return {'assigned': assigned, 'reactivated': reactivated}
+
+    @classmethod
+    def bulk_revoke_role(cls, role, user_ids, revoked_by=None):
+        """Deactivate a role for many users with one UPDATE per batch."""
+        if revoked_by and not cls.can_assign_role(revoked_by, role):
+            raise PermissionDenied("You cannot revoke this role")
+
+        user_ids = set(user_ids)
+        revoked = 0
+        with transaction.atomic():
+            for batch in _batches(user_ids):
+                revoked += UserRole.objects.filter(role=role, user_id__in=batch, is_active=True).update(is_active=False)
+
+        transaction.on_commit(lambda: permission_cache.bump_users(user_ids))
+        return {'revoked': revoked}
+
+    @classmethod
+    def bulk_grant_permissions(cls, role, permission_ids, granted_by=None):
+        """Add permissions to a role; its members are invalidated with one role generation bump."""
+        valid_ids = set(Permission.objects.filter(id__in=set(permission_ids)).values_list('id', flat=True))
+        existing = set(
+            RolePermission.objects.filter(role=role, permission_id__in=valid_ids).values_list('permission_id', flat=True)
+        )
+        new_ids = valid_ids - existing
+
+        RolePermission.objects.bulk_create(
+            [RolePermission(role=role, permission_id=permission_id, granted_by=granted_by) for permission_id in new_ids],
+            ignore_conflicts=True,
+        )
+        cls._role_changed(role)
+        return {'granted': len(new_ids)}
+
+    @classmethod
+    def bulk_revoke_permissions(cls, role, permission_ids):
+        """
+        Remove permissions from a role in one transaction. Each row still sends post_delete,
+        so the audit trail records it; the handlers invalidate the role once, on commit.
+        """
+        with transaction.atomic():
+            revoked, _ = RolePermission.objects.filter(role=role, permission_id__in=set(permission_ids)).delete()
+        return {'revoked': revoked}
+
+    @classmethod
+    def expire_assignments(cls, batch_size=BULK_BATCH_SIZE, now=None):
+        """
+        Deactivate assignments whose expires_at has passed, one indexed batch at a time,
+        and invalidate the affected users with one cache write per batch.
+        """
+        now = now or timezone.now()
+        expired = UserRole.objects.filter(is_active=True, expires_at__isnull=False, expires_at__lte=now)
+        total = 0
+
+        while True:
+            rows = list(expired.order_by('expires_at').values_list('id', 'user_id')[:batch_size])
+            if not rows:
+                break
+
+            total += UserRole.objects.filter(id__in=[row_id for row_id, _ in rows], is_active=True).update(is_active=False)
+            transaction.on_commit(partial(permission_cache.bump_users, {user_id for _, user_id in rows}))
+
+            if len(rows) < batch_size:
+                break
+
+        return {'expired': total}
+
+    @staticmethod
+    def _role_changed(role):
+        role_id = role.pk
+
+        def invalidate():
+            # Recompile role masks first so members rebuilt on the new generation see the change
+            permission_metadata.invalidate()
+            permission_cache.bump_role(role_id)
+
+        transaction.on_commit(invalidate)
+
     @classmethod
     def can_assign_role(cls, assigning_user, role):
         if assigning_user.is_superuser:
@@ -1,7 +1,140 @@
+import threading
+import time
+from collections import OrderedDict
+
 from django.core.cache import caches
+
 from rbac.utils import CacheSettings
 
+
+class PermissionCache:
+    """
+    Two-tier cache for a user's effective permissions.
+
+    Entries are keyed by (user id, scope, global generation, user generation), first in a
+    process-local LRU and then in the shared cache. Each entry also records the generation
+    of every role it was built from, so a role change invalidates that role's members
+    without touching their keys. Changes never delete entries; they bump a generation so
+    the next lookup misses. Generation values are read from the shared cache at most every
+    GENERATION_CHECK_INTERVAL seconds; bumps made in this process apply immediately.
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size or CacheSettings.LOCAL_CACHE_SIZE
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches['default']
+
+    def get(self, user_id, loader, scope=None):
+        """
+        Return the cached permissions for user_id.
+        On a miss in both tiers, loader() is called and must return (value, role_ids).
+        """
+        global_key, user_key = CacheSettings.GLOBAL_GENERATION_KEY, self._user_key(user_id)
+        gens = self._read_generations([global_key, user_key])
+        key = (user_id, scope, gens[global_key], gens[user_key])
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        shared_key = f"{CacheSettings.CACHE_KEY_PREFIX}{user_id}:{scope}:{gens[global_key]}:{gens[user_key]}"
+        if entry is None:
+            entry = self.cache.get(shared_key)
+
+        if entry is None or not self._roles_current(entry[1]):
+            value, role_ids = loader()
+            role_keys = [self._role_key(role_id) for role_id in role_ids]
+            role_gens = self._read_generations(role_keys)
+            entry = (value, tuple((role_key, role_gens[role_key]) for role_key in role_keys))
+            self.cache.set(shared_key, entry, CacheSettings.PERMISSION_CACHE_TIMEOUT)
+
+        with self._lock:
+            self._entries[key] = entry
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry[0]
+
+    def bump_user(self, user_id):
+        """Invalidate one user's permissions everywhere."""
+        self._bump(self._user_key(user_id))
+
+    def bump_users(self, user_ids):
+        """Invalidate many users in one round trip by giving each a fresh generation."""
+        gens = {self._user_key(user_id): time.time_ns() for user_id in user_ids}
+        if not gens:
+            return
+        self.cache.set_many(gens, None)
+        now = time.monotonic()
+        with self._lock:
+            for key, gen in gens.items():
+                self._generations[key] = (gen, now)
+
+    def bump_role(self, role_id):
+        """Invalidate every user holding this role, whatever their number."""
+        self._bump(self._role_key(role_id))
+
+    def bump_global(self):
+        """Invalidate every user's permissions, e.g. after a permission change."""
+        self._bump(CacheSettings.GLOBAL_GENERATION_KEY)
+
+    def _user_key(self, user_id):
+        return f"{CacheSettings.USER_GENERATION_PREFIX}{user_id}"
+
+    def _role_key(self, role_id):
+        return f"{CacheSettings.ROLE_GENERATION_PREFIX}{role_id}"
+
+    def _roles_current(self, role_gens):
+        if not role_gens:
+            return True
+        current = self._read_generations([role_key for role_key, _ in role_gens])
+        return all(current[role_key] == gen for role_key, gen in role_gens)
+
+    def _read_generations(self, keys):
+        now = time.monotonic()
+        gens = {}
+
+        with self._lock:
+            for key in keys:
+                entry = self._generations.get(key)
+                if entry and now - entry[1] < CacheSettings.GENERATION_CHECK_INTERVAL:
+                    gens[key] = entry[0]
+
+        missing = [key for key in keys if key not in gens]
+        if missing:
+            values = self.cache.get_many(missing)
+            for key in missing:
+                gens[key] = values[key] if key in values else self._seed(key)
+            with self._lock:
+                if len(self._generations) > self.max_size:
+                    self._generations.clear()
+                for key in missing:
+                    self._generations[key] = (gens[key], now)
+
+        return gens
+
+    def _seed(self, key):
+        # Start from a timestamp rather than 0 so an evicted counter never repeats an old value
+        self.cache.add(key, time.time_ns(), None)
+        return self.cache.get(key)
+
+    def _bump(self, key):
+        try:
+            gen = self.cache.incr(key)
+        except ValueError:
+            self._seed(key)
+            gen = self.cache.incr(key)
+        with self._lock:
+            self._generations[key] = (gen, time.monotonic())
+
+
+permission_cache = PermissionCache()
+
+
 def clear_permission_cache(user):
-    cache = caches['default']
-    cache_key = f"{CacheSettings.CACHE_KEY_PREFIX}{user.id}"
-    cache.delete(cache_key)
+    permission_cache.bump_user(user.id)
@@ -0,0 +1,50 @@
+import time
+
+from django.db.models import Q
+from django.utils import timezone
+
+from rbac.services.caching import permission_cache
+from rbac.services.metadata import permission_metadata
+
+
+def load_user_mask(user):
+    """
+    Load a user's active, unexpired roles. Returns ((mask, expiring), role_ids): mask covers the
+    roles without an expiry, expiring holds (expires_ts, role_id) pairs for the rest.
+    """
+    # Role masks may have just changed; never cache a mask built from a stale registry
+    permission_metadata.refresh()
+    assignments = user.roles.filter(is_active=True).filter(
+        Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now())
+    ).values_list('role_id', 'expires_at')
+
+    permanent, expiring = [], []
+    for role_id, expires_at in assignments:
+        if expires_at is None:
+            permanent.append(role_id)
+        else:
+            expiring.append((expires_at.timestamp(), role_id))
+
+    role_ids = permanent + [role_id for _, role_id in expiring]
+    return (permission_metadata.mask_for_roles(permanent), tuple(sorted(expiring))), role_ids
+
+
+def get_user_mask(user):
+    """
+    Effective permission bitmask for a user. The bit layout is part of the key, so masks from
+    different layouts never mix. Expiring roles are re-checked against the clock on every call,
+    so an assignment stops granting access the moment it expires, before the sweep deactivates it.
+    """
+    mask, expiring = permission_cache.get(user.id, lambda: load_user_mask(user), scope=permission_metadata.layout)
+    if expiring:
+        now = time.time()
+        mask |= permission_metadata.mask_for_roles([role_id for expires_ts, role_id in expiring if expires_ts > now])
+    return mask
+
+
+def has_permission(user, codename, method='ALL'):
+    if user.is_superuser:
+        return True
+    if not isinstance(method, str):
+        method = 'ALL'
+    return bool(get_user_mask(user) & permission_metadata.check_mask(codename, method.upper()))
@@ -0,0 +1,123 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+from django.core.cache import caches
+
+from rbac.utils import CacheSettings
+
+PermissionMeta = namedtuple('PermissionMeta', ['id', 'bit', 'is_sensitive', 'category'])
+
+
+class PermissionMetadataRegistry:
+    """
+    In-process, compiled view of the Permission and RolePermission tables.
+
+    Each (codename, method) gets a bit position at load time, in creation order, and
+    every role gets the bitmask of its permissions, so permission checks are single
+    AND operations. The registry loads on first use and reloads when the shared
+    version stamp changes; the stamp is checked at most once every
+    METADATA_CHECK_INTERVAL seconds.
+    """
+
+    def __init__(self):
+        self._entries = None
+        self._role_masks = {}
+        self._check_masks = {}
+        self._layout = None
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, codename, method):
+        return self.entries.get((codename, method))
+
+    def is_sensitive(self, codename, method):
+        entries = self.entries
+        return any(
+            meta.is_sensitive
+            for meta in (entries.get((codename, method)), entries.get((codename, 'ALL')))
+            if meta
+        )
+
+    def check_mask(self, codename, method):
+        """Bits that grant (codename, method): the method's own bit plus the codename's ALL bit."""
+        entries = self.entries
+        key = (codename, method)
+        mask = self._check_masks.get(key)
+        if mask is None:
+            mask = 0
+            for meta in (entries.get(key), entries.get((codename, 'ALL'))):
+                if meta:
+                    mask |= 1 << meta.bit
+            self._check_masks[key] = mask
+        return mask
+
+    def mask_for_roles(self, role_ids):
+        """OR of the given roles' precomputed permission masks."""
+        self.entries
+        mask = 0
+        for role_id in role_ids:
+            mask |= self._role_masks.get(role_id, 0)
+        return mask
+
+    @property
+    def layout(self):
+        """Digest of the bit assignment. Only changes when Permission rows are added or removed."""
+        self.entries
+        return self._layout
+
+    @property
+    def entries(self):
+        now = time.monotonic()
+        if self._entries is None or now - self._checked_at >= CacheSettings.METADATA_CHECK_INTERVAL:
+            self.refresh(now)
+        return self._entries
+
+    def refresh(self, now=None):
+        """Check the version stamp now, ignoring METADATA_CHECK_INTERVAL, and reload if it moved."""
+        with self._lock:
+            version = self._current_version()
+            if self._entries is None or version != self._version:
+                self._entries, self._role_masks, self._layout = self._load()
+                self._check_masks = {}
+                self._version = version
+            self._checked_at = now or time.monotonic()
+
+    def invalidate(self):
+        """Publish a new version stamp and drop this process's copy."""
+        caches['default'].set(CacheSettings.METADATA_VERSION_KEY, uuid.uuid4().hex, None)
+        self._entries = None
+
+    def _current_version(self):
+        cache = caches['default']
+        # A missing stamp (first start or eviction) gets a fresh token, so every process reloads
+        cache.add(CacheSettings.METADATA_VERSION_KEY, uuid.uuid4().hex, None)
+        return cache.get(CacheSettings.METADATA_VERSION_KEY)
+
+    def _load(self):
+        from rbac.models import Permission, RolePermission
+
+        rows = Permission.objects.order_by('created_at', 'id').values_list(
+            'id', 'codename', 'method', 'is_sensitive', 'category'
+        )
+        entries = {}
+        bits = {}
+        layout = hashlib.md5()
+        for bit, (pk, codename, method, is_sensitive, category) in enumerate(rows):
+            entries[(codename, method)] = PermissionMeta(
+                id=pk, bit=bit, is_sensitive=is_sensitive, category=category
+            )
+            bits[pk] = bit
+            layout.update(pk.bytes)
+
+        role_masks = {}
+        for role_id, permission_id in RolePermission.objects.values_list('role_id', 'permission_id'):
+            role_masks[role_id] = role_masks.get(role_id, 0) | (1 << bits[permission_id])
+
+        return entries, role_masks, layout.hexdigest()
+
+
+permission_metadata = PermissionMetadataRegistry()
@@ -1,14 +1,20 @@
 from django.apps import apps
+from django.db import transaction
 from django.urls import get_resolver
 from django.db.models.signals import post_migrate
 from django.dispatch import receiver
 
 from rbac.models import Permission
 
-def register_model_permissions(model):
+# View classes recorded by @register_permissions. Importing a view never touches the database;
+# rows are created by sync_permissions() from post_migrate or the register_permissions command.
+_view_manifest = []
+
+
+def model_permission_specs(model):
     basename = getattr(model, 'permission_basename', None)
     if not basename:
-        return
+        return []
 
     permissions = [
         ('view', 'GET'),
@@ -19,66 +25,48 @@ def register_model_permissions(model):
         ('all', 'ALL')
     ]
 
-    for perm_name, method in permissions:
-        codename = f"{basename}_{perm_name}"
-        Permission.objects.get_or_create(
-            codename=codename,
-            method=method,
-            defaults={
-                'name': f"{perm_name.capitalize()} {model._meta.verbose_name}",
-                'category': Permission.Category.SYSTEM,
-                'description': (
-                    f"Grants the ability to perform the HTTP {method.upper()} operation "
-                    f"({perm_name}) on the {model._meta.verbose_name} model. "
-                    f"This includes access to API endpoints or logic that supports this action."
-                ),
-            }
-        )
+    return [
+        (f"{basename}_{perm_name}", method, {
+            'name': f"{perm_name.capitalize()} {model._meta.verbose_name}",
+            'category': Permission.Category.SYSTEM,
+            'description': (
+                f"Grants the ability to perform the HTTP {method.upper()} operation "
+                f"({perm_name}) on the {model._meta.verbose_name} model. "
+                f"This includes access to API endpoints or logic that supports this action."
+            ),
+        })
+        for perm_name, method in permissions
+    ]
 
-def register_view_permissions(view_class):
-    """Automatically register permissions for a view class across all apps"""
-    
-    model_name = None
-    model_verbose_name = None
-    
-    # Method 1: Check for queryset attribute (DRF ModelViewSet)
-    if hasattr(view_class, 'queryset') and view_class.queryset is not None:
-        model = view_class.queryset.model
+
+def _view_model(view_class):
+    """Resolve the model behind a view from class attributes only; views are never instantiated."""
+    queryset = getattr(view_class, 'queryset', None)
+    if queryset is not None:
+        return queryset.model
+
+    serializer_class = getattr(view_class, 'serializer_class', None)
+    model = getattr(getattr(serializer_class, 'Meta', None), 'model', None)
+    if model is not None:
+        return model
+
+    class_name = view_class.__name__.lower()
+    if class_name.endswith('viewset'):
+        potential_model = class_name[:-7]  # Remove 'viewset'
+        for model in apps.get_models():
+            if model._meta.model_name == potential_model:
+                return model
+    return None
+
+
+def view_permission_specs(view_class):
+    specs = []
+    model = _view_model(view_class)
+
+    # Default CRUD permissions if we found a model
+    if model is not None:
         model_name = model._meta.model_name
         model_verbose_name = model._meta.verbose_name.lower()
-    
-    # Method 2: Check for get_queryset method
-    elif hasattr(view_class, 'get_queryset'):
-        try:
-            model = view_class().get_queryset().model
-            model_name = model._meta.model_name
-            model_verbose_name = model._meta.verbose_name.lower()
-        except:
-            pass
-    
-    # Method 3: Check for serializer_class (DRF views)
-    elif hasattr(view_class, 'serializer_class'):
-        try:
-            model = view_class.serializer_class.Meta.model
-            model_name = model._meta.model_name
-            model_verbose_name = model._meta.verbose_name.lower()
-        except:
-            pass
-    
-    # Method 4: Parse from view class name
-    if model_name is None:
-        class_name = view_class.__name__.lower()
-        if class_name.endswith('viewset'):
-            potential_model = class_name[:-7]  # Remove 'viewset'
-            # Verify if this matches an actual model
-            for model in apps.get_models():
-                if model._meta.model_name == potential_model:
-                    model_name = potential_model
-                    model_verbose_name = model._meta.verbose_name.lower()
-                    break
-    
-    # Register default CRUD permissions if we found a model
-    if model_name:
         default_permissions = {
             'get': 'view',
             'post': 'add',
@@ -86,73 +74,106 @@ def register_view_permissions(view_class):
             'patch': 'change',
             'delete': 'delete',
         }
-        
+
         for method, perm_type in default_permissions.items():
-            permission_codename = f"{perm_type}_{model_name}"
-            
-            # Check for explicit permission definition first
-            explicit_perm = getattr(view_class, f"{method}_permission", None)
-            if explicit_perm:
-                permission_codename = explicit_perm
-            
-            Permission.objects.get_or_create(
-                codename=permission_codename,
-                method=method.upper(),
-                defaults={
-                    'name': f"{perm_type.capitalize()} {model_verbose_name or model_name}",
-                    'category': Permission.Category.SYSTEM,
-                    'description': (
-                        f"Grants access to perform the {perm_type.upper()} operation via HTTP "
-                        f"{method.upper()} method on endpoints related to {model_verbose_name or model_name}. "
-                        "Typically used in ViewSets or API views to restrict access by action."
-                    ),
-                }
-            )
-    
-    # Register any explicitly defined permissions that weren't covered by CRUD
+            # Explicit permission definition wins over the CRUD codename
+            permission_codename = getattr(view_class, f"{method}_permission", None) or f"{perm_type}_{model_name}"
+            specs.append((permission_codename, method.upper(), {
+                'name': f"{perm_type.capitalize()} {model_verbose_name or model_name}",
+                'category': Permission.Category.SYSTEM,
+                'description': (
+                    f"Grants access to perform the {perm_type.upper()} operation via HTTP "
+                    f"{method.upper()} method on endpoints related to {model_verbose_name or model_name}. "
+                    "Typically used in ViewSets or API views to restrict access by action."
+                ),
+            }))
+
+    # Explicitly defined permissions that weren't covered by CRUD
     for method in ['get', 'post', 'put', 'patch', 'delete']:
         if perm_codename := getattr(view_class, f"{method}_permission", None):
-            Permission.objects.get_or_create(
-                codename=perm_codename,
-                method=method.upper(),
-                defaults={
-                    'name': f"{method.upper()} access: {perm_codename.replace('_', ' ').capitalize()}",
-                    'category': Permission.Category.SYSTEM,
-                    'description': (
-                        f"Grants explicit permission to perform the {method.upper()} operation defined "
-                        f"by `{perm_codename}`. Intended for custom actions or overrides outside standard CRUD."
-                    ),
-                }
-            )
+            specs.append((perm_codename, method.upper(), {
+                'name': f"{method.upper()} access: {perm_codename.replace('_', ' ').capitalize()}",
+                'category': Permission.Category.SYSTEM,
+                'description': (
+                    f"Grants explicit permission to perform the {method.upper()} operation defined "
+                    f"by `{perm_codename}`. Intended for custom actions or overrides outside standard CRUD."
+                ),
+            }))
+
+    return specs
+
+
+def register_view_permissions(view_class):
+    """Record a view class in the manifest. No database access."""
+    if view_class not in _view_manifest:
+        _view_manifest.append(view_class)
+
 
 def scan_url_permissions(resolver):
-    """Scan URL patterns and register permissions for all views"""
+    """Record every class-based view reachable from the URLconf"""
     for pattern in resolver.url_patterns:
         if hasattr(pattern, 'url_patterns'):
             scan_url_permissions(pattern)
         elif hasattr(pattern, 'callback'):
             process_view_permissions(pattern.callback)
 
+
 def process_view_permissions(view):
-    """Process a single view to register permissions"""
-    if hasattr(view, 'view_class'):
-        register_view_permissions(view.view_class)
-    elif hasattr(view, 'cls'):
-        register_view_permissions(view.cls)
-    elif hasattr(view, '__name__') and view.__name__ == 'view':
-        try:
-            register_view_permissions(view.view_class)
-        except:
-            pass
+    """Record a single URL callback's view class"""
+    view_class = getattr(view, 'view_class', None) or getattr(view, 'cls', None)
+    if view_class is not None:
+        register_view_permissions(view_class)
 
-@receiver(post_migrate)
-def register_permissions(sender, **kwargs):
-    """Main registration function that ties everything together"""
-    # Register model permissions
+
+def collect_permission_specs():
+    """Every (codename, method) the project declares, with the defaults for creating it."""
+    # Walking the URLconf imports every view module, which fills the manifest
+    scan_url_permissions(get_resolver())
+
+    specs = {}
     for app_config in apps.get_app_configs():
         for model in app_config.get_models():
-            if hasattr(model, 'permission_basename'):
-                register_model_permissions(model)
+            for codename, method, defaults in model_permission_specs(model):
+                specs.setdefault((codename, method), defaults)
 
-    # Register view permissions from URLs
-    scan_url_permissions(get_resolver())
+    for view_class in _view_manifest:
+        for codename, method, defaults in view_permission_specs(view_class):
+            specs.setdefault((codename, method), defaults)
+
+    return specs
+
+
+def sync_permissions():
+    """
+    Create missing Permission rows with one diff query and one bulk insert.
+    Returns the number of rows created.
+    """
+    from rbac.services.caching import permission_cache
+    from rbac.services.metadata import permission_metadata
+
+    specs = collect_permission_specs()
+    existing = set(Permission.objects.values_list('codename', 'method'))
+
+    missing = [
+        Permission(codename=codename, method=method, **defaults)
+        for (codename, method), defaults in specs.items()
+        if (codename, method) not in existing
+    ]
+    if not missing:
+        return 0
+
+    Permission.objects.bulk_create(missing, ignore_conflicts=True)
+    # bulk_create skips post_save, so invalidate the compiled registry here, once committed
+    def invalidate():
+        permission_metadata.invalidate()
+        permission_cache.bump_global()
+
+    transaction.on_commit(invalidate)
+    return len(missing)
+
+
+@receiver(post_migrate)
+def register_permissions(sender, **kwargs):
+    """Sync declared permissions once per migrate run"""
+    if sender.name == 'rbac':
+        sync_permissions()
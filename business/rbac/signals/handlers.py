@@ -19,26 +19,81 @@
 #         clear_permission_cache(user_role.user)
 
 
-from django.db.models.signals import post_migrate, post_save
+import threading
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from rbac.models import Permission
-from rbac.services.permission_registry import register_view_permissions
-from django.urls import get_resolver
+from rbac.models import Permission, Role, RolePermission, UserRole
+from rbac.services.assignment import RoleAssignmentService
+from rbac.services.caching import permission_cache
+from rbac.services.metadata import permission_metadata
+
+
+# Invalidation waits for the commit, so no process can rebuild from rows that are not
+# visible yet. The registry is always invalidated before the generation bump, so a
+# process that misses on the new generation rebuilds from fresh role masks.
+
+_runs = threading.local()
+
+
+def _on_commit_once(key, func):
+    """
+    Run func after commit, once per key however many rows of the transaction scheduled it.
+    Deferred callbacks only run at the outermost commit, so a run recorded for key on this
+    thread after scheduling can only have come from this same commit.
+    """
+    counts = _runs.__dict__.setdefault('counts', {})
+    scheduled = counts.get(key, 0)
+
+    def run():
+        if counts.get(key, 0) == scheduled:
+            counts[key] = scheduled + 1
+            func()
+
+    transaction.on_commit(run)
+
 
+def _global_changed():
+    permission_metadata.invalidate()
+    permission_cache.bump_global()
 
-@receiver(post_migrate)
-def handle_post_migrate(sender, **kwargs):
-    """Re-register permissions after migrations"""
-    if sender.name == 'rbac':
-        resolver = get_resolver()
-        for url_pattern in resolver.url_patterns:
-            if hasattr(url_pattern, 'callback') and hasattr(url_pattern.callback, 'view_class'):
-                register_view_permissions(url_pattern.callback.view_class)
+
+def _role_changed(role_id):
+    permission_metadata.invalidate()
+    permission_cache.bump_role(role_id)
 
 
 @receiver(post_save, sender=Permission)
-def update_permission_cache(sender, instance, **kwargs):
-    """Clear relevant permission caches when permissions change"""
-    from rbac.services import clear_permission_cache
-    for user_role in instance.role_assignments.all():
-        clear_permission_cache(user_role.user)
+@receiver(post_delete, sender=Permission)
+def update_permission_cache(sender, **kwargs):
+    """Permission changes can affect any user, so move everyone to a new generation"""
+    _on_commit_once('global', _global_changed)
+
+
+@receiver(post_delete, sender=Role)
+def update_role_permission_cache(sender, instance, **kwargs):
+    """A removed role stops granting anything to its members"""
+    RoleAssignmentService.reset_default_role()
+    role_id = instance.pk
+    _on_commit_once(('role', role_id), lambda: _role_changed(role_id))
+
+
+@receiver(post_save, sender=Role)
+def reset_default_role(sender, **kwargs):
+    """The default role may have moved; re-read it on next registration"""
+    RoleAssignmentService.reset_default_role()
+
+
+@receiver(post_save, sender=RolePermission)
+@receiver(post_delete, sender=RolePermission)
+def update_role_members_permission_cache(sender, instance, **kwargs):
+    """Role grants only affect the role's members"""
+    _on_commit_once(('role', instance.role_id), lambda: _role_changed(instance.role_id))
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def update_user_permission_cache(sender, instance, **kwargs):
+    """Assignment changes only affect the assigned user"""
+    _on_commit_once(('user', instance.user_id), lambda: permission_cache.bump_user(instance.user_id))
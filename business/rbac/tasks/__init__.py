@@ -0,0 +1,3 @@
+from .expiry import expire_role_assignments
+
+__all__ = ['expire_role_assignments']
@@ -0,0 +1,19 @@
+import logging
+from celery import shared_task
+
+from rbac.services import RoleAssignmentService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def expire_role_assignments(self):
+    """
+    Periodic task that deactivates role assignments past their expires_at
+    and invalidates the cached permissions of the affected users.
+    """
+    try:
+        return RoleAssignmentService.expire_assignments()
+    except Exception as exc:
+        logger.error("Role assignment expiry failed: %s", str(exc), exc_info=True)
+        raise self.retry(exc=exc)
@@ -8,7 +8,5 @@ def check_permission(user, codename, method='ALL'):
     """
     Helper function to check permissions in views or templates
     """
-    if user.is_superuser:
-        return True
-    perm_string = get_permission_string(codename, method)
-    return perm_string in user.get_all_permissions()
+    from rbac.services import has_permission
+    return has_permission(user, codename, method)
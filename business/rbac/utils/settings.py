@@ -5,3 +5,13 @@ class CacheSettings:
     """
     PERMISSION_CACHE_TIMEOUT = 300
     CACHE_KEY_PREFIX = 'user_perms_'
+    LOCAL_CACHE_SIZE = 10000           # Entries in the per-process LRU
+    GLOBAL_GENERATION_KEY = 'rbac_perm_gen'
+    USER_GENERATION_PREFIX = 'rbac_user_perm_gen_'
+    ROLE_GENERATION_PREFIX = 'rbac_role_perm_gen_'
+    GENERATION_CHECK_INTERVAL = 1      # Seconds a process trusts its copy of a generation
+    DEFAULT_ROLE_CHECK_INTERVAL = 60   # Seconds a process trusts its cached default role id
+
+    # In-process permission metadata (rbac.services.metadata)
+    METADATA_VERSION_KEY = 'rbac_permission_metadata_version'
+    METADATA_CHECK_INTERVAL = 5  # Seconds between version stamp checks
@@ -1,3 +1,4 @@
+from django.core.exceptions import PermissionDenied
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
@@ -5,9 +6,10 @@ from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
-from rbac.models import Role, RolePermission
+from rbac.models import Role
 from rbac.permissions import MethodPermission, register_permissions
-from rbac.serializers import RoleSerializer
+from rbac.serializers import RoleSerializer, BulkRoleUsersSerializer, BulkRolePermissionsSerializer
+from rbac.services import RoleAssignmentService
 from .mixins import AuditMixin
 
 
@@ -95,12 +97,91 @@ class RoleViewSet(AuditMixin, ModelViewSet):
             is_default=False
         )
 
-        for rp in role.permissions.all():
-            RolePermission.objects.create(
-                role=new_role,
-                permission=rp.permission,
-                granted_by=request.user
-            )
+        RoleAssignmentService.bulk_grant_permissions(
+            new_role,
+            role.permissions.values_list('permission_id', flat=True),
+            granted_by=request.user
+        )
 
         serializer = self.get_serializer(new_role)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def _bulk_action(self, request, serializer_class, permission, method, operation):
+        # Checked against the verb the codename is registered under, not the action's POST
+        if not request.user.has_perm(permission, method):
+            return Response(
+                {"message": f"You need the '{permission}' permission to perform this action."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = operation(self.get_object(), serializer.validated_data)
+        except PermissionDenied as e:
+            return Response({"message": str(e)}, status=status.HTTP_403_FORBIDDEN)
+
+        return Response(result, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        tags=["RBAC - Roles"],
+        operation_id="Bulk Assign Role",
+        description="Assign this role to many users at once. Existing inactive assignments are reactivated.",
+        request=BulkRoleUsersSerializer,
+        responses={status.HTTP_200_OK: {"type": "object", "properties": {
+            "assigned": {"type": "integer"}, "reactivated": {"type": "integer"}
+        }}}
+    )
+    @action(detail=True, methods=["post"], url_path="assign-users", permission_classes=[IsAuthenticated, MethodPermission])
+    def assign_users(self, request, pk=None):
+        return self._bulk_action(
+            request, BulkRoleUsersSerializer, 'add_userrole', 'POST',
+            lambda role, data: RoleAssignmentService.bulk_assign_role(
+                role, data['user_ids'], assigned_by=request.user, expires_at=data.get('expires_at')
+            )
+        )
+
+    @extend_schema(
+        tags=["RBAC - Roles"],
+        operation_id="Bulk Revoke Role",
+        description="Deactivate this role for many users at once.",
+        request=BulkRoleUsersSerializer,
+        responses={status.HTTP_200_OK: {"type": "object", "properties": {"revoked": {"type": "integer"}}}}
+    )
+    @action(detail=True, methods=["post"], url_path="revoke-users", permission_classes=[IsAuthenticated, MethodPermission])
+    def revoke_users(self, request, pk=None):
+        return self._bulk_action(
+            request, BulkRoleUsersSerializer, 'change_userrole', 'PUT',
+            lambda role, data: RoleAssignmentService.bulk_revoke_role(role, data['user_ids'], revoked_by=request.user)
+        )
+
+    @extend_schema(
+        tags=["RBAC - Roles"],
+        operation_id="Bulk Grant Role Permissions",
+        description="Add many permissions to this role at once.",
+        request=BulkRolePermissionsSerializer,
+        responses={status.HTTP_200_OK: {"type": "object", "properties": {"granted": {"type": "integer"}}}}
+    )
+    @action(detail=True, methods=["post"], url_path="grant-permissions", permission_classes=[IsAuthenticated, MethodPermission])
+    def grant_permissions(self, request, pk=None):
+        return self._bulk_action(
+            request, BulkRolePermissionsSerializer, 'add_rolepermission', 'POST',
+            lambda role, data: RoleAssignmentService.bulk_grant_permissions(
+                role, data['permission_ids'], granted_by=request.user
+            )
+        )
+
+    @extend_schema(
+        tags=["RBAC - Roles"],
+        operation_id="Bulk Revoke Role Permissions",
+        description="Remove many permissions from this role at once.",
+        request=BulkRolePermissionsSerializer,
+        responses={status.HTTP_200_OK: {"type": "object", "properties": {"revoked": {"type": "integer"}}}}
+    )
+    @action(detail=True, methods=["post"], url_path="revoke-permissions", permission_classes=[IsAuthenticated, MethodPermission])
+    def revoke_permissions(self, request, pk=None):
+        return self._bulk_action(
+            request, BulkRolePermissionsSerializer, 'delete_rolepermission', 'DELETE',
+            lambda role, data: RoleAssignmentService.bulk_revoke_permissions(role, data['permission_ids'])
+        )
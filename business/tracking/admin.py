@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from .models import Activity
+from .services import search_activities
 
 @admin.register(Activity)
 class ActivityAdmin(admin.ModelAdmin):
@@ -32,6 +33,12 @@ class ActivityAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_search_results(self, request, queryset, search_term):
+        # Use the indexed search document rather than icontains over search_fields
+        if not search_term:
+            return queryset, False
+        return search_activities(queryset, search_term.split()), False
+
     def user_email(self, obj):
         return obj.user.email if obj.user else ''
     user_email.short_description = 'User Email'
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from tracking.models import Activity
+
+
+class Command(BaseCommand):
+    help = 'Rebuild Activity.search_document for existing rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        # Only what build_search_document() reads, not the headers/params JSON or the full user row
+        activities = Activity.objects.select_related('user').only(
+            'user__email', 'ip_address', 'endpoint', 'device', 'browser', 'tags', 'user_agent', 'city',
+        ).order_by()
+
+        batch = []
+        count = 0
+        for activity in activities.iterator(chunk_size=batch_size):
+            activity.search_document = activity.build_search_document()
+            batch.append(activity)
+            if len(batch) >= batch_size:
+                count += Activity.objects.bulk_update(batch, ['search_document'])
+                batch = []
+
+        if batch:
+            count += Activity.objects.bulk_update(batch, ['search_document'])
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search documents for {count} activities."))
@@ -0,0 +1,3 @@
+from .request_tracking import RequestTrackingMiddleware
+
+__all__ = ['RequestTrackingMiddleware']
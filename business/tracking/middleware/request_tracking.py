@@ -0,0 +1,100 @@
+import logging
+import random
+import time
+
+from django.db import connection
+
+from tracking.services import ActivityTracker, activity_buffer
+from tracking.utils import ActivityType, TrackingSettings
+
+
+logger = logging.getLogger(__name__)
+
+class QueryTimer:
+    """Database execute wrapper that accumulates query count and time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+class RequestTrackingMiddleware:
+    """
+    Times every request and records a sample of them as activities.
+
+    Wall-clock and database time are always measured and returned in the
+    `X-Response-Time` (seconds) and `Server-Timing` headers. Whether the request
+    is persisted depends on per-route sample rates; routes listed in
+    ALWAYS_CAPTURE (auth and money movement) and server errors are always kept.
+    Captured activities go to the buffered writer without any network lookups.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # Longest prefix first so specific routes override broad ones
+        self.sample_rates = sorted(TrackingSettings.SAMPLE_RATES.items(), key=lambda item: -len(item[0]))
+        self.activity_types = sorted(TrackingSettings.ROUTE_ACTIVITY_TYPES.items(), key=lambda item: -len(item[0]))
+
+    def __call__(self, request):
+        timer = QueryTimer()
+        started = time.perf_counter()
+
+        with connection.execute_wrapper(timer):
+            response = self.get_response(request)
+
+        duration = time.perf_counter() - started
+        self._set_timing_headers(response, duration, timer)
+
+        if self._should_capture(request, response):
+            self._capture(request, response, duration)
+
+        return response
+
+    def _set_timing_headers(self, response, duration, timer):
+        response.headers['X-Response-Time'] = f"{duration:.6f}"
+        response.headers['Server-Timing'] = (
+            f'app;dur={duration * 1000:.2f}, '
+            f'db;dur={timer.duration * 1000:.2f};desc="{timer.count} queries"'
+        )
+
+    def _should_capture(self, request, response):
+        if getattr(request, '_activity_tracked', False):
+            return False
+
+        path = request.path
+        if path.startswith(TrackingSettings.ALWAYS_CAPTURE):
+            return True
+        if TrackingSettings.CAPTURE_SERVER_ERRORS and response.status_code >= 500:
+            return True
+
+        return random.random() < self._sample_rate(path)
+
+    def _sample_rate(self, path):
+        for prefix, rate in self.sample_rates:
+            if path.startswith(prefix):
+                return rate
+        return TrackingSettings.DEFAULT_SAMPLE_RATE
+
+    def _activity_type(self, request, response):
+        if response.status_code >= 500:
+            return ActivityType.ERROR
+        for prefix, activity_type in self.activity_types:
+            if request.path.startswith(prefix):
+                return activity_type
+        return ActivityType.API_CALL
+
+    def _capture(self, request, response, duration):
+        try:
+            tracker = ActivityTracker(request, response, TrackingSettings.SENSITIVE_FIELDS, duration=duration)
+            activity = tracker.build(activity_type=self._activity_type(request, response))
+            activity_buffer.add(activity)
+        except Exception as e:
+            logger.error(f"Request tracking failed: {str(e)}", exc_info=True)
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+def mark_existing_enriched(apps, schema_editor):
+    """Rows logged before enrichment was deferred were enriched inline; keep them out of the sweep."""
+    Activity = apps.get_model('tracking', 'Activity')
+    Activity.objects.filter(enriched_at__isnull=True).update(enriched_at=models.F('timestamp'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracking', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activity',
+            name='enriched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_existing_enriched, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(condition=models.Q(('enriched_at__isnull', True)), fields=['ip_address'], name='tracking_ac_pending_enrich_idx'),
+        ),
+    ]
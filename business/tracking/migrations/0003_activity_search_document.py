@@ -0,0 +1,29 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+# Postgres only: the tracking schema relies on ArrayField, so no other backend can run it
+FORWARD = [
+    "CREATE INDEX IF NOT EXISTS tracking_ac_search_trgm_idx "
+    "ON tracking_activity USING gin (search_document gin_trgm_ops)",
+]
+BACKWARD = [
+    "DROP INDEX IF EXISTS tracking_ac_search_trgm_idx",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracking', '0002_activity_enriched_at'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='activity',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunSQL(FORWARD, BACKWARD),
+    ]
@@ -51,6 +51,10 @@ class Activity(models.Model):
     # ASN Context
     asn = models.CharField(max_length=50, blank=True)
     isp = models.CharField(max_length=100, blank=True)
+    enriched_at = models.DateTimeField(null=True, blank=True)  # Set by ActivityEnricher
+
+    # Search (see build_search_document)
+    search_document = models.TextField(blank=True, default='', editable=False)
 
     # Device Context
     device = models.CharField(max_length=50, blank=True)
@@ -70,6 +74,11 @@ class Activity(models.Model):
             models.Index(fields=['ip_address', '-timestamp']),
             models.Index(fields=['type', '-timestamp']),
             models.Index(fields=['-timestamp', 'status']),
+            models.Index(
+                fields=['ip_address'],
+                condition=models.Q(enriched_at__isnull=True),
+                name='tracking_ac_pending_enrich_idx',
+            ),
         ]
 
     def clean(self):
@@ -83,6 +92,27 @@ class Activity(models.Model):
         if not isinstance(self.params, dict):
             self.params = {}
 
+    def save(self, *args, **kwargs):
+        self.search_document = self.build_search_document()
+        super().save(*args, **kwargs)
+
+    def build_search_document(self):
+        """
+        Lower-cased text matched by ActivitySearchFilter.
+        City goes last so the enrichment job can append it with a set-based UPDATE.
+        """
+        parts = [
+            self.user.email if self.user_id else '',
+            str(self.ip_address or ''),
+            self.endpoint,
+            self.device,
+            self.browser,
+            ' '.join(self.tags or []),
+            self.user_agent,
+            self.city,
+        ]
+        return ' '.join(part for part in parts if part).lower()
+
     def __str__(self):
         return f"{self.get_type_display()} @ {self.timestamp}"
 
@@ -10,7 +10,7 @@ class ActivitySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Activity
-        fields = '__all__'
+        exclude = ('search_document',)
         read_only_fields = ('id', 'timestamp')
         extra_kwargs = {
             'ip_address': {'required': True},
@@ -1,4 +1,13 @@
+from .buffer import ActivityBuffer, activity_buffer
 from .decorators import track_activity
+from .enrichment import ActivityEnricher
+from .ip_resolver import IPResolver
+from .risk import RiskEngine, RiskVerdict, risk_engine
+from .search import search_activities
 from .tracker import ActivityTracker
 
-__all__ = ['track_activity', 'ActivityTracker']
\ No newline at end of file
+__all__ = [
+    'ActivityBuffer', 'activity_buffer', 'track_activity', 'ActivityTracker',
+    'ActivityEnricher', 'IPResolver', 'search_activities',
+    'RiskEngine', 'RiskVerdict', 'risk_engine',
+]
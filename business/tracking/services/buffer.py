@@ -0,0 +1,86 @@
+import atexit
+import logging
+import os
+import threading
+import time
+
+from django.db import close_old_connections
+
+from tracking.utils import TrackingSettings
+
+
+logger = logging.getLogger(__name__)
+
+class ActivityBuffer:
+    """
+    Process-local write buffer for activities.
+    Rows are collected in memory and persisted with a single bulk insert by a
+    background thread, every flush interval or as soon as the buffer is full, so
+    no request ever pays for the write and a quiet worker still flushes on time.
+    """
+
+    def __init__(self, max_size=TrackingSettings.BUFFER_SIZE, flush_interval=TrackingSettings.BUFFER_FLUSH_INTERVAL):
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self._items = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._full = threading.Event()
+        self._flusher_pid = None
+
+    def add(self, activity):
+        """Queue an unsaved Activity instance; a full buffer wakes the flusher."""
+        self._ensure_flusher()
+        with self._lock:
+            self._items.append(activity)
+            full = len(self._items) >= self.max_size
+
+        if full:
+            self._full.set()
+
+    def _ensure_flusher(self):
+        # Started lazily and per process, since threads do not survive a pre-fork
+        if self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+        threading.Thread(target=self._run_flusher, name='activity-buffer', daemon=True).start()
+
+    def _run_flusher(self):
+        while True:
+            self._full.wait(max(self.flush_interval - (time.monotonic() - self._last_flush), 0))
+            self._full.clear()
+            # This thread outlives any request, so drop a connection that is broken or past its age
+            close_old_connections()
+            self.flush()
+
+    def flush(self):
+        """Persist everything currently buffered. Returns the number of rows written."""
+        with self._lock:
+            batch, self._items = self._items, []
+            self._last_flush = time.monotonic()
+
+        if not batch:
+            return 0
+
+        from tracking.models import Activity
+
+        try:
+            # bulk_create skips save(), so fill the search document here
+            for activity in batch:
+                activity.search_document = activity.build_search_document()
+            Activity.objects.bulk_create(batch, batch_size=self.max_size)
+            logger.debug(f"Flushed {len(batch)} buffered activities")
+            return len(batch)
+        except Exception as e:
+            logger.error(f"Failed to flush {len(batch)} buffered activities: {str(e)}", exc_info=True)
+            return 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+activity_buffer = ActivityBuffer()
+atexit.register(activity_buffer.flush)
@@ -1,4 +1,5 @@
 import logging
+import time
 from functools import wraps
 
 from celery import shared_task
@@ -25,6 +26,7 @@ def track_activity_async(
     user_agent=None,
     ip_address=None,
     request_data=None,
+    duration=None,
 ):
     """
     Background task to track activity asynchronously.
@@ -46,9 +48,10 @@ def track_activity_async(
                 request.user = None
 
         response = HttpResponse(status=status_code or 200)
-        response.headers["X-Response-Time"] = "0.1"
+        if duration is not None:
+            response.headers["X-Response-Time"] = f"{duration:.6f}"
 
-        tracker = ActivityTracker(request, response, sensitive_fields)
+        tracker = ActivityTracker(request, response, sensitive_fields, duration=duration)
         tracker.capture(activity_type=activity_type)
 
     except Exception as exc:
@@ -67,9 +70,14 @@ def track_activity(activity_type=ActivityType.OTHER, async_mode=False, sensitive
             ip, _ = get_client_ip(request)
             ip_address = ip or "0.0.0.0"
 
+            # Tell RequestTrackingMiddleware this request is already accounted for
+            setattr(getattr(request, "_request", request), "_activity_tracked", True)
+
             response = None
+            started = time.perf_counter()
             try:
                 response = view_func(view_or_request, *args, **kwargs)
+                duration = time.perf_counter() - started
 
                 if async_mode:
                     track_activity_async.delay(
@@ -82,9 +90,10 @@ def track_activity(activity_type=ActivityType.OTHER, async_mode=False, sensitive
                         user_agent=request.META.get("HTTP_USER_AGENT", ""),
                         ip_address=ip_address,
                         request_data=getattr(request, "data", None),
+                        duration=duration,
                     )
                 else:
-                    tracker = ActivityTracker(request, response, sensitive_fields)
+                    tracker = ActivityTracker(request, response, sensitive_fields, duration=duration)
                     tracker.capture(activity_type=activity_type)
 
                 return response
@@ -0,0 +1,94 @@
+import logging
+from django.db.models import F, TextField, Value
+from django.db.models.functions import Concat
+from django.utils import timezone
+
+from common import cache_namespace
+from tracking.utils import TrackingSettings
+from .ip_resolver import IPResolver
+
+logger = logging.getLogger(__name__)
+
+# Failed lookups per IP, so an IP that never resolves is eventually let go
+attempts = cache_namespace('enrichment_attempts')
+ATTEMPTS_TTL = 86400
+
+
+class ActivityEnricher:
+    """
+    Enriches raw activities in bulk.
+    Pending rows are grouped by ip_address; each distinct IP is resolved once and
+    the result is written to all of its rows with a single UPDATE. Rows whose lookup
+    fails stay pending for the next run, up to ENRICHMENT_MAX_ATTEMPTS runs per IP.
+    """
+
+    def __init__(self, batch_size=None, resolver=None):
+        self.batch_size = batch_size or TrackingSettings.ENRICHMENT_BATCH_SIZE
+        self.resolver = resolver or IPResolver()
+
+    def pending(self):
+        from tracking.models import Activity
+        return Activity.objects.filter(enriched_at__isnull=True)
+
+    def pending_ips(self, limit, skip=()):
+        # order_by() drops the model's default ordering so DISTINCT applies to ip_address alone
+        return list(
+            self.pending()
+            .exclude(ip_address__in=skip)
+            .order_by()
+            .values_list('ip_address', flat=True)
+            .distinct()[:limit]
+        )
+
+    def enrich_ip(self, ip):
+        """
+        Resolve one IP and apply it to every pending activity from that IP.
+        Returns the rows updated, or None if the lookup failed and the rows were left pending.
+        """
+        fields = self.resolver.resolve(ip)
+        if fields is None:
+            return None
+        if fields.get('city'):
+            # Activity.build_search_document() keeps city as the trailing term
+            fields['search_document'] = Concat(F('search_document'), Value(f" {fields['city'].lower()}"), output_field=TextField())
+        return self.pending().filter(ip_address=ip).update(enriched_at=timezone.now(), **fields)
+
+    def run(self, max_ips=None):
+        """
+        Enrich pending activities, stopping after max_ips distinct IPs.
+        Returns a summary of IPs resolved and rows updated.
+        """
+        max_ips = max_ips or TrackingSettings.ENRICHMENT_MAX_IPS
+        resolved = updated = 0
+        failed = []
+
+        while resolved < max_ips:
+            ips = self.pending_ips(min(self.batch_size, max_ips - resolved), skip=failed)
+            if not ips:
+                break
+
+            for ip in ips:
+                try:
+                    count = self.enrich_ip(ip)
+                except Exception as e:
+                    logger.error(f"Failed to enrich activities for {ip}: {str(e)}", exc_info=True)
+                    count = None
+                if count is None:
+                    failed.append(ip)
+                    updated += self._give_up_after_attempts(ip)
+                else:
+                    updated += count
+                resolved += 1
+
+        logger.info(f"Enriched {updated} activities across {resolved} distinct IPs, {len(failed)} failed")
+        return {'ips': resolved, 'activities': updated, 'failed': len(failed)}
+
+    def _give_up_after_attempts(self, ip):
+        """Count a failed run for ip; once it reaches the limit, mark its rows enriched without data."""
+        attempts.add(ip, 0, ATTEMPTS_TTL)
+        if attempts.incr(ip) < TrackingSettings.ENRICHMENT_MAX_ATTEMPTS:
+            return 0
+
+        logger.warning(f"Giving up on enriching activities for {ip} after {TrackingSettings.ENRICHMENT_MAX_ATTEMPTS} attempts")
+        attempts.delete(ip)
+        return self.pending().filter(ip_address=ip).update(enriched_at=timezone.now())
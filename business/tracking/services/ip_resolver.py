@@ -0,0 +1,189 @@
+import logging
+import requests
+from ipaddress import ip_address as validate_ip
+from common import cache_namespace
+
+from tracking.utils import TrackingSettings
+
+
+logger = logging.getLogger(__name__)
+
+# Lookups are immutable per IP, so an in-process L1 in front of the shared cache is safe
+cache = cache_namespace('ip', alias='local')
+
+class IPResolver:
+    """
+    Resolves network, geolocation and ASN details for a single IP address.
+    Used by the enrichment job, so lookups happen once per distinct IP, never per request.
+    """
+
+    CLOUD_PROVIDERS = [
+        'aws', 'google', 'azure', 'cloudflare', 'digitalocean',
+        'linode', 'heroku', 'rackspace', 'alibaba', 'oraclecloud'
+    ]
+
+    VPN_ASNS = ['AS60068', 'AS49666', 'AS60781']  # Example VPN ASNs
+    TOR_EXIT_NODES_URL = "https://check.torproject.org/torbulkexitlist"
+
+    def __init__(self):
+        self._tor_exit_nodes = None
+
+    @property
+    def tor_exit_nodes(self):
+        """Tor exit node list, fetched at most once per resolver."""
+        if self._tor_exit_nodes is None:
+            self._tor_exit_nodes = self._load_tor_exit_nodes()
+        return self._tor_exit_nodes
+
+    def _load_tor_exit_nodes(self):
+        """Load and cache Tor exit nodes list."""
+        cache_key = 'tor_exit_nodes'
+        nodes = cache.get(cache_key)
+
+        if nodes is None:
+            try:
+                response = requests.get(self.TOR_EXIT_NODES_URL, timeout=5)
+                if response.status_code == 200:
+                    nodes = set(response.text.splitlines())
+                    cache.set(cache_key, nodes, 3600)  # Cache for 1 hour
+                    logger.info(f"Loaded {len(nodes)} Tor exit nodes")
+                else:
+                    logger.warning(f"Failed to fetch Tor exit nodes: HTTP {response.status_code}")
+                    nodes = set()
+            except Exception as e:
+                logger.error(f"Error loading Tor exit nodes: {str(e)}")
+                nodes = set()
+        return nodes
+
+    def resolve(self, ip):
+        """
+        Return the enrichment fields for an IP, ready to be applied with QuerySet.update().
+        Invalid or missing IPs resolve to an empty dict; None means the lookup failed and
+        should be retried later.
+        """
+        if not ip or ip == '0.0.0.0':
+            return {}
+
+        geo_data = self._get_geo_data(ip)
+        if geo_data is None:
+            return None
+        asn_data = self._get_asn_data(ip, geo_data)
+
+        # update() skips model validation, so clip to the column lengths here
+        return {
+            'country': geo_data.get('country', '')[:2],
+            'region': geo_data.get('region', '')[:100],
+            'city': geo_data.get('city', '')[:100],
+            'coordinates': geo_data.get('coordinates', '')[:50],
+            'asn': asn_data.get('asn', '')[:50],
+            'isp': asn_data.get('isp', '')[:100],
+            'is_cloud': self._is_cloud_ip(ip),
+            'is_vpn': asn_data.get('asn') in self.VPN_ASNS,
+            'is_tor': self._is_tor_exit_node(ip),
+        }
+
+    def _is_cloud_ip(self, ip):
+        """Check if IP belongs to a cloud provider."""
+        try:
+            hostname = validate_ip(ip).reverse_pointer
+            logger.debug(f"Reverse DNS lookup for {ip}: {hostname}")
+
+            is_cloud = any(
+                provider in hostname.lower()
+                for provider in self.CLOUD_PROVIDERS
+            )
+
+            if is_cloud:
+                logger.info(f"IP {ip} identified as cloud provider")
+            return is_cloud
+        except ValueError:
+            logger.debug(f"IP {ip} is not valid for reverse lookup")
+            return False
+
+    def _is_tor_exit_node(self, ip):
+        """Check if IP is a Tor exit node."""
+        if ip in self.tor_exit_nodes:
+            logger.info(f"IP {ip} identified as Tor exit node")
+            return True
+        return False
+
+    def _get_geo_data(self, ip):
+        """Get geolocation data using ipinfo.io, cached for a day. None if the lookup failed."""
+        if TrackingSettings.DISABLE_GEOLOCATION:
+            logger.debug("Geolocation lookup disabled by settings")
+            return {}
+
+        cache_key = f'geoip_{ip}'
+        cached_data = cache.get(cache_key)
+
+        if cached_data:
+            logger.debug(f"Using cached geolocation data for {ip}")
+            return cached_data
+
+        geo_data = self._get_geolocation(ip)
+        if geo_data:
+            cache.set(cache_key, geo_data, 86400)  # Cache for 1 day
+        return geo_data
+
+    def _get_geolocation(self, ip):
+        """Accurate geolocation implementation using ipinfo.io."""
+        try:
+            logger.debug(f"Fetching geolocation data from ipinfo.io for {ip}")
+            response = requests.get(
+                f"https://ipinfo.io/{ip}/json",
+                timeout=TrackingSettings.GEOLOCATION_TIMEOUT
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            logger.debug(f"Received geolocation data: {data}")
+
+            return {
+                "country": data.get("country", ""),
+                "region": data.get("region", ""),
+                "city": data.get("city", ""),
+                "coordinates": data.get("loc", ""),
+                "asn": data.get("org", "").split()[0] if data.get("org") else "",
+                "isp": " ".join(data.get("org", "").split()[1:]) if data.get("org") else ""
+            }
+        except requests.RequestException as e:
+            logger.error(f"Failed to get geolocation data from ipinfo.io: {str(e)}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error processing geolocation data: {str(e)}")
+            return None
+
+    def _get_asn_data(self, ip, geo_data):
+        """Get ASN data, reusing the geolocation result before falling back to ipapi.co."""
+        if TrackingSettings.DISABLE_ASN_LOOKUP:
+            logger.debug("ASN lookup disabled by settings")
+            return {}
+
+        if geo_data.get('asn'):
+            return {'asn': geo_data['asn'], 'isp': geo_data.get('isp', '')}
+
+        cache_key = f'asn_{ip}'
+        cached_data = cache.get(cache_key)
+
+        if cached_data:
+            logger.debug(f"Using cached ASN data for {ip}")
+            return cached_data
+
+        try:
+            url = f"https://ipapi.co/{ip}/asn/"
+            logger.debug(f"Fetching ASN data from ipapi.co for {ip}")
+            response = requests.get(url, timeout=TrackingSettings.ASN_LOOKUP_TIMEOUT)
+
+            if response.status_code == 200:
+                parts = response.text.strip().split(' ')
+                asn_data = {
+                    'asn': parts[0] if parts else '',
+                    'isp': ' '.join(parts[1:]) if len(parts) > 1 else '',
+                }
+                logger.debug(f"ASN data retrieved: {asn_data}")
+                cache.set(cache_key, asn_data, 86400)
+                return asn_data
+        except Exception as e:
+            logger.error(f"Failed to get ASN data for {ip}: {str(e)}")
+
+        return {}
@@ -0,0 +1,263 @@
+import hashlib
+import logging
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.core.cache import cache
+
+from tracking.utils import ActivityType, TrackingSettings
+
+logger = logging.getLogger(__name__)
+
+RiskVerdict = namedtuple('RiskVerdict', ['flagged', 'reasons'])
+CLEAN = RiskVerdict(False, ())
+
+SNAPSHOT_KEY_PREFIX = 'risk_state_'
+# Counters copied per lock acquisition while snapshotting, so scoring never waits long
+SNAPSHOT_CHUNK = 64
+
+# Rules that count distinct members (accounts, recipients) rather than events
+DISTINCT_RULES = {'login_accounts_ip', 'recipients_user', 'transfer_senders_ip'}
+
+
+class RingCounter:
+    """Event count over a sliding window, kept in a fixed ring of time buckets."""
+    __slots__ = ('span', 'counts', 'head', 'total')
+
+    def __init__(self, window, buckets):
+        self.span = window / buckets
+        self.counts = [0] * buckets
+        self.head = 0
+        self.total = 0
+
+    def add(self, now, member=None):
+        epoch = max(self._advance(now), self.head)
+        self.counts[epoch % len(self.counts)] += 1
+        self.total += 1
+        return self.total
+
+    def value(self, now):
+        self._advance(now)
+        return self.total
+
+    def copy(self):
+        clone = RingCounter.__new__(RingCounter)
+        clone.span, clone.counts, clone.head, clone.total = self.span, list(self.counts), self.head, self.total
+        return clone
+
+    def _advance(self, now):
+        """Zero the buckets that slid out of the window. Touches at most len(counts) buckets."""
+        epoch = int(now // self.span)
+        if epoch > self.head:
+            size = len(self.counts)
+            for step in range(max(self.head + 1, epoch - size + 1), epoch + 1):
+                index = step % size
+                self.total -= self.counts[index]
+                self.counts[index] = 0
+            self.head = epoch
+        return epoch
+
+
+class RecentSet:
+    """Distinct members seen within the window, oldest first, capped at max_members."""
+    __slots__ = ('window', 'max_members', 'seen')
+
+    def __init__(self, window, max_members):
+        self.window = window
+        self.max_members = max_members
+        self.seen = OrderedDict()
+
+    def add(self, now, member=None):
+        self.seen[member] = now
+        self.seen.move_to_end(member)
+        if len(self.seen) > self.max_members:
+            self.seen.popitem(last=False)
+        return self.value(now)
+
+    def value(self, now):
+        return len(self.members(now))
+
+    def members(self, now):
+        """Members still inside the window, after dropping the ones that slid out of it."""
+        cutoff = now - self.window
+        while self.seen:
+            oldest = next(iter(self.seen.values()))
+            if oldest >= cutoff:
+                break
+            self.seen.popitem(last=False)
+        return self.seen.keys()
+
+    def copy(self):
+        clone = RecentSet.__new__(RecentSet)
+        clone.window, clone.max_members, clone.seen = self.window, self.max_members, OrderedDict(self.seen)
+        return clone
+
+
+class RiskEngine:
+    """
+    In-process sliding-window risk scoring for logins and transfers.
+
+    Each event bumps a fixed handful of per-user, per-IP and per-device counters
+    and compares them to the RISK thresholds, so scoring is O(1) per event.
+    State is an LRU of at most RISK_MAX_KEYS counters. Every RISK_SNAPSHOT_INTERVAL
+    seconds a background thread copies the counters changed since the last sync into
+    a published snapshot, a chunk at a time, and stores it in one of RISK_MAX_WORKERS
+    cache slots that expire with the worker. Peer snapshots are merged into local
+    counts so limits hold across workers: event counts are summed, distinct members
+    are unioned so a member seen by several workers counts once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = OrderedDict()
+        self._dirty = set()
+        self._published = {}
+        self._slot = None
+        self._peers = []
+        self._last_sync = 0.0
+        self._syncing = False
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    @staticmethod
+    def device_key(user_agent):
+        """Short, stable key for a client device. Only the user agent is available on every path."""
+        if not user_agent:
+            return None
+        return hashlib.sha256(user_agent.encode()).hexdigest()[:32]
+
+    def score_activity(self, activity, subject=None):
+        """Score an unsaved Activity. Only logins are scored here; transfers go through record_transfer."""
+        if activity.type != ActivityType.LOGIN:
+            return CLEAN
+
+        return self.record_login(
+            subject=subject or activity.user_id,
+            ip=activity.ip_address,
+            device=self.device_key(activity.user_agent),
+            success=activity.status is not None and activity.status < 400,
+        )
+
+    def record_login(self, subject=None, ip=None, device=None, success=True):
+        window = TrackingSettings.RISK_LOGIN_WINDOW
+        checks = [('login_accounts_ip', ip, subject, TrackingSettings.RISK_ACCOUNTS_PER_IP)]
+        if not success:
+            checks += [
+                ('failed_logins_user', subject, None, TrackingSettings.RISK_FAILED_LOGINS_PER_USER),
+                ('failed_logins_ip', ip, None, TrackingSettings.RISK_FAILED_LOGINS_PER_IP),
+                ('failed_logins_device', device, None, TrackingSettings.RISK_FAILED_LOGINS_PER_DEVICE),
+            ]
+        return self._evaluate(checks, window)
+
+    def record_transfer(self, sender, recipient, ip=None, device=None):
+        window = TrackingSettings.RISK_TRANSFER_WINDOW
+        return self._evaluate([
+            ('transfers_user', sender, None, TrackingSettings.RISK_TRANSFERS_PER_USER),
+            ('transfers_device', device, None, TrackingSettings.RISK_TRANSFERS_PER_DEVICE),
+            ('recipients_user', sender, recipient, TrackingSettings.RISK_RECIPIENTS_PER_USER),
+            ('transfer_senders_ip', ip, sender, TrackingSettings.RISK_ACCOUNTS_PER_IP),
+        ], window)
+
+    def _evaluate(self, checks, window):
+        now = time.time()
+        reasons = []
+
+        with self._lock:
+            for name, key, member, limit in checks:
+                if not key or (name in DISTINCT_RULES and member is None):
+                    continue
+                if self._bump(name, key, member, window, now) > limit:
+                    reasons.append(name)
+
+        self._maybe_sync(now)
+
+        if reasons:
+            logger.warning(f"Risk rules triggered: {', '.join(reasons)}")
+        return RiskVerdict(bool(reasons), tuple(reasons))
+
+    def _bump(self, name, key, member, window, now):
+        key = f'{name}:{key}'
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = (
+                RecentSet(window, TrackingSettings.RISK_MAX_MEMBERS) if name in DISTINCT_RULES
+                else RingCounter(window, TrackingSettings.RISK_BUCKETS)
+            )
+            self._counters[key] = counter
+            if len(self._counters) > TrackingSettings.RISK_MAX_KEYS:
+                evicted, _ = self._counters.popitem(last=False)
+                self._dirty.add(evicted)
+        else:
+            self._counters.move_to_end(key)
+        self._dirty.add(key)
+
+        value = counter.add(now, str(member) if member is not None else None)
+        peer_counters = [peer[key] for peer in self._peers if key in peer]
+        if not peer_counters:
+            return value
+
+        if name in DISTINCT_RULES:
+            members = set(counter.members(now))
+            for peer_counter in peer_counters:
+                members.update(peer_counter.members(now))
+            return len(members)
+        return value + sum(peer_counter.value(now) for peer_counter in peer_counters)
+
+    def _maybe_sync(self, now):
+        """Hand the cache round-trip to a background thread so it never lands on the request path."""
+        if self._syncing or now - self._last_sync < TrackingSettings.RISK_SNAPSHOT_INTERVAL:
+            return
+        self._syncing = True
+        self._last_sync = now
+        threading.Thread(target=self.sync, daemon=True).start()
+
+    def sync(self):
+        """Publish this worker's counters and load every other worker's snapshot."""
+        try:
+            self._snapshot()
+            ttl = TrackingSettings.RISK_SNAPSHOT_INTERVAL * 3
+            payload = (self.worker_id, self._published)
+
+            slots = [f'{SNAPSHOT_KEY_PREFIX}{n}' for n in range(TrackingSettings.RISK_MAX_WORKERS)]
+            snapshots = cache.get_many(slots)
+            owner = snapshots.get(self._slot, (None,))[0] if self._slot else None
+            if self._slot and owner in (None, self.worker_id):
+                cache.set(self._slot, payload, ttl)
+            else:
+                # add() is atomic, so two workers can never claim the same free slot
+                self._slot = next(
+                    (slot for slot in slots if slot not in snapshots and cache.add(slot, payload, ttl)), None
+                )
+                if self._slot is None:
+                    logger.warning("No free risk state slot; this worker's counters are not shared")
+
+            peers = [counters for worker, counters in snapshots.values() if worker != self.worker_id]
+            with self._lock:
+                self._peers = peers
+        except Exception as e:
+            logger.error(f"Failed to sync risk engine state: {str(e)}", exc_info=True)
+        finally:
+            self._syncing = False
+
+    def _snapshot(self):
+        """
+        Copy the counters changed since the last sync into the published snapshot.
+        The lock is taken per SNAPSHOT_CHUNK counters; serialising happens in cache.set, outside it.
+        """
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        dirty = list(dirty)
+
+        for start in range(0, len(dirty), SNAPSHOT_CHUNK):
+            with self._lock:
+                for key in dirty[start:start + SNAPSHOT_CHUNK]:
+                    counter = self._counters.get(key)
+                    if counter is None:
+                        self._published.pop(key, None)
+                    else:
+                        self._published[key] = counter.copy()
+
+
+risk_engine = RiskEngine()
@@ -0,0 +1,13 @@
+from django.db.models import Q
+
+
+def search_activities(queryset, terms):
+    """
+    Narrow an Activity queryset to rows whose search_document contains every term.
+
+    search_document is stored lower-cased, so a plain LIKE is enough; on Postgres it
+    is answered from the pg_trgm GIN index created in migration 0003.
+    """
+    for term in terms:
+        queryset = queryset.filter(search_document__contains=term.lower())
+    return queryset
@@ -0,0 +1,3 @@
+from .enrichment import enrich_pending_activities
+
+__all__ = ['enrich_pending_activities']
@@ -0,0 +1,19 @@
+import logging
+from celery import shared_task
+
+from tracking.services import ActivityEnricher
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def enrich_pending_activities(self, max_ips=None):
+    """
+    Periodic task that fills in geo, ASN, Tor and VPN details for raw activities,
+    one lookup per distinct IP.
+    """
+    try:
+        return ActivityEnricher().run(max_ips=max_ips)
+    except Exception as exc:
+        logger.error("Activity enrichment failed: %s", str(exc), exc_info=True)
+        raise self.retry(exc=exc)
@@ -1,3 +1,4 @@
 from .choices import ActivityType, ActivityStatus
+from .settings import TrackingSettings
 
-__all__ = ['ActivityType', 'ActivityStatus']
\ No newline at end of file
+__all__ = ['ActivityType', 'ActivityStatus', 'TrackingSettings']
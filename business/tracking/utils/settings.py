@@ -0,0 +1,46 @@
+from django.conf import settings
+
+
+class TrackingSettings:
+    """
+    Request-tracking configuration, read from the ACTIVITY_TRACKING settings dict.
+    """
+    _CONFIG = getattr(settings, 'ACTIVITY_TRACKING', {})
+
+    # Deferred enrichment
+    DISABLE_GEOLOCATION = _CONFIG.get('DISABLE_GEOLOCATION', False)
+    DISABLE_ASN_LOOKUP = _CONFIG.get('DISABLE_ASN_LOOKUP', False)
+    GEOLOCATION_TIMEOUT = _CONFIG.get('GEOLOCATION_TIMEOUT', 2)        # Seconds
+    ASN_LOOKUP_TIMEOUT = _CONFIG.get('ASN_LOOKUP_TIMEOUT', 2)          # Seconds
+    ENRICHMENT_BATCH_SIZE = _CONFIG.get('ENRICHMENT_BATCH_SIZE', 500)  # Distinct IPs per pass
+    ENRICHMENT_MAX_IPS = _CONFIG.get('ENRICHMENT_MAX_IPS', 5000)       # Distinct IPs per job run
+    ENRICHMENT_MAX_ATTEMPTS = _CONFIG.get('ENRICHMENT_MAX_ATTEMPTS', 5)  # Failed runs before an IP is given up on
+
+    # Risk scoring (tracking.services.risk)
+    _RISK = _CONFIG.get('RISK', {})
+    RISK_LOGIN_WINDOW = _RISK.get('LOGIN_WINDOW', 900)                 # Seconds
+    RISK_TRANSFER_WINDOW = _RISK.get('TRANSFER_WINDOW', 3600)          # Seconds
+    RISK_FAILED_LOGINS_PER_USER = _RISK.get('FAILED_LOGINS_PER_USER', 5)
+    RISK_FAILED_LOGINS_PER_IP = _RISK.get('FAILED_LOGINS_PER_IP', 20)
+    RISK_FAILED_LOGINS_PER_DEVICE = _RISK.get('FAILED_LOGINS_PER_DEVICE', 10)
+    RISK_ACCOUNTS_PER_IP = _RISK.get('ACCOUNTS_PER_IP', 10)            # Distinct accounts per IP
+    RISK_TRANSFERS_PER_USER = _RISK.get('TRANSFERS_PER_USER', 10)
+    RISK_TRANSFERS_PER_DEVICE = _RISK.get('TRANSFERS_PER_DEVICE', 20)
+    RISK_RECIPIENTS_PER_USER = _RISK.get('RECIPIENTS_PER_USER', 5)     # Distinct recipients per sender
+    RISK_BUCKETS = _RISK.get('BUCKETS', 12)                            # Ring buffer slots per window
+    RISK_MAX_MEMBERS = _RISK.get('MAX_MEMBERS', 64)                    # Cap on tracked distinct members per key
+    RISK_MAX_KEYS = _RISK.get('MAX_KEYS', 20000)                       # LRU cap on counters per process
+    RISK_SNAPSHOT_INTERVAL = _RISK.get('SNAPSHOT_INTERVAL', 30)        # Seconds
+    RISK_MAX_WORKERS = _RISK.get('MAX_WORKERS', 64)                    # Cache slots for worker snapshots
+
+    # Buffered writer
+    BUFFER_SIZE = _CONFIG.get('BUFFER_SIZE', 200)                      # Activities per bulk insert
+    BUFFER_FLUSH_INTERVAL = _CONFIG.get('BUFFER_FLUSH_INTERVAL', 5)    # Seconds
+
+    # Middleware sampling
+    DEFAULT_SAMPLE_RATE = _CONFIG.get('DEFAULT_SAMPLE_RATE', 0.1)      # 0.0 - 1.0
+    SAMPLE_RATES = _CONFIG.get('SAMPLE_RATES', {})                     # {path_prefix: rate}
+    ALWAYS_CAPTURE = tuple(_CONFIG.get('ALWAYS_CAPTURE', ()))          # Path prefixes captured on every request
+    CAPTURE_SERVER_ERRORS = _CONFIG.get('CAPTURE_SERVER_ERRORS', True)
+    ROUTE_ACTIVITY_TYPES = _CONFIG.get('ROUTE_ACTIVITY_TYPES', {})     # {path_prefix: ActivityType}
+    SENSITIVE_FIELDS = _CONFIG.get('SENSITIVE_FIELDS', ['password', 'token'])
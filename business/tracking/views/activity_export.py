@@ -1,47 +1,104 @@
 import csv
+import json
 import logging
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.decorators import action
-from rest_framework.filters import SearchFilter
-from django.http import HttpResponse
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+from django.http import StreamingHttpResponse
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 
 from tracking.models import Activity
 from tracking.serializers import ActivityListSerializer
 from tracking.views.activity_list import ActivityListView
+from tracking.views.filters import ActivitySearchFilter
 
 logger = logging.getLogger(__name__)
 
+EXPORT_CHUNK_SIZE = 2000
+
+CSV_HEADER = [
+    'ID', 'Timestamp', 'Type', 'User Email', 'IP Address',
+    'Country', 'Region', 'City', 'Coordinates',
+    'Endpoint', 'Method', 'Status', 'Duration (ms)',
+    'Device', 'OS', 'Browser', 'Is Mobile',
+    'Flagged', 'Tags', 'User Agent'
+]
+
+# Only the columns the export actually writes; headers/params are large JSON blobs.
+EXPORT_FIELDS = (
+    'id', 'timestamp', 'type', 'flagged', 'tags', 'user', 'user__email',
+    'ip_address', 'country', 'region', 'city', 'coordinates',
+    'endpoint', 'method', 'status', 'duration',
+    'device', 'os', 'browser', 'is_mobile', 'user_agent',
+)
+
+
+class Echo:
+    """File-like object whose write() hands the value back, so csv.writer can feed a generator."""
+
+    def write(self, value):
+        return value
+
+
+class StreamingPassthroughRenderer(BaseRenderer):
+    """
+    Lets `?format=csv|ndjson` pass DRF content negotiation.
+    The view streams the body itself; only error payloads ever reach render().
+    """
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, (dict, list)):
+            return json.dumps(data, cls=JSONEncoder).encode(self.charset)
+        return data
+
+
+class CSVStreamRenderer(StreamingPassthroughRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+
+class NDJSONStreamRenderer(StreamingPassthroughRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
 @extend_schema(tags=['Tracking - Export Activities'])
 class ActivityExportView(GenericViewSet):
-    queryset = Activity.objects.all()
+    queryset = Activity.objects.select_related('user').only(*EXPORT_FIELDS)
     permission_classes = [permissions.IsAdminUser]
     serializer_class = ActivityListSerializer
-    filter_backends = [SearchFilter]
+    renderer_classes = [JSONRenderer, CSVStreamRenderer, NDJSONStreamRenderer]
+    filter_backends = [ActivitySearchFilter]
     filterset_fields = ActivityListView.filterset_fields
     search_fields = ActivityListView.search_fields
 
     @extend_schema(
         operation_id='Export Activities',
-        description='Export user activities in CSV or JSON format.',
+        description=(
+            'Stream user activities as CSV, a JSON array or newline-delimited JSON. '
+            'Rows are read with a server-side cursor, so memory stays flat regardless of volume.'
+        ),
         request=None,
         parameters=[
             OpenApiParameter(
                 name='format',
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description='Export format (csv or json)',
+                description='Export format (csv, json or ndjson)',
                 default='csv'
             ),
         ],
         responses={
             200: {
-                'description': 'CSV or JSON export of activities',
+                'description': 'CSV, JSON or NDJSON export of activities',
                 'content': {
                     'text/csv': {'schema': {'type': 'string'}},
-                    'application/json': {'schema': {'type': 'object'}}
+                    'application/json': {'schema': {'type': 'array'}},
+                    'application/x-ndjson': {'schema': {'type': 'string'}},
                 }
             }
         }
@@ -51,51 +108,68 @@ class ActivityExportView(GenericViewSet):
         try:
             format = request.query_params.get('format', 'csv').lower()
             queryset = self.filter_queryset(self.get_queryset())
+            activities = queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
 
             if format == 'json':
-                serializer = self.get_serializer(queryset, many=True)
-                return Response(serializer.data)
-
-            response = HttpResponse(
-                content_type='text/csv',
-                headers={'Content-Disposition': 'attachment; filename="activities.csv"'},
-            )
-
-            writer = csv.writer(response)
-            writer.writerow([
-                'ID', 'Timestamp', 'Type', 'User Email', 'IP Address',
-                'Country', 'Region', 'City', 'Coordinates',
-                'Endpoint', 'Method', 'Status', 'Duration (ms)',
-                'Device', 'OS', 'Browser', 'Is Mobile',
-                'Flagged', 'Tags', 'User Agent'
-            ])
-
-            for activity in queryset:
-                writer.writerow([
-                    str(activity.id),
-                    activity.timestamp.isoformat(),
-                    activity.get_type_display(),
-                    activity.user.email if activity.user else '',
-                    activity.ip_address,
-                    activity.country,
-                    activity.region,
-                    activity.city,
-                    activity.coordinates,
-                    activity.endpoint,
-                    activity.method,
-                    activity.status,
-                    round(activity.duration * 1000, 2) if activity.duration else '',
-                    activity.device,
-                    activity.os,
-                    activity.browser,
-                    'Yes' if activity.is_mobile else 'No' if activity.is_mobile is not None else '',
-                    'Yes' if activity.flagged else 'No',
-                    '|'.join(activity.tags) if activity.tags else '',
-                    activity.user_agent[:200] if activity.user_agent else '',
-                ])
-
-            return response
+                return self._stream(self._json_rows(activities), 'application/json', 'activities.json')
+
+            if format == 'ndjson':
+                return self._stream(self._ndjson_rows(activities), 'application/x-ndjson', 'activities.ndjson')
+
+            return self._stream(self._csv_rows(activities), 'text/csv', 'activities.csv')
 
         except Exception as e:
             logger.error(f"Failed to export activities: {str(e)}", exc_info=True)
             return Response({'error': 'Failed to export activities'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def _stream(self, rows, content_type, filename):
+        return StreamingHttpResponse(
+            rows,
+            content_type=content_type,
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+        )
+
+    def _csv_rows(self, activities):
+        writer = csv.writer(Echo())
+        yield writer.writerow(CSV_HEADER)
+        for activity in activities:
+            yield writer.writerow(self._csv_row(activity))
+
+    def _csv_row(self, activity):
+        return [
+            str(activity.id),
+            activity.timestamp.isoformat(),
+            activity.get_type_display(),
+            activity.user.email if activity.user else '',
+            activity.ip_address,
+            activity.country,
+            activity.region,
+            activity.city,
+            activity.coordinates,
+            activity.endpoint,
+            activity.method,
+            activity.status,
+            round(activity.duration * 1000, 2) if activity.duration else '',
+            activity.device,
+            activity.os,
+            activity.browser,
+            'Yes' if activity.is_mobile else 'No' if activity.is_mobile is not None else '',
+            'Yes' if activity.flagged else 'No',
+            '|'.join(activity.tags) if activity.tags else '',
+            activity.user_agent[:200] if activity.user_agent else '',
+        ]
+
+    def _serialize(self, activity):
+        return json.dumps(self.get_serializer(activity).data, cls=JSONEncoder)
+
+    def _ndjson_rows(self, activities):
+        for activity in activities:
+            yield self._serialize(activity) + '\n'
+
+    def _json_rows(self, activities):
+        yield '['
+        separator = ''
+        for activity in activities:
+            yield separator + self._serialize(activity)
+            separator = ','
+        yield ']'
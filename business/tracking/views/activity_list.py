@@ -1,12 +1,13 @@
 import logging
 from rest_framework import permissions, status
 from rest_framework.generics import ListAPIView
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 
 from tracking.models import Activity
 from tracking.serializers import ActivityListSerializer
+from tracking.views.filters import ActivitySearchFilter
 from tracking.views.throttles import BurstRateThrottle, SustainedRateThrottle
 
 logger = logging.getLogger(__name__)
@@ -16,7 +17,7 @@ class ActivityListView(ListAPIView):
     queryset = Activity.objects.all().order_by('-timestamp')
     serializer_class = ActivityListSerializer
     permission_classes = [permissions.IsAdminUser]
-    filter_backends = [SearchFilter, OrderingFilter]
+    filter_backends = [ActivitySearchFilter, OrderingFilter]
     filterset_fields = {
         'type': ['exact', 'in'],
         'user': ['exact'],
@@ -29,6 +30,7 @@ class ActivityListView(ListAPIView):
         'is_mobile': ['exact'],
         'is_bot': ['exact'],
     }
+    # Covered by Activity.search_document; see ActivitySearchFilter
     search_fields = [
         'user__email', 'ip_address', 'endpoint', 'device',
         'browser', 'city', 'tags', 'user_agent',
@@ -0,0 +1,16 @@
+from rest_framework.filters import SearchFilter
+
+from tracking.services import search_activities
+
+
+class ActivitySearchFilter(SearchFilter):
+    """
+    Matches search terms against the indexed Activity.search_document instead of
+    OR-ing icontains lookups over search_fields. Terms are AND-ed, as with SearchFilter.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return search_activities(queryset, terms)
@@ -1,7 +1,7 @@
-from rest_framework.throttling import UserRateThrottle
+from common.throttling import UserSlidingWindowThrottle
 
-class BurstRateThrottle(UserRateThrottle):
+class BurstRateThrottle(UserSlidingWindowThrottle):
     scope = 'burst'
 
-class SustainedRateThrottle(UserRateThrottle):
+class SustainedRateThrottle(UserSlidingWindowThrottle):
     scope = 'sustained'
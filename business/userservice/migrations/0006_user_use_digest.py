@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('userservice', '0005_rename__city_customer_encrypted_city_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='use_digest',
+            field=models.BooleanField(default=False, help_text='Batch payment notifications into periodic summaries instead of one per transaction.'),
+        ),
+    ]
@@ -128,6 +128,10 @@ class User(AbstractUser, PermissionsMixin, EncryptedFieldsMixin):
         default=False,
         help_text=_("User's preference for receiving notifications via SMS or Email.")
     )
+    use_digest = models.BooleanField(
+        default=False,
+        help_text=_("Batch payment notifications into periodic summaries instead of one per transaction.")
+    )
 
     # Authentication configuration
     USERNAME_FIELD = 'email'
@@ -24,3 +24,4 @@ class ChangePasswordSerializer(serializers.Serializer):
 
 class NotificationPreferenceSerializer(serializers.Serializer):
     use_sms = serializers.BooleanField(required=True)
+    use_digest = serializers.BooleanField(required=False)
@@ -8,6 +8,7 @@ from drf_spectacular.utils import extend_schema
 
 from rbac.permissions import MethodPermission, register_permissions
 from rbac.models import Role, UserRole
+from rbac.services import RoleAssignmentService
 from userservice.models import Merchant
 from userservice.serializers import UserProfileStandardSerializer, MerchantSerializer
 
@@ -53,6 +54,8 @@ class MerchantRegistrationAPIView(APIView):
                 user_data['is_active'] = False  # Don't activate immediately
                 user = self.serializer_class_user.Meta.model.objects.create_user(**user_data)
 
+                RoleAssignmentService.assign_default_role(user)
+
                 # Assign merchant role
                 merchant_role, _ = Role.objects.get_or_create(name='merchant')
                 UserRole.objects.create(user=user, role=merchant_role)
@@ -30,6 +30,11 @@ class NotificationPreferenceView(APIView):
         if serializer.is_valid():
             user = request.user
             user.use_sms = serializer.validated_data['use_sms']
+            user.use_digest = serializer.validated_data.get('use_digest', user.use_digest)
             user.save()
-            return Response({"message": "Notification channel has been updated successfully.", "use_sms": user.use_sms})
+            return Response({
+                "message": "Notification channel has been updated successfully.",
+                "use_sms": user.use_sms,
+                "use_digest": user.use_digest,
+            })
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)